@@ -0,0 +1,41 @@
+"""
+Page text extraction run in the PDF worker processes.
+
+Kept outside app.services on purpose: workers import only this module, so they
+do not load the service package (and spaCy with it) just to read pages.
+"""
+
+from typing import List
+
+import pdfplumber
+
+try:
+    import pymupdf
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+
+
+def count_pages(file_path: str) -> int:
+    """Count the pages of a PDF"""
+    if PYMUPDF_AVAILABLE:
+        with pymupdf.open(file_path) as doc:
+            return doc.page_count
+    with pdfplumber.open(file_path) as pdf:
+        return len(pdf.pages)
+
+
+def extract_page_texts(file_path: str, page_numbers: List[int]) -> List[str]:
+    """
+    Extract the text of the given 1-indexed pages, opening a separate handle on
+    the PDF so it can run in any process.
+
+    MuPDF's C parser is used when available; pdfplumber's pure-Python layout
+    analysis is several times slower and is only the fallback.
+    """
+    if PYMUPDF_AVAILABLE:
+        with pymupdf.open(file_path) as doc:
+            # MuPDF ends each page with a newline where pdfplumber does not
+            return [doc[page_num - 1].get_text("text").rstrip("\n") for page_num in page_numbers]
+    with pdfplumber.open(file_path) as pdf:
+        return [pdf.pages[page_num - 1].extract_text() or "" for page_num in page_numbers]
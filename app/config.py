@@ -47,6 +47,9 @@ class Settings(BaseSettings):
     # PDF Processing Settings
     PDF_MAX_PAGES: int = Field(default=500, description="Maximum pages per PDF")
     PDF_EXTRACT_IMAGES: bool = Field(default=False, description="Extract images from PDFs")
+    PDF_EXTRACT_WORKERS: int = Field(
+        default=0, description="Worker processes for page text extraction (0 = CPU count)"
+    )
 
     # NLP Model Settings
     SPACY_MODEL: str = Field(default="en_core_web_sm", description="spaCy model name")
@@ -4,15 +4,33 @@ Document Integrity, Racism, Bias & Guardianship Alignment Analysis
 For QCAT Guardianship Appeal Support
 """
 
+import sys
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi_mcp import FastApiMCP
 from loguru import logger
 
 from app.config import settings
+from app.services import shutdown_extraction_pool
 from app.tools import pdf_router, analysis_router, legal_router, report_router
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Log at the configured level while serving, and release the PDF extraction
+    worker processes when the server stops
+    """
+    # Configured here rather than at import, so importing the app, e.g. from
+    # tests, leaves the caller's loguru sinks alone
+    logger.remove()
+    logger.add(sys.stderr, level=settings.LOG_LEVEL.upper())
+    yield
+    shutdown_extraction_pool()
+
+
 # Initialize FastAPI application
 app = FastAPI(
     title="Agnovat Analyst MCP Server",
@@ -20,6 +38,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs" if settings.DEBUG else None,
     redoc_url="/redoc" if settings.DEBUG else None,
+    lifespan=lifespan,
 )
 
 # CORS Configuration
@@ -6,6 +6,7 @@ from typing import Dict, List, Optional
 from pydantic import BaseModel, Field
 
 from app.models.base import FlaggedSegment, RiskScore, EvidenceItem
+from app.models.reports import TimelineExtractionResponse
 
 
 class BiasAnalysisRequest(BaseModel):
@@ -166,3 +167,28 @@ class FamilySupportEvidenceResponse(BaseModel):
     themes: FamilySupportThemes = Field(..., description="Categorized themes")
     total_instances: int = Field(..., description="Total number of instances")
     summary: str = Field(..., description="Summary of family support")
+
+
+class DocumentSuiteRequest(BaseModel):
+    """Request to run every single-document analysis tool on one document"""
+
+    file_path: str = Field(..., description="Path to PDF document")
+    client_name: Optional[str] = Field(None, description="Client name for context")
+
+
+class DocumentSuiteResponse(BaseModel):
+    """Combined results of the single-document analysis tools"""
+
+    file_path: str = Field(..., description="Analyzed document path")
+    bias: BiasAnalysisResponse = Field(..., description="Tool 5: bias and racism analysis")
+    omitted_context: OmittedContextResponse = Field(..., description="Tool 8: omitted context")
+    non_evidence_based: NonEvidenceBasedResponse = Field(
+        ..., description="Tool 9: non-evidence-based statements"
+    )
+    family_support: FamilySupportEvidenceResponse = Field(
+        ..., description="Tool 10: family support evidence"
+    )
+    pg_limitations: FamilySupportEvidenceResponse = Field(
+        ..., description="Tool 11: Public Guardian limitations"
+    )
+    timeline: TimelineExtractionResponse = Field(..., description="Tool 14: timeline of events")
@@ -52,6 +52,9 @@ class PageText(BaseModel):
     text: str = Field(..., description="Extracted text content")
     word_count: int = Field(..., description="Word count for this page")
     char_count: int = Field(..., description="Character count for this page")
+    char_start: int = Field(
+        default=0, ge=0, description="Offset of this page's text within the document's full text"
+    )
 
 
 class FlaggedSegment(BaseModel):
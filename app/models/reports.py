@@ -47,6 +47,7 @@ class ContradictionMatrixRow(BaseModel):
     version_1: str = Field(..., description="Version from document 1")
     version_2: str = Field(..., description="Version from document 2")
     conflict: str = Field(..., description="Nature of conflict")
+    severity: str = Field(..., description="Severity: low, medium, high")
     explanation: str = Field(..., description="Detailed explanation")
     source_1: str = Field(..., description="Source reference for version 1")
     source_2: str = Field(..., description="Source reference for version 2")
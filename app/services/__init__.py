@@ -8,9 +8,12 @@ from app.services.pdf_service import (
     generate_hash,
     verify_integrity,
     extract_metadata,
+    extract_documents,
+    shutdown_extraction_pool,
 )
 from app.services.nlp_service import (
     analyze_for_bias_and_racism,
+    analyze_batch_for_bias,
     BiasDetector,
 )
 from app.services.document_analysis_service import (
@@ -18,6 +21,7 @@ from app.services.document_analysis_service import (
     detect_template_reuse,
     detect_omitted_context,
     detect_non_evidence_based_statements,
+    analyze_document_suite,
 )
 from app.services.evidence_extraction_service import (
     extract_family_support_evidence,
@@ -28,12 +32,14 @@ from app.services.comparison_timeline_service import (
     analyze_and_compare_pdfs,
     extract_timeline_events,
     generate_contradiction_matrix,
+    iter_contradiction_matrix,
 )
 from app.services.legal_framework_service import (
     extract_human_rights_breaches,
     analyze_guardianship_risk,
     detect_state_guardianship_bias,
     analyze_professional_compliance,
+    analyze_all_legal,
 )
 from app.services.ndis_goals_service import (
     analyze_goals_guardianship_alignment,
@@ -49,22 +55,28 @@ __all__ = [
     "generate_hash",
     "verify_integrity",
     "extract_metadata",
+    "extract_documents",
+    "shutdown_extraction_pool",
     "analyze_for_bias_and_racism",
+    "analyze_batch_for_bias",
     "BiasDetector",
     "detect_inconsistent_statements",
     "detect_template_reuse",
     "detect_omitted_context",
     "detect_non_evidence_based_statements",
+    "analyze_document_suite",
     "extract_family_support_evidence",
     "extract_public_guardian_limitations",
     "compare_pdf_documents",
     "analyze_and_compare_pdfs",
     "extract_timeline_events",
     "generate_contradiction_matrix",
+    "iter_contradiction_matrix",
     "extract_human_rights_breaches",
     "analyze_guardianship_risk",
     "detect_state_guardianship_bias",
     "analyze_professional_compliance",
+    "analyze_all_legal",
     "analyze_goals_guardianship_alignment",
     "generate_guardianship_argument_report",
     "generate_qcat_evidence_summary",
@@ -0,0 +1,41 @@
+"""
+Per-document analysis cache shared by the report generators.
+
+Results are keyed on the analysis function, the document's file identity and
+the other request fields, so an edited or replaced document is always
+re-analyzed. Only analyses without a cache of their own are routed through
+here; bias and goals analyses memoize themselves.
+"""
+
+from typing import Any, Awaitable, Callable
+
+from pydantic import BaseModel
+
+from app.services._result_cache import ResultCache, file_key
+
+
+_CACHE_SIZE = 256
+_cache: "ResultCache[Any]" = ResultCache(_CACHE_SIZE)
+
+
+async def cached_call(fn: Callable[[BaseModel], Awaitable[Any]], request: BaseModel) -> Any:
+    """
+    Await fn(request), reusing an earlier result for the same unmodified document.
+
+    request must have a file_path field; its other fields are part of the key.
+    Calls whose document cannot be stat'ed are passed straight through, and
+    exceptions are never cached.
+    """
+    try:
+        document = file_key(request.file_path)
+    except (OSError, TypeError, ValueError):
+        return await fn(request)
+
+    key = (fn.__name__, request.file_path, document, request.model_dump_json(exclude={"file_path"}))
+    result = _cache.get(key)
+    if result is not None:
+        return result
+
+    result = await fn(request)
+    _cache.put(key, result)
+    return result
@@ -0,0 +1,19 @@
+"""
+Text checks shared by the services that hand documents to re2
+"""
+
+import re
+
+
+# ASCII whitespace matched by Python's \s but not by re2's
+RE2_UNMATCHED_SPACE = re.compile(r"[\x0b\x1c-\x1f]")
+
+
+def re2_compatible(text: str) -> bool:
+    """
+    Whether re2 matches text exactly as stdlib re would.
+
+    The text must be ASCII, so byte offsets equal character offsets, and free of
+    the whitespace characters only stdlib re's \\s accepts.
+    """
+    return text.isascii() and RE2_UNMATCHED_SPACE.search(text) is None
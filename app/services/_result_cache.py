@@ -0,0 +1,78 @@
+"""
+In-process result caches shared by the services.
+
+Every cache is a bounded, thread-safe LRU. Values are copied on the way in and
+on the way out, so a caller mutating a response (pydantic models hold plain
+lists and dicts) never alters what later callers receive.
+
+Documents are identified by file_key(), a single os.stat: the resolved path,
+device and inode, size, and modification and change times. The change time is
+updated by every write and cannot be set back the way mtime can (cp -p, unzip),
+so a replaced file never matches an earlier entry. Nothing is persisted.
+"""
+
+import copy
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Generic, Hashable, Optional, Tuple, TypeVar
+
+from pydantic import BaseModel
+
+
+V = TypeVar("V")
+
+
+def file_key(file_path: str) -> Tuple:
+    """Identity of a file's current contents; raises FileNotFoundError if it is missing"""
+    stat = os.stat(file_path)
+    return (
+        os.path.realpath(file_path),
+        stat.st_dev,
+        stat.st_ino,
+        stat.st_size,
+        stat.st_mtime_ns,
+        stat.st_ctime_ns,
+    )
+
+
+def _copy(value: Any) -> Any:
+    """An independent copy of a cached value"""
+    if isinstance(value, BaseModel):
+        return value.model_copy(deep=True)
+    return copy.deepcopy(value)
+
+
+class ResultCache(Generic[V]):
+    """Bounded LRU of results, handing out copies"""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, V]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """A copy of the value stored under key, or None"""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                return None
+            self._entries.move_to_end(key)
+        return _copy(value)
+
+    def put(self, key: Hashable, value: V) -> None:
+        """Store a copy of value under key, evicting the least recently used entry"""
+        value = _copy(value)
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
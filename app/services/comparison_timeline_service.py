@@ -5,7 +5,7 @@ Tools 12-15: Document Comparison, Timeline Extraction, Contradiction Matrix
 
 import re
 from datetime import datetime
-from typing import List, Dict, Tuple, Optional
+from typing import AsyncIterator, List, Dict, Tuple, Optional
 from difflib import SequenceMatcher
 from loguru import logger
 
@@ -20,12 +20,31 @@ from app.models.reports import (
     ContradictionMatrixResponse,
     ContradictionMatrixRow,
 )
-from app.services.pdf_service import extract_text_from_pdf
+from app.services.pdf_service import extract_text_from_pdf, extract_documents
 from app.services.nlp_service import analyze_for_bias_and_racism
 from app.models.pdf import PDFExtractionRequest
 from app.models.analysis import BiasAnalysisRequest
 
 
+# Opposing behavioral characterizations checked by the contradiction matrix,
+# compiled once at import
+_BEHAVIOR_PAIRS = tuple(
+    (
+        positive,
+        negative,
+        re.compile(rf'\b{positive}\b', re.IGNORECASE),
+        re.compile(rf'\b{negative}\b', re.IGNORECASE),
+    )
+    for positive, negative in (
+        ("cooperative", "uncooperative"),
+        ("aggressive", "calm"),
+        ("compliant", "non-compliant"),
+        ("stable", "unstable"),
+        ("capable", "incapable"),
+    )
+)
+
+
 # ============================================================================
 # TOOL 12: DOCUMENT COMPARISON
 # ============================================================================
@@ -431,6 +450,44 @@ async def extract_timeline_events(request: TimelineExtractionRequest) -> Timelin
 # TOOL 15: CONTRADICTION MATRIX
 # ============================================================================
 
+async def iter_contradiction_matrix(documents: List[str]) -> AsyncIterator[ContradictionMatrixRow]:
+    """
+    Yield contradiction-matrix rows as each one is found, for callers that
+    stream the table rather than building the whole response
+    """
+    # Extract text from all documents
+    documents_data = [
+        {
+            'path': doc_path,
+            'text': pdf_result.full_text
+        }
+        for doc_path, pdf_result in zip(documents, await extract_documents(documents))
+    ]
+
+    if len(documents_data) >= 2:
+        doc1 = documents_data[0]
+        doc2 = documents_data[1]
+
+        # Find contradictions in behavioral assessments
+        for positive, negative, positive_re, negative_re in _BEHAVIOR_PAIRS:
+            has_pos_1 = bool(positive_re.search(doc1['text']))
+            has_neg_1 = bool(negative_re.search(doc1['text']))
+            has_pos_2 = bool(positive_re.search(doc2['text']))
+            has_neg_2 = bool(negative_re.search(doc2['text']))
+
+            if (has_pos_1 and has_neg_2) or (has_neg_1 and has_pos_2):
+                yield ContradictionMatrixRow(
+                    topic=f"Behavioral assessment: {positive}/{negative}",
+                    version_1=f"Described as {positive if has_pos_1 else negative}",
+                    version_2=f"Described as {positive if has_pos_2 else negative}",
+                    conflict="Contradictory behavioral characterization",
+                    severity="medium",
+                    explanation=f"Document 1 characterizes client as {positive if has_pos_1 else negative}, while Document 2 characterizes as {positive if has_pos_2 else negative}",
+                    source_1=doc1['path'],
+                    source_2=doc2['path']
+                )
+
+
 async def generate_contradiction_matrix(request: ContradictionMatrixRequest) -> ContradictionMatrixResponse:
     """
     Tool 15: Create structured contradictions table
@@ -438,47 +495,7 @@ async def generate_contradiction_matrix(request: ContradictionMatrixRequest) ->
     try:
         logger.info(f"Generating contradiction matrix for {len(request.documents)} documents")
 
-        # Extract text from all documents
-        documents_data = []
-        for doc_path in request.documents:
-            pdf_request = PDFExtractionRequest(file_path=doc_path, extract_metadata=False)
-            pdf_result = await extract_text_from_pdf(pdf_request)
-            documents_data.append({
-                'path': doc_path,
-                'text': pdf_result.full_text
-            })
-
-        matrix = []
-
-        if len(documents_data) >= 2:
-            doc1 = documents_data[0]
-            doc2 = documents_data[1]
-
-            # Find contradictions in behavioral assessments
-            behaviors = [
-                ("cooperative", "uncooperative"),
-                ("aggressive", "calm"),
-                ("compliant", "non-compliant"),
-                ("stable", "unstable"),
-                ("capable", "incapable"),
-            ]
-
-            for positive, negative in behaviors:
-                has_pos_1 = bool(re.search(rf'\b{positive}\b', doc1['text'], re.IGNORECASE))
-                has_neg_1 = bool(re.search(rf'\b{negative}\b', doc1['text'], re.IGNORECASE))
-                has_pos_2 = bool(re.search(rf'\b{positive}\b', doc2['text'], re.IGNORECASE))
-                has_neg_2 = bool(re.search(rf'\b{negative}\b', doc2['text'], re.IGNORECASE))
-
-                if (has_pos_1 and has_neg_2) or (has_neg_1 and has_pos_2):
-                    matrix.append(ContradictionMatrixRow(
-                        topic=f"Behavioral assessment: {positive}/{negative}",
-                        version_1=f"Described as {positive if has_pos_1 else negative}",
-                        version_2=f"Described as {positive if has_pos_2 else negative}",
-                        conflict="Contradictory behavioral characterization",
-                        explanation=f"Document 1 characterizes client as {positive if has_pos_1 else negative}, while Document 2 characterizes as {positive if has_pos_2 else negative}",
-                        source_1=doc1['path'],
-                        source_2=doc2['path']
-                    ))
+        matrix = [row async for row in iter_contradiction_matrix(request.documents)]
 
         summary = f"Generated contradiction matrix with {len(matrix)} rows comparing {len(request.documents)} documents."
 
@@ -3,8 +3,9 @@ Document Analysis Service
 Tools 6-9: Inconsistencies, Template Reuse, Omitted Context, Non-Evidence Statements
 """
 
+import asyncio
 import re
-from typing import List, Dict, Set, Tuple
+from typing import List, Dict, Optional, Set, Tuple
 from datetime import datetime
 from difflib import SequenceMatcher
 from collections import defaultdict
@@ -30,8 +31,19 @@ from app.models.analysis import (
     NonEvidenceBasedRequest,
     NonEvidenceBasedResponse,
     UnsupportedClaim,
+    BiasAnalysisRequest,
+    FamilySupportEvidenceRequest,
+    DocumentSuiteRequest,
+    DocumentSuiteResponse,
 )
-from app.services.pdf_service import extract_text_from_pdf
+from app.models.reports import TimelineExtractionRequest
+from app.services.pdf_service import extract_text_from_pdf, extract_documents
+from app.services.nlp_service import analyze_for_bias_and_racism
+from app.services.evidence_extraction_service import (
+    extract_family_support_evidence,
+    extract_public_guardian_limitations,
+)
+from app.services.comparison_timeline_service import extract_timeline_events
 from app.models.pdf import PDFExtractionRequest
 from app.config import settings
 
@@ -40,6 +52,40 @@ from app.config import settings
 # TOOL 6: INCONSISTENCY DETECTION
 # ============================================================================
 
+# Behavioral descriptors that should be consistent
+_BEHAVIORS = (
+    "aggressive", "calm", "cooperative", "uncooperative", "violent",
+    "peaceful", "compliant", "non-compliant", "stable", "unstable",
+    "capable", "incapable", "independent", "dependent"
+)
+
+# (behavior, positive pattern, negated pattern), compiled once at import. The
+# negations are one alternation, so each document is scanned once per behavior
+# rather than once per negation form.
+_BEHAVIOR_PATTERNS = tuple(
+    (
+        behavior,
+        re.compile(rf'\b{behavior}\b', re.IGNORECASE),
+        re.compile(
+            rf'\b(?:not {behavior}|never {behavior}|rarely {behavior}|un{behavior}|non-{behavior})\b',
+            re.IGNORECASE,
+        ),
+    )
+    for behavior in _BEHAVIORS
+)
+
+
+_BehaviorFlags = Tuple[Tuple[bool, bool], ...]
+
+
+def _behavior_flags(text: str) -> _BehaviorFlags:
+    """(describes as, describes as not) for each behavior in _BEHAVIOR_PATTERNS"""
+    return tuple(
+        (bool(positive.search(text)), bool(negative.search(text)))
+        for _, positive, negative in _BEHAVIOR_PATTERNS
+    )
+
+
 class InconsistencyDetector:
     """Detects contradictions and inconsistencies across documents"""
 
@@ -64,33 +110,28 @@ class InconsistencyDetector:
         return dates_found
 
     @staticmethod
-    def compare_descriptions(doc1_text: str, doc2_text: str) -> List[ContradictionItem]:
-        """Compare behavioral descriptions between documents"""
+    def compare_descriptions(
+        doc1_text: str,
+        doc2_text: str,
+        doc1_flags: Optional[_BehaviorFlags] = None,
+        doc2_flags: Optional[_BehaviorFlags] = None,
+    ) -> List[ContradictionItem]:
+        """
+        Compare behavioral descriptions between documents. Callers comparing many
+        pairs pass each document's precomputed _behavior_flags so no text is
+        rescanned per pair.
+        """
         contradictions = []
 
-        # Behavioral descriptors that should be consistent
-        behaviors = [
-            "aggressive", "calm", "cooperative", "uncooperative", "violent",
-            "peaceful", "compliant", "non-compliant", "stable", "unstable",
-            "capable", "incapable", "independent", "dependent"
-        ]
+        if doc1_flags is None:
+            doc1_flags = _behavior_flags(doc1_text)
+        if doc2_flags is None:
+            doc2_flags = _behavior_flags(doc2_text)
 
-        for behavior in behaviors:
+        for behavior, doc1_behavior, doc2_behavior in zip(_BEHAVIORS, doc1_flags, doc2_flags):
             # Look for contradictory statements
-            positive = f"{behavior}"
-            negative_patterns = [
-                f"not {behavior}",
-                f"never {behavior}",
-                f"rarely {behavior}",
-                f"un{behavior}",
-                f"non-{behavior}",
-            ]
-
-            doc1_has_positive = bool(re.search(rf'\b{positive}\b', doc1_text, re.IGNORECASE))
-            doc2_has_positive = bool(re.search(rf'\b{positive}\b', doc2_text, re.IGNORECASE))
-
-            doc1_has_negative = any(re.search(rf'\b{neg}\b', doc1_text, re.IGNORECASE) for neg in negative_patterns)
-            doc2_has_negative = any(re.search(rf'\b{neg}\b', doc2_text, re.IGNORECASE) for neg in negative_patterns)
+            doc1_has_positive, doc1_has_negative = doc1_behavior
+            doc2_has_positive, doc2_has_negative = doc2_behavior
 
             if doc1_has_positive and doc2_has_negative:
                 contradictions.append(ContradictionItem(
@@ -124,15 +165,24 @@ async def detect_inconsistent_statements(request: InconsistencyRequest) -> Incon
         logger.info(f"Analyzing {len(request.documents)} documents for inconsistencies")
 
         # Extract text from all documents
-        documents_text = []
-        for doc_path in request.documents:
-            pdf_request = PDFExtractionRequest(file_path=doc_path, extract_metadata=False)
-            pdf_result = await extract_text_from_pdf(pdf_request)
-            documents_text.append({
+        documents_text = [
+            {
                 'path': doc_path,
                 'text': pdf_result.full_text,
                 'pages': pdf_result.pages
-            })
+            }
+            for doc_path, pdf_result in zip(
+                request.documents, await extract_documents(request.documents)
+            )
+        ]
+
+        # Scan each distinct text once, before the pair loop; template-heavy sets
+        # often contain identical texts
+        flags_by_text: Dict[str, _BehaviorFlags] = {}
+        for doc in documents_text:
+            if doc['text'] not in flags_by_text:
+                flags_by_text[doc['text']] = _behavior_flags(doc['text'])
+        flags = [flags_by_text[doc['text']] for doc in documents_text]
 
         contradictions = []
 
@@ -142,13 +192,9 @@ async def detect_inconsistent_statements(request: InconsistencyRequest) -> Incon
                 doc1 = documents_text[i]
                 doc2 = documents_text[j]
 
-                # Check for date inconsistencies
-                dates1 = InconsistencyDetector.extract_dates(doc1['text'])
-                dates2 = InconsistencyDetector.extract_dates(doc2['text'])
-
                 # Check for behavioral contradictions
                 behavior_contradictions = InconsistencyDetector.compare_descriptions(
-                    doc1['text'], doc2['text']
+                    doc1['text'], doc2['text'], flags[i], flags[j]
                 )
                 contradictions.extend(behavior_contradictions)
 
@@ -178,6 +224,30 @@ async def detect_inconsistent_statements(request: InconsistencyRequest) -> Incon
 # TOOL 7: TEMPLATE REUSE DETECTION
 # ============================================================================
 
+# Matching blocks shorter than this are not reported
+_MIN_BLOCK_SIZE = 100
+
+# Shingle length and stride used to rule out document pairs before running
+# SequenceMatcher; at most (_MIN_BLOCK_SIZE + 2) / 2 so any reportable block
+# contains a whole shingle
+_SHINGLE_SIZE = 50
+
+
+def _may_share_block(text1: str, text2: str) -> bool:
+    """
+    Whether the texts can share a block longer than _MIN_BLOCK_SIZE characters.
+
+    Any such block contains one of text1's shingles taken at a stride of
+    _SHINGLE_SIZE, so a pair sharing none of them has no reportable blocks.
+    Each check is a C substring search, far cheaper than SequenceMatcher's
+    quadratic pass over dissimilar documents.
+    """
+    return any(
+        text1[i:i + _SHINGLE_SIZE] in text2
+        for i in range(0, len(text1) - _SHINGLE_SIZE + 1, _SHINGLE_SIZE)
+    )
+
+
 async def detect_template_reuse(request: TemplateReuseRequest) -> TemplateReuseResponse:
     """
     Tool 7: Detect copy-paste text used across multiple reports
@@ -186,15 +256,16 @@ async def detect_template_reuse(request: TemplateReuseRequest) -> TemplateReuseR
         logger.info(f"Analyzing {len(request.documents)} documents for template reuse")
 
         # Extract text from all documents
-        documents_text = []
-        for doc_path in request.documents:
-            pdf_request = PDFExtractionRequest(file_path=doc_path, extract_metadata=False)
-            pdf_result = await extract_text_from_pdf(pdf_request)
-            documents_text.append({
+        documents_text = [
+            {
                 'path': doc_path,
                 'text': pdf_result.full_text,
                 'pages': pdf_result.pages
-            })
+            }
+            for doc_path, pdf_result in zip(
+                request.documents, await extract_documents(request.documents)
+            )
+        ]
 
         matching_blocks = []
 
@@ -204,11 +275,14 @@ async def detect_template_reuse(request: TemplateReuseRequest) -> TemplateReuseR
                 doc1 = documents_text[i]
                 doc2 = documents_text[j]
 
+                if not _may_share_block(doc1['text'], doc2['text']):
+                    continue
+
                 # Use sequence matcher to find matching blocks
                 matcher = SequenceMatcher(None, doc1['text'], doc2['text'])
 
                 for match in matcher.get_matching_blocks():
-                    if match.size > 100:  # Only significant blocks
+                    if match.size > _MIN_BLOCK_SIZE:  # Only significant blocks
                         matching_text = doc1['text'][match.a:match.a + match.size]
 
                         # Skip if it's just whitespace or common phrases
@@ -504,3 +578,38 @@ async def detect_non_evidence_based_statements(request: NonEvidenceBasedRequest)
     except Exception as e:
         logger.error(f"Error detecting non-evidence-based statements: {str(e)}")
         raise
+
+
+# ============================================================================
+# ALL SINGLE-DOCUMENT TOOLS
+# ============================================================================
+
+async def analyze_document_suite(request: DocumentSuiteRequest) -> DocumentSuiteResponse:
+    """
+    Run Tools 5, 8, 9, 10, 11 and 14 against a single document.
+
+    The analyzers run concurrently and share one PDF extraction through the
+    page-text cache in pdf_service, instead of each tool re-parsing the file.
+    """
+    file_path = request.file_path
+
+    bias, omitted, non_evidence, family, pg_limitations, timeline = await asyncio.gather(
+        analyze_for_bias_and_racism(
+            BiasAnalysisRequest(file_path=file_path, client_name=request.client_name)
+        ),
+        detect_omitted_context(OmittedContextRequest(file_path=file_path)),
+        detect_non_evidence_based_statements(NonEvidenceBasedRequest(file_path=file_path)),
+        extract_family_support_evidence(FamilySupportEvidenceRequest(file_path=file_path)),
+        extract_public_guardian_limitations(FamilySupportEvidenceRequest(file_path=file_path)),
+        extract_timeline_events(TimelineExtractionRequest(file_path=file_path)),
+    )
+
+    return DocumentSuiteResponse(
+        file_path=file_path,
+        bias=bias,
+        omitted_context=omitted,
+        non_evidence_based=non_evidence,
+        family_support=family,
+        pg_limitations=pg_limitations,
+        timeline=timeline,
+    )
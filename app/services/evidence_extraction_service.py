@@ -4,10 +4,11 @@ Tools 10-11: Family Support Evidence & Public Guardian Limitations
 """
 
 import re
+from bisect import bisect_right
 from typing import List, Dict
 from loguru import logger
 
-from app.models.base import EvidenceItem
+from app.models.base import EvidenceItem, PageText
 from app.models.analysis import (
     FamilySupportEvidenceRequest,
     FamilySupportEvidenceResponse,
@@ -17,6 +18,13 @@ from app.services.pdf_service import extract_text_from_pdf
 from app.models.pdf import PDFExtractionRequest
 
 
+def _page_number_at(pages: List[PageText], page_starts: List[int], offset: int) -> int:
+    """Page containing an offset into the document's full text, or 0 without pages"""
+    if not pages:
+        return 0
+    return pages[bisect_right(page_starts, offset) - 1].page_number
+
+
 # ============================================================================
 # TOOL 10: FAMILY SUPPORT EVIDENCE EXTRACTION
 # ============================================================================
@@ -85,6 +93,7 @@ class FamilyEvidenceExtractor:
     def extract_by_theme(cls, text: str, patterns: List[str], theme: str, pages: List) -> List[EvidenceItem]:
         """Extract evidence items for a specific theme"""
         evidence_items = []
+        page_starts = [page.char_start for page in pages]
 
         for pattern in patterns:
             for match in re.finditer(pattern, text, re.IGNORECASE):
@@ -94,11 +103,7 @@ class FamilyEvidenceExtractor:
                 context = text[start:end].strip()
 
                 # Find page number
-                page_num = 0
-                for page in pages:
-                    if match.group().lower() in page.text.lower():
-                        page_num = page.page_number
-                        break
+                page_num = _page_number_at(pages, page_starts, match.start())
 
                 # Calculate relevance score based on specificity
                 specificity_indicators = [
@@ -276,6 +281,7 @@ class PublicGuardianLimitationsExtractor:
     def extract_limitations(cls, text: str, patterns: List[str], category: str, pages: List) -> List[EvidenceItem]:
         """Extract Public Guardian limitation evidence"""
         evidence_items = []
+        page_starts = [page.char_start for page in pages]
 
         for pattern in patterns:
             for match in re.finditer(pattern, text, re.IGNORECASE):
@@ -285,11 +291,7 @@ class PublicGuardianLimitationsExtractor:
                 context = text[start:end].strip()
 
                 # Find page number
-                page_num = 0
-                for page in pages:
-                    if match.group().lower() in page.text.lower():
-                        page_num = page.page_number
-                        break
+                page_num = _page_number_at(pages, page_starts, match.start())
 
                 # Higher relevance for specific examples
                 relevance_score = 0.7
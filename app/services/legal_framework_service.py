@@ -3,10 +3,30 @@ Legal Framework Analysis Service
 Tools 16-19: Human rights breaches, guardianship risk assessment, state bias, professional compliance
 """
 
-from typing import List, Dict, Optional
+from typing import Iterable, List, Dict, Mapping, Optional, Tuple
+import asyncio
+import bisect
+import hashlib
+import os
 import re
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
 from datetime import datetime
 
+from loguru import logger
+from pydantic import BaseModel
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    logger.warning("re2 not available, scanning every legal framework pattern with stdlib re")
+    RE2_AVAILABLE = False
+
+from app.services._re2_text import re2_compatible
+from app.services._result_cache import ResultCache
 from app.models.legal import (
     HumanRightsBreachRequest,
     HumanRightsBreachResponse,
@@ -19,9 +39,103 @@ from app.models.legal import (
     ProfessionalComplianceRequest,
     ProfessionalComplianceResponse,
 )
+from app.models.base import PageText
+from app.models.pdf import PDFExtractionRequest
 from app.services.pdf_service import extract_text_from_pdf
 
 
+# Pattern scans are pure CPU work; run them off the event loop on a shared pool
+_ANALYSIS_EXECUTOR = ThreadPoolExecutor(
+    max_workers=os.cpu_count(), thread_name_prefix="legal-analysis"
+)
+
+# Legal basis for each Human Rights Act 2019 (Qld) rights category
+_LEGAL_BASES = {
+    "privacy_and_reputation": "Human Rights Act 2019 (Qld) s.25 - Every person has the right to privacy and reputation",
+    "protection_of_families_and_children": "Human Rights Act 2019 (Qld) s.26 - Families are entitled to protection",
+    "cultural_rights": "Human Rights Act 2019 (Qld) s.28 - Aboriginal and Torres Strait Islander peoples hold distinct cultural rights",
+    "freedom_of_expression": "Human Rights Act 2019 (Qld) s.21 - Every person has the right to freedom of expression",
+    "freedom_of_movement": "Human Rights Act 2019 (Qld) s.19 - Every person has the right to freedom of movement",
+    "right_to_liberty": "Human Rights Act 2019 (Qld) s.29 - Every person has the right to liberty and security",
+}
+
+
+def _resolve_category_meta(category: str, config: Dict) -> Tuple[str, str, str, str]:
+    """Resolve (display name, section, legal basis, severity) for a rights category"""
+    return (
+        category.replace("_", " ").title(),
+        config["section"],
+        _LEGAL_BASES.get(category, "Human Rights Act 2019 (Qld)"),
+        "high" if config["weight"] >= 0.9 else "medium",
+    )
+
+
+def _compile_re2_set(sources: List[str]):
+    """
+    Build a case-insensitive re2 set over the patterns, reporting in one pass over
+    the text which of them have at least one hit. Returns None when re2 is
+    unavailable or rejects a pattern.
+    """
+    if not RE2_AVAILABLE:
+        return None
+
+    options = re2.Options()
+    options.case_sensitive = False
+    pattern_set = re2.Set.SearchSet(options)
+    try:
+        for pattern_id, source in enumerate(sources):
+            if pattern_set.Add(source) != pattern_id:
+                return None
+    except re2.error:
+        logger.warning("re2 rejected a legal framework pattern, scanning every pattern with re")
+        return None
+    pattern_set.Compile()
+    return pattern_set
+
+
+class _PatternSet:
+    """
+    An analyzer's pattern groups compiled once, in scan order, with an re2 set
+    over every pattern. Most patterns never match a given report, so one re2 pass
+    finds the few that do and only those are walked with re for their matches.
+    """
+
+    def __init__(self, groups: Iterable[List[str]]):
+        self.groups: Tuple[Tuple[re.Pattern, ...], ...] = tuple(
+            tuple(re.compile(source, re.IGNORECASE) for source in sources) for sources in groups
+        )
+        self._re2_set = _compile_re2_set(
+            [pattern.pattern for group in self.groups for pattern in group]
+        )
+
+    def matching(self, text: str) -> Tuple[Tuple[re.Pattern, ...], ...]:
+        """Each group's patterns that have at least one match in text, in scan order"""
+        # re2 agrees with re on ASCII text apart from a few rare whitespace controls
+        if self._re2_set is None or not re2_compatible(text):
+            return self.groups
+
+        hits = frozenset(self._re2_set.Match(text) or ())
+        pattern_ids = count()
+        return tuple(
+            tuple(pattern for pattern in group if next(pattern_ids) in hits)
+            for group in self.groups
+        )
+
+
+async def _run_analysis(func, *args):
+    """Run a synchronous analyzer core on the shared analysis executor"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_ANALYSIS_EXECUTOR, func, *args)
+
+
+async def _extract_document(file_path: str) -> Tuple[str, List[PageText]]:
+    """Extract full text and per-page text from a PDF document"""
+    extraction_result = await extract_text_from_pdf(
+        PDFExtractionRequest(file_path=file_path, extract_metadata=False)
+    )
+    return extraction_result.full_text, extraction_result.pages
+
+
 class HumanRightsAnalyzer:
     """
     Analyzes documents for human rights breaches under:
@@ -106,40 +220,55 @@ class HumanRightsAnalyzer:
         },
     }
 
+    # Per-category constants, indexed in RIGHTS_PATTERNS order
+    CATEGORY_META: Tuple[Tuple[str, str, str, str], ...] = tuple(
+        _resolve_category_meta(category, config) for category, config in RIGHTS_PATTERNS.items()
+    )
+
+    PATTERN_SET = _PatternSet(config["patterns"] for config in RIGHTS_PATTERNS.values())
+
     @classmethod
     async def analyze_human_rights_breaches(
         cls, request: HumanRightsBreachRequest
     ) -> HumanRightsBreachResponse:
         """Analyze document for human rights breaches"""
+        full_text, pages = await _extract_document(request.file_path)
+        return await _run_analysis(cls._analyze_text, full_text, pages)
 
-        # Extract text
-        extraction_result = await extract_text_from_pdf({"file_path": request.file_path})
-        full_text = extraction_result["full_text"]
-
+    @classmethod
+    def _analyze_text(cls, full_text: str, pages: List[PageText]) -> HumanRightsBreachResponse:
+        """Analyze extracted document text for human rights breaches"""
         breaches: List[HumanRightsBreach] = []
+        text_len = len(full_text)
+        page_starts = [page.char_start for page in pages]
 
         # Analyze each rights category
-        for category, config in cls.RIGHTS_PATTERNS.items():
-            for pattern in config["patterns"]:
-                matches = re.finditer(pattern, full_text, re.IGNORECASE)
+        for cat_idx, patterns in enumerate(cls.PATTERN_SET.matching(full_text)):
+            pretty, section, basis, severity = cls.CATEGORY_META[cat_idx]
+
+            for pattern in patterns:
+                matches = pattern.finditer(full_text)
 
                 for match in matches:
+                    match_start, match_end = match.span()
+
                     # Extract context
-                    start = max(0, match.start() - 150)
-                    end = min(len(full_text), match.end() + 150)
+                    start = max(0, match_start - 150)
+                    end = min(text_len, match_end + 150)
                     context = full_text[start:end].strip()
 
                     # Find page number
-                    page = cls._find_page_number(full_text, match.start(), extraction_result.get("pages", []))
+                    page = cls._find_page_number(page_starts, match_start, pages)
 
-                    breach = HumanRightsBreach(
-                        right_category=category.replace("_", " ").title(),
-                        legislation_section=config["section"],
+                    # Fields come from trusted internal state, so skip validation
+                    breach = HumanRightsBreach.model_construct(
+                        right_category=pretty,
+                        legislation_section=section,
                         breach_description=match.group(0),
                         context=context,
-                        severity="high" if config["weight"] >= 0.9 else "medium",
+                        severity=severity,
                         page_number=page,
-                        legal_basis=cls._get_legal_basis(category),
+                        legal_basis=basis,
                     )
                     breaches.append(breach)
 
@@ -159,32 +288,14 @@ class HumanRightsAnalyzer:
         )
 
     @staticmethod
-    def _find_page_number(full_text: str, position: int, pages: List[Dict]) -> Optional[int]:
-        """Find page number for a text position"""
+    def _find_page_number(
+        page_starts: List[int], position: int, pages: List[PageText]
+    ) -> Optional[int]:
+        """Find page number for a text position using the pages' start offsets"""
         if not pages:
             return None
 
-        char_count = 0
-        for page in pages:
-            page_text = page.get("text", "")
-            char_count += len(page_text)
-            if char_count >= position:
-                return page.get("page_number", 1)
-
-        return len(pages)
-
-    @staticmethod
-    def _get_legal_basis(category: str) -> str:
-        """Get legal basis for each rights category"""
-        legal_bases = {
-            "privacy_and_reputation": "Human Rights Act 2019 (Qld) s.25 - Every person has the right to privacy and reputation",
-            "protection_of_families_and_children": "Human Rights Act 2019 (Qld) s.26 - Families are entitled to protection",
-            "cultural_rights": "Human Rights Act 2019 (Qld) s.28 - Aboriginal and Torres Strait Islander peoples hold distinct cultural rights",
-            "freedom_of_expression": "Human Rights Act 2019 (Qld) s.21 - Every person has the right to freedom of expression",
-            "freedom_of_movement": "Human Rights Act 2019 (Qld) s.19 - Every person has the right to freedom of movement",
-            "right_to_liberty": "Human Rights Act 2019 (Qld) s.29 - Every person has the right to liberty and security",
-        }
-        return legal_bases.get(category, "Human Rights Act 2019 (Qld)")
+        return pages[bisect.bisect_right(page_starts, position) - 1].page_number
 
     @staticmethod
     def _generate_breach_narrative(breaches: List[HumanRightsBreach], risk_score: float) -> str:
@@ -312,23 +423,16 @@ class GuardianshipRiskAnalyzer:
         cls, request: GuardianshipRiskRequest
     ) -> GuardianshipRiskResponse:
         """Analyze guardianship risk assessment quality"""
+        full_text, _ = await _extract_document(request.file_path)
+        return await _run_analysis(cls._analyze_text, full_text)
 
-        # Extract text
-        extraction_result = await extract_text_from_pdf({"file_path": request.file_path})
-        full_text = extraction_result["full_text"]
-
-        assessment = GuardianshipRiskAssessment(
-            restrictiveness_score=0.0,
-            will_preferences_score=0.0,
-            family_involvement_score=0.0,
-            cultural_considerations_score=0.0,
-            evidence_quality_score=0.0,
-            overall_compliance_score=0.0,
-            risk_factors=[],
-            protective_factors=[],
-            compliance_issues=[],
-            recommendations=[],
-        )
+    @classmethod
+    def _analyze_text(cls, full_text: str) -> GuardianshipRiskResponse:
+        """Analyze extracted document text for guardianship risk assessment quality"""
+        scores: Dict[str, float] = {}
+        risk_factors: List[str] = []
+        protective_factors: List[str] = []
+        compliance_issues: List[str] = []
 
         # Analyze each risk factor
         for factor_name, factor_config in cls.RISK_FACTORS.items():
@@ -351,37 +455,38 @@ class GuardianshipRiskAnalyzer:
             else:
                 score = (positive_count / (positive_count + negative_count)) * 10
 
-            # Set score
-            score_field = f"{factor_name}_score"
-            setattr(assessment, score_field, round(score, 1))
+            scores[factor_name] = round(score, 1)
 
             # Add to protective or risk factors
             if score >= 6.0:
-                assessment.protective_factors.append(
+                protective_factors.append(
                     f"{factor_config['description']}: {positive_count} positive indicators found"
                 )
             else:
-                assessment.risk_factors.append(
+                risk_factors.append(
                     f"{factor_config['description']}: {negative_count} concerning indicators found"
                 )
 
             # Add compliance issues if score is low
             if score < 5.0:
-                assessment.compliance_issues.append(
+                compliance_issues.append(
                     f"Low compliance with {factor_name.replace('_', ' ')}: Score {score:.1f}/10"
                 )
 
         # Calculate overall compliance
-        assessment.overall_compliance_score = round(
-            (
-                assessment.restrictiveness_score
-                + assessment.will_preferences_score
-                + assessment.family_involvement_score
-                + assessment.cultural_considerations_score
-                + assessment.evidence_quality_score
-            )
-            / 5,
-            1,
+        overall_compliance_score = round(sum(scores.values()) / len(scores), 1)
+
+        assessment = GuardianshipRiskAssessment.model_construct(
+            restrictiveness_score=scores["restrictiveness"],
+            will_preferences_score=scores["will_and_preferences"],
+            family_involvement_score=scores["family_involvement"],
+            cultural_considerations_score=scores["cultural_considerations"],
+            evidence_quality_score=scores["evidence_quality"],
+            overall_compliance_score=overall_compliance_score,
+            risk_factors=risk_factors,
+            protective_factors=protective_factors,
+            compliance_issues=compliance_issues,
+            recommendations=[],
         )
 
         # Generate recommendations
@@ -513,25 +618,28 @@ class StateGuardianshipBiasDetector:
         ],
     }
 
+    PATTERN_SET = _PatternSet(BIAS_PATTERNS.values())
+
     @classmethod
     async def detect_state_guardianship_bias(
         cls, request: StateGuardianshipBiasRequest
     ) -> StateGuardianshipBiasResponse:
         """Detect bias toward state guardianship"""
+        full_text, _ = await _extract_document(request.file_path)
+        return await _run_analysis(cls._analyze_text, full_text)
 
-        # Extract text
-        extraction_result = await extract_text_from_pdf({"file_path": request.file_path})
-        full_text = extraction_result["full_text"]
-
+    @classmethod
+    def _analyze_text(cls, full_text: str) -> StateGuardianshipBiasResponse:
+        """Detect bias toward state guardianship in extracted document text"""
         bias_indicators = []
         bias_score = 0.0
 
         # Analyze each bias pattern category
-        for category, patterns in cls.BIAS_PATTERNS.items():
+        for category, patterns in zip(cls.BIAS_PATTERNS, cls.PATTERN_SET.matching(full_text)):
             category_matches = 0
 
             for pattern in patterns:
-                matches = re.finditer(pattern, full_text, re.IGNORECASE)
+                matches = pattern.finditer(full_text)
 
                 for match in matches:
                     category_matches += 1
@@ -610,6 +718,85 @@ class StateGuardianshipBiasDetector:
         return "\n".join(narrative)
 
 
+# Recommendation for each professional language compliance category, in report order.
+# Keys are interned so they are the same objects as the issue categories.
+_CATEGORY_RECOMMENDATIONS: Dict[str, str] = {
+    sys.intern(category): recommendation
+    for category, recommendation in {
+        "Deficit Language": "Use strength-based language focusing on abilities rather than deficits",
+        "Medical Model": "Adopt social model of disability - focus on environmental barriers, not 'suffering'",
+        "Labels Not People": "Use person-first language (e.g., 'person with disability' not 'disabled person')",
+        "Judgmental Language": "Replace judgmental terms with objective, neutral descriptions",
+        "Unsupported Generalizations": "Provide specific, dated, documented examples rather than generalizations",
+    }.items()
+}
+
+
+# Compliance level for scores below/at or above each threshold (thresholds strictly increasing)
+_COMPLIANCE_LEVELS = ("low", "moderate", "high")
+_COMPLIANCE_THRESHOLDS = (5.0, 8.0)
+
+
+# Memoized compliance results keyed by SHA-256 of the document text (LRU order)
+_COMPLIANCE_CACHE_SIZE = 512
+_compliance_cache: "ResultCache[ProfessionalComplianceResponse]" = ResultCache(_COMPLIANCE_CACHE_SIZE)
+
+
+def _generate_compliance_recommendations(
+    by_category: Mapping[str, List[Dict]], _table: Dict[str, str] = _CATEGORY_RECOMMENDATIONS
+) -> List[str]:
+    """
+    Generate recommendations based on compliance issues grouped by category.
+
+    The table is bound as a default argument so the lookup is a local load.
+    """
+    recommendations = [
+        recommendation for category, recommendation in _table.items() if category in by_category
+    ]
+
+    if not recommendations:
+        recommendations.append("Language demonstrates good professional compliance")
+
+    return recommendations
+
+
+def _generate_compliance_narrative(
+    compliance_issues: List[Dict],
+    by_category: Mapping[str, List[Dict]],
+    high_n: int,
+    medium_n: int,
+    compliance_score: float,
+    compliance_level: str,
+) -> str:
+    """Generate narrative summary"""
+    if not compliance_issues:
+        return "Professional language analysis: High compliance. Language is appropriate, person-centered, and professional."
+
+    # Exact slot count: 5 header lines, blank line + block per category, blank line + footer
+    parts: List[str] = [""] * (5 + 2 * len(by_category) + 2)
+    parts[0] = f"Professional Language Compliance Analysis (Score: {compliance_score}/10 - {compliance_level.upper()} compliance)"
+    parts[2] = f"Identified {len(compliance_issues)} compliance issues:"
+    parts[3] = f"- High Severity: {high_n}"
+    parts[4] = f"- Medium Severity: {medium_n}"
+
+    idx = 6
+    for category, issues in by_category.items():
+        first = issues[0]
+        parts[idx] = "\n".join((
+            f"{category}: {len(issues)} instances",
+            f"- {first['description']}",
+            f'- Examples: "{first["issue"]}"',
+        ))
+        idx += 2
+
+    parts[-1] = (
+        "QCAT Consideration: Non-compliant professional language may indicate bias, lack of training, "
+        "or failure to meet professional standards, undermining the credibility of the assessment."
+    )
+
+    return "\n".join(parts)
+
+
 class ProfessionalLanguageAnalyzer:
     """
     Analyzes professional language compliance
@@ -670,25 +857,57 @@ class ProfessionalLanguageAnalyzer:
         },
     }
 
+    # Interned display name for each category, shared by every issue in it
+    CATEGORY_NAMES: Dict[str, str] = {
+        category: sys.intern(category.replace("_", " ").title()) for category in COMPLIANCE_ISSUES
+    }
+
+    PATTERN_SET = _PatternSet(config["patterns"] for config in COMPLIANCE_ISSUES.values())
+
     @classmethod
     async def analyze_professional_compliance(
         cls, request: ProfessionalComplianceRequest
     ) -> ProfessionalComplianceResponse:
         """Analyze professional language compliance"""
+        full_text, _ = await _extract_document(request.file_path)
+        return await _run_analysis(cls._analyze_text, full_text)
+
+    @classmethod
+    def _analyze_text(cls, full_text: str) -> ProfessionalComplianceResponse:
+        """
+        Analyze professional language compliance of extracted document text.
+
+        Reports often repeat the same boilerplate, so results are memoized by
+        text digest and identical documents skip the scan entirely.
+        """
+        text_digest = hashlib.sha256(full_text.encode("utf-8")).hexdigest()
 
-        # Extract text
-        extraction_result = await extract_text_from_pdf({"file_path": request.file_path})
-        full_text = extraction_result["full_text"]
+        cached = _compliance_cache.get(text_digest)
+        if cached is not None:
+            return cached
 
+        response = cls._analyze_text_uncached(full_text)
+        _compliance_cache.put(text_digest, response)
+        return response
+
+    @classmethod
+    def _analyze_text_uncached(cls, full_text: str) -> ProfessionalComplianceResponse:
+        """Scan extracted document text for professional language compliance issues"""
         compliance_issues = []
+        # Issues are grouped and severities tallied while scanning
+        by_category: Dict[str, List[Dict]] = defaultdict(list)
+        high_n = medium_n = 0
         total_score = 0.0
 
         # Analyze each compliance category
-        for category, config in cls.COMPLIANCE_ISSUES.items():
+        for (category, config), patterns in zip(
+            cls.COMPLIANCE_ISSUES.items(), cls.PATTERN_SET.matching(full_text)
+        ):
+            category_name = cls.CATEGORY_NAMES[category]
             category_issues = 0
 
-            for pattern in config["patterns"]:
-                matches = re.finditer(pattern, full_text, re.IGNORECASE)
+            for pattern in patterns:
+                matches = pattern.finditer(full_text)
 
                 for match in matches:
                     category_issues += 1
@@ -698,130 +917,51 @@ class ProfessionalLanguageAnalyzer:
                     end = min(len(full_text), match.end() + 100)
                     context = full_text[start:end].strip()
 
-                    compliance_issues.append({
-                        "category": category.replace("_", " ").title(),
+                    issue = {
+                        "category": category_name,
                         "issue": match.group(0),
                         "context": context,
                         "severity": config["severity"],
                         "description": config["description"],
-                    })
+                    }
+                    compliance_issues.append(issue)
+                    by_category[category_name].append(issue)
 
             # Add to score (higher issue count = lower compliance)
-            if config["severity"] == "high":
+            severity = config["severity"]
+            if severity == "high":
+                high_n += category_issues
                 total_score += category_issues * 1.5
             else:
+                if severity == "medium":
+                    medium_n += category_issues
                 total_score += category_issues * 0.8
 
-        # Calculate compliance score (10 = perfect, 0 = many issues)
-        compliance_score = max(0.0, 10.0 - min(10.0, total_score * 0.1))
+        # Calculate compliance score (10 = perfect, 0 = many issues), rounded once for all consumers
+        compliance_score = round(max(0.0, 10.0 - min(10.0, total_score * 0.1)), 1)
 
         # Determine compliance level
-        if compliance_score >= 8.0:
-            compliance_level = "high"
-        elif compliance_score >= 5.0:
-            compliance_level = "moderate"
-        else:
-            compliance_level = "low"
+        compliance_level = _COMPLIANCE_LEVELS[
+            bisect.bisect_right(_COMPLIANCE_THRESHOLDS, compliance_score)
+        ]
 
         # Generate recommendations
-        recommendations = cls._generate_recommendations(compliance_issues)
+        recommendations = _generate_compliance_recommendations(by_category)
 
         # Generate narrative
-        narrative = cls._generate_compliance_narrative(
-            compliance_issues, compliance_score, compliance_level
+        narrative = _generate_compliance_narrative(
+            compliance_issues, by_category, high_n, medium_n, compliance_score, compliance_level
         )
 
         return ProfessionalComplianceResponse(
             compliance_issues=compliance_issues,
-            compliance_score=round(compliance_score, 1),
+            compliance_score=compliance_score,
             compliance_level=compliance_level,
             total_issues=len(compliance_issues),
             recommendations=recommendations,
             analysis_summary=narrative,
         )
 
-    @staticmethod
-    def _generate_recommendations(compliance_issues: List[Dict]) -> List[str]:
-        """Generate recommendations based on compliance issues"""
-        recommendations = []
-
-        # Group by category
-        by_category = {}
-        for issue in compliance_issues:
-            category = issue["category"]
-            if category not in by_category:
-                by_category[category] = []
-            by_category[category].append(issue)
-
-        if "Deficit Language" in by_category:
-            recommendations.append(
-                "Use strength-based language focusing on abilities rather than deficits"
-            )
-
-        if "Medical Model" in by_category:
-            recommendations.append(
-                "Adopt social model of disability - focus on environmental barriers, not 'suffering'"
-            )
-
-        if "Labels Not People" in by_category:
-            recommendations.append(
-                "Use person-first language (e.g., 'person with disability' not 'disabled person')"
-            )
-
-        if "Judgmental Language" in by_category:
-            recommendations.append(
-                "Replace judgmental terms with objective, neutral descriptions"
-            )
-
-        if "Unsupported Generalizations" in by_category:
-            recommendations.append(
-                "Provide specific, dated, documented examples rather than generalizations"
-            )
-
-        if not recommendations:
-            recommendations.append("Language demonstrates good professional compliance")
-
-        return recommendations
-
-    @staticmethod
-    def _generate_compliance_narrative(
-        compliance_issues: List[Dict], compliance_score: float, compliance_level: str
-    ) -> str:
-        """Generate narrative summary"""
-        if not compliance_issues:
-            return "Professional language analysis: High compliance. Language is appropriate, person-centered, and professional."
-
-        # Group by severity
-        high_severity = [i for i in compliance_issues if i["severity"] == "high"]
-        medium_severity = [i for i in compliance_issues if i["severity"] == "medium"]
-
-        narrative = [
-            f"Professional Language Compliance Analysis (Score: {compliance_score}/10 - {compliance_level.upper()} compliance)\n",
-            f"\nIdentified {len(compliance_issues)} compliance issues:",
-            f"- High Severity: {len(high_severity)}",
-            f"- Medium Severity: {len(medium_severity)}\n",
-        ]
-
-        # Group by category
-        by_category = {}
-        for issue in compliance_issues:
-            category = issue["category"]
-            if category not in by_category:
-                by_category[category] = []
-            by_category[category].append(issue)
-
-        for category, issues in by_category.items():
-            narrative.append(f"\n{category}: {len(issues)} instances")
-            narrative.append(f"- {issues[0]['description']}")
-            narrative.append(f'- Examples: "{issues[0]["issue"]}"')
-
-        narrative.append(
-            "\n\nQCAT Consideration: Non-compliant professional language may indicate bias, lack of training, "
-            "or failure to meet professional standards, undermining the credibility of the assessment."
-        )
-
-        return "\n".join(narrative)
-
 
 # Main service functions
 
@@ -851,3 +991,27 @@ async def analyze_professional_compliance(
 ) -> ProfessionalComplianceResponse:
     """Tool 19: Analyze professional language compliance"""
     return await ProfessionalLanguageAnalyzer.analyze_professional_compliance(request)
+
+
+async def analyze_all_legal(file_path: str) -> Dict[str, BaseModel]:
+    """
+    Run Tools 16-19 against a single document.
+
+    The PDF is extracted once and the text is shared by all four analyzers,
+    instead of each tool re-parsing the same file.
+    """
+    full_text, pages = await _extract_document(file_path)
+
+    human_rights, risk, state_bias, compliance = await asyncio.gather(
+        _run_analysis(HumanRightsAnalyzer._analyze_text, full_text, pages),
+        _run_analysis(GuardianshipRiskAnalyzer._analyze_text, full_text),
+        _run_analysis(StateGuardianshipBiasDetector._analyze_text, full_text),
+        _run_analysis(ProfessionalLanguageAnalyzer._analyze_text, full_text),
+    )
+
+    return {
+        "human_rights_breaches": human_rights,
+        "guardianship_risk": risk,
+        "state_guardianship_bias": state_bias,
+        "professional_compliance": compliance,
+    }
@@ -3,9 +3,21 @@ NDIS Goals Alignment Service
 Tool 20: Analyze NDIS goals alignment with guardianship options (CRITICAL)
 """
 
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, FrozenSet, Iterator, NamedTuple, Optional, Tuple
+import asyncio
 import re
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
 from datetime import datetime
+from itertools import chain, count
+from loguru import logger
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    logger.warning("re2 not available, using stdlib re for NDIS goal patterns")
+    RE2_AVAILABLE = False
 
 from app.models.legal import (
     GoalsAlignmentRequest,
@@ -14,6 +26,379 @@ from app.models.legal import (
 )
 from app.models.pdf import PDFExtractionRequest
 from app.services.pdf_service import extract_text_from_pdf
+from app.services._re2_text import re2_compatible
+from app.services._result_cache import ResultCache, file_key
+
+
+# Memoized responses keyed by (file identity, guardianship context), LRU order
+_RESULT_CACHE_SIZE = 128
+_result_cache: "ResultCache[GoalsAlignmentResponse]" = ResultCache(_RESULT_CACHE_SIZE)
+
+
+# Evidence quotes kept per goal for each side
+_EVIDENCE_LIMIT = 5
+
+# Sentence boundaries used to keep evidence quotes within the sentence of the hit
+_SENTENCE_BREAK = re.compile(r"[.!?]\s+")
+
+def _find_all(text: str, literal: str):
+    """Yield every (possibly overlapping) position of literal in text"""
+    position = text.find(literal)
+    while position != -1:
+        yield position
+        position = text.find(literal, position + 1)
+
+
+_REGEX_META = frozenset("\\.^$*+?{}[]|()")
+
+
+def _compile_re2(source: str):
+    """
+    Compile an ASCII pattern with the linear-time re2 engine for matching against
+    bytes. Returns None when re2 is unavailable or rejects the pattern.
+    """
+    if RE2_AVAILABLE:
+        try:
+            return re2.compile(source.encode("ascii"))
+        except re2.error:
+            logger.warning(f"re2 rejected pattern, falling back to re: {source}")
+    return None
+
+
+def _literal_prefix(source: str) -> str:
+    """Literal run a pattern starts with, up to its first metacharacter"""
+    for i, char in enumerate(source):
+        if char in _REGEX_META:
+            # A trailing ?, * or {0,n} makes the preceding character optional
+            return source[:i - 1] if char in "?*{" else source[:i]
+    return source
+
+
+def _leading_literals(source: str) -> Tuple[str, ...]:
+    """
+    Lowercased literals, one of which occurs at the start of every match of the
+    pattern. Returns an empty tuple when no such literal can be derived.
+    """
+    if not source.startswith("(?:"):
+        prefix = _literal_prefix(source)
+        return (prefix.lower(),) if prefix else ()
+
+    # Split the leading non-capturing group into its top-level alternatives
+    depth, alternatives, begin, i = 0, [], 3, 3
+    while i < len(source):
+        char = source[i]
+        if char == "\\":
+            i += 1
+        elif char == "(":
+            depth += 1
+        elif char == ")" and depth:
+            depth -= 1
+        elif char == ")":
+            alternatives.append(source[begin:i])
+            break
+        elif char == "|" and not depth:
+            alternatives.append(source[begin:i])
+            begin = i + 1
+        i += 1
+    else:
+        return ()
+
+    if source[i + 1:i + 2] in ("?", "*", "{"):
+        return ()
+
+    literals: List[str] = []
+    for alternative in alternatives:
+        prefixes = _leading_literals(alternative)
+        if not prefixes:
+            return ()
+        literals.extend(prefixes)
+    return tuple(literals)
+
+
+class _IndicatorBucket(NamedTuple):
+    """One bucket of indicator patterns (e.g. family_positive) for a goal, fused"""
+    # Alternation of the lowercased sub-patterns; sub-pattern i is captured as group p<i>
+    pattern: re.Pattern
+    # re2 form of the same pattern for bytes, or None when re2 is not usable
+    re2_pattern: Any
+    # Literals every hit starts with, or None when they cannot be derived
+    anchors: Optional[FrozenSet[str]]
+    # Position of this bucket in the re2 bucket set (see _compile_bucket_set)
+    bucket_id: int
+
+    def may_match(self, document: "_PreparedText") -> bool:
+        """Cheap check ruling out buckets with no hit in the document"""
+        if document.matched_buckets is not None:
+            return self.bucket_id in document.matched_buckets
+        return self.anchors is None or any(document.anchor_positions[a] for a in self.anchors)
+
+    def finditer(self, document: "_PreparedText"):
+        """Iterate over hits in the document's lowercased text"""
+        if self.re2_pattern is not None and document.text_bytes is not None:
+            # Byte offsets equal character offsets for ASCII text
+            return self.re2_pattern.finditer(document.text_bytes)
+        return self.pattern.finditer(document.text_lc)
+
+
+_bucket_ids = count()
+
+# An uppercase escape such as \S, \W or \D, whose meaning lowercasing would flip
+_UPPERCASE_ESCAPE = re.compile(r"(?<!\\)(?:\\\\)*\\[A-Z]")
+
+
+def _compile_bucket(sources: List[str]) -> _IndicatorBucket:
+    """
+    Fuse a bucket's patterns into one alternation so the text is scanned once.
+    Patterns are lowercased and matched against lowercased text instead of using
+    re.IGNORECASE, so they may only use lowercase escapes such as \\s (anything
+    else raises ValueError at import) and contain no capturing groups of their own.
+    """
+    for source in sources:
+        if _UPPERCASE_ESCAPE.search(source):
+            raise ValueError(f"Indicator pattern uses an escape lowercasing would change: {source!r}")
+    literals = [_leading_literals(source) for source in sources]
+    fused = "|".join(f"(?P<p{i}>{source.lower()})" for i, source in enumerate(sources))
+    return _IndicatorBucket(
+        pattern=re.compile(fused),
+        re2_pattern=_compile_re2(fused),
+        anchors=frozenset(a for prefixes in literals for a in prefixes) if all(literals) else None,
+        bucket_id=next(_bucket_ids),
+    )
+
+
+def _compile_bucket_set(buckets: Tuple[_IndicatorBucket, ...]):
+    """
+    Build an re2 set over every bucket, reporting in one pass over the text which
+    buckets have at least one hit. Returns None unless every bucket has an re2 form.
+    """
+    if any(bucket.re2_pattern is None for bucket in buckets):
+        return None
+
+    bucket_set = re2.Set.SearchSet()
+    for bucket in sorted(buckets, key=lambda bucket: bucket.bucket_id):
+        if bucket_set.Add(bucket.re2_pattern.pattern) != bucket.bucket_id:
+            return None
+    bucket_set.Compile()
+    return bucket_set
+
+
+def _goal_anchors(buckets: Tuple[_IndicatorBucket, ...]) -> Optional[FrozenSet[str]]:
+    """Literals one of which must occur for any bucket of a goal to match"""
+    if any(bucket.anchors is None for bucket in buckets):
+        return None
+    return frozenset().union(*(bucket.anchors for bucket in buckets))
+
+
+@dataclass(slots=True)
+class _GoalResult:
+    """Analysis of one NDIS goal; converted to NDISGoal only for the response"""
+    goal_number: str
+    goal_name: str
+    goal_description: str
+    family_alignment_score: float
+    pg_alignment_score: float
+    evidence_for_family: List[str]
+    evidence_against_pg: List[str]
+    analysis: str
+
+    def to_model(self) -> NDISGoal:
+        """Build the response model; the fields are already well-typed, so skip validation"""
+        return NDISGoal.model_construct(
+            goal_number=self.goal_number,
+            goal_name=self.goal_name,
+            goal_description=self.goal_description,
+            family_alignment_score=self.family_alignment_score,
+            pg_alignment_score=self.pg_alignment_score,
+            evidence_for_family=self.evidence_for_family,
+            evidence_against_pg=self.evidence_against_pg,
+            analysis=self.analysis,
+        )
+
+
+class _PreparedText(NamedTuple):
+    """Per-document state shared by every goal's analysis"""
+    # Original text, quoted in evidence
+    text: str
+    # Lowercased text the indicator patterns are matched against
+    text_lc: str
+    # `text_lc` encoded once for re2 (which otherwise re-encodes str input on every
+    # call), or None when it is not ASCII, so byte offsets would not match, or
+    # holds whitespace re2's \s misses
+    text_bytes: Optional[bytes]
+    # Offsets at which each sentence of `text` starts
+    sentence_starts: List[int]
+    # Every position of each prefilter literal in `text_lc`
+    anchor_positions: Dict[str, List[int]]
+    # Ids of the buckets with at least one hit, or None when the re2 set is not usable
+    matched_buckets: Optional[FrozenSet[int]]
+
+
+def _prepare_text(full_text: str, anchors: FrozenSet[str], bucket_set) -> _PreparedText:
+    """
+    Lowercase the text, split it into sentences, locate every prefilter literal
+    and, with an re2 bucket set, find which buckets have any hit at all.
+    """
+    text_lc = full_text.lower()
+    if len(text_lc) != len(full_text):
+        # Lowercasing changed some character widths, so offsets no longer line up
+        full_text = text_lc
+    # Only text re2 matches exactly as re would gets a byte form for re2
+    text_bytes = text_lc.encode("ascii") if RE2_AVAILABLE and re2_compatible(text_lc) else None
+    return _PreparedText(
+        text=full_text,
+        text_lc=text_lc,
+        text_bytes=text_bytes,
+        sentence_starts=[0] + [match.end() for match in _SENTENCE_BREAK.finditer(full_text)],
+        anchor_positions={anchor: list(_find_all(text_lc, anchor)) for anchor in anchors},
+        matched_buckets=(
+            frozenset(bucket_set.Match(text_bytes) or ())
+            if bucket_set is not None and text_bytes is not None
+            else None
+        ),
+    )
+
+
+# ============================================================================
+# Narrative templates
+# ============================================================================
+# Templates indexed by _band() run from strongest Public Guardian advantage to
+# strongest family advantage, filled with str.format_map.
+
+def _band(
+    differential: float, pg_thresholds: Tuple[float, ...], family_thresholds: Tuple[float, ...]
+) -> int:
+    """
+    Index of the band a differential falls in. Public Guardian thresholds are
+    inclusive upper bounds, family thresholds inclusive lower bounds.
+    """
+    return bisect_left(pg_thresholds, differential) + bisect_right(family_thresholds, differential)
+
+
+_GOAL_ANALYSIS_HEADER = "\n".join((
+    "{goal_num}: {name}",
+    "Family Alignment: {family_score:.1f}/10 ({family_pos} positive, {family_neg} negative indicators)",
+    "PG Alignment: {pg_score:.1f}/10 ({pg_pos} positive, {pg_neg} negative indicators)",
+    "Differential: {differential:+.1f} ({label})",
+    "\n",
+))
+
+_GOAL_ANALYSIS_TEMPLATES = tuple(_GOAL_ANALYSIS_HEADER + verdict for verdict in (
+    "STRONG PG ADVANTAGE: Evidence suggests Public Guardian better supports {name} outcomes.",
+    "PG ADVANTAGE: Evidence indicates Public Guardian better aligns with {name} goals.",
+    "NEUTRAL: Evidence does not clearly favor either guardianship option for {name}.",
+    "FAMILY ADVANTAGE: Evidence indicates family guardianship better aligns with {name} goals.",
+    "STRONG FAMILY ADVANTAGE: Evidence shows family guardianship significantly better "
+    "supports {name} outcomes.",
+))
+
+_RECOMMENDATION_TEMPLATES = (
+    "STRONG RECOMMENDATION: Public Guardian (Family: {family_score}/10, PG: {pg_score}/10, "
+    "Differential: {differential:+.1f}). Evidence shows Public Guardian significantly "
+    "better aligns with NDIS goals.",
+    "RECOMMENDATION: Public Guardian (Family: {family_score}/10, PG: {pg_score}/10, "
+    "Differential: {differential:+.1f}). Evidence indicates Public Guardian better "
+    "supports NDIS goals.",
+    "NEUTRAL: No clear preference (Family: {family_score}/10, PG: {pg_score}/10, "
+    "Differential: {differential:+.1f}). Both options show similar alignment with NDIS goals.",
+    "RECOMMENDATION: Family Guardianship (Family: {family_score}/10, PG: {pg_score}/10, "
+    "Differential: {differential:+.1f}). Evidence indicates family guardianship better "
+    "supports NDIS goals.",
+    "STRONG RECOMMENDATION: Family Guardianship (Family: {family_score}/10, PG: {pg_score}/10, "
+    "Differential: {differential:+.1f}). Evidence shows family guardianship significantly "
+    "better aligns with NDIS goals and client outcomes.",
+)
+
+_QCAT_TEMPLATES = (
+    "\n".join((
+        "QCAT LEGAL ARGUMENT: NDIS Goals Alignment Supports Public Guardian Appointment\n",
+        "=" * 80,
+        "\n\nAnalysis of NDIS plan goals shows Public Guardian appointment better aligns "
+        "with client outcomes (PG: {pg_score}/10, Family: {family_score}/10, "
+        "Differential: {differential:+.1f}).",
+        "\n\nThis finding supports the proposed guardianship arrangement.",
+        "\n" + "=" * 80,
+    )),
+    "QCAT CONSIDERATION: NDIS Goals Analysis\n" + "=" * 80 + "\n\n"
+    "Analysis of NDIS plan goals shows neutral alignment between family guardianship "
+    "({family_score}/10) and Public Guardian ({pg_score}/10), with minimal differential "
+    "({differential:+.1f}). Other factors should guide the guardianship decision.\n"
+    + "=" * 80,
+)
+
+_QCAT_FAMILY_HEADER = "\n".join((
+    "QCAT LEGAL ARGUMENT: NDIS Goals Alignment Supports Family Guardianship\n",
+    "=" * 80,
+    "\n\n1. EVIDENCE-BASED ANALYSIS",
+    "\nComprehensive analysis of the client's NDIS plan goals (G1-G7) demonstrates that "
+    "family guardianship better aligns with the client's goals and outcomes:\n",
+    "- Family Guardianship Alignment: {family_score}/10",
+    "- Public Guardian Alignment: {pg_score}/10",
+    "- Differential: {differential:+.1f} in favor of family\n",
+    "\n2. GOAL-BY-GOAL ANALYSIS\n",
+))
+
+_QCAT_FAMILY_FOOTER = "\n".join((
+    "\n\n3. LEGAL FRAMEWORK",
+    "\nGuardianship and Administration Act 2000 (Qld) General Principles:",
+    "- GP5: The adult's will and preferences should be taken into account",
+    "- GP1: The guardianship should be the least restrictive of the adult's rights",
+    "- GP3: The adult's existing supportive relationships should be maintained",
+    "\nThe NDIS plan represents the client's goals and preferences. A guardianship decision "
+    "that undermines these goals fails to properly consider the adult's will and preferences "
+    "as required by GP5.",
+    "\n\n4. RECOMMENDATION",
+    "\nBased on comprehensive NDIS goals analysis showing {differential:+.1f} point advantage "
+    "for family guardianship, the Tribunal should find that family guardianship better serves "
+    "the client's interests and goals as expressed in their NDIS plan.",
+    "\n\n5. STATUTORY COMPLIANCE",
+    "\nAppointing Public Guardian when family guardianship better aligns with NDIS goals would:",
+    "- Fail to give proper weight to the adult's will and preferences (GP5)",
+    "- Be more restrictive than necessary (GP1)",
+    "- Undermine existing supportive family relationships (GP3)",
+    "\n" + "=" * 80,
+))
+
+def _family_advantage_lines(goals_analysis: List[_GoalResult]) -> Iterator[str]:
+    """QCAT argument lines for each goal where family guardianship has the advantage"""
+    for goal in goals_analysis:
+        if goal.family_alignment_score <= goal.pg_alignment_score:
+            continue
+        advantage = goal.family_alignment_score - goal.pg_alignment_score
+        yield f"\n{goal.goal_number} - {goal.goal_name}:"
+        yield (
+            f"  Family: {goal.family_alignment_score}/10, PG: {goal.pg_alignment_score}/10 "
+            f"(Family advantage: {advantage:+.1f})"
+        )
+        if goal.evidence_for_family:
+            yield f"  Evidence: {goal.evidence_for_family[0]}"
+
+
+_SUMMARY_HEADER = "\n".join((
+    "NDIS Goals Alignment Analysis - Executive Summary\n",
+    "\nOverall Alignment Scores:",
+    "- Family Guardianship: {family_score}/10",
+    "- Public Guardian: {pg_score}/10",
+    "- Differential: {differential:+.1f}\n",
+    "",
+))
+
+_SUMMARY_TEMPLATES = tuple(_SUMMARY_HEADER + finding for finding in (
+    "\nFINDING: Strong evidence that Public Guardian appointment better aligns with NDIS goals.",
+    "\nFINDING: Evidence indicates Public Guardian appointment better aligns with NDIS goals.",
+    "\nFINDING: Neutral - both guardianship options show similar alignment with NDIS goals.",
+    "\nFINDING: Evidence indicates family guardianship better aligns with NDIS goals. "
+    "The analysis shows family guardianship provides better support for the client's "
+    "goals and preferences as expressed in their NDIS plan.",
+    "\nFINDING: Strong evidence that family guardianship better aligns with NDIS goals. "
+    "The {differential:.1f} point advantage demonstrates that family guardianship is more "
+    "likely to support the client in achieving their NDIS plan outcomes across multiple goal areas.",
+))
+
+_SUMMARY_QCAT_RELEVANCE = (
+    "\n\nQCAT Relevance: This analysis directly addresses Guardianship and Administration Act 2000 (Qld) "
+    "General Principle 5 (consideration of adult's will and preferences). The NDIS plan represents "
+    "the client's goals and preferences, making this alignment analysis critical to the guardianship decision."
+)
 
 
 class NDISGoalsAnalyzer:
@@ -207,6 +592,26 @@ class NDISGoalsAnalyzer:
         },
     }
 
+    # Struct-of-arrays view of NDIS_GOALS, indexed by goal position (0 = G1)
+    GOAL_NUMS = tuple(NDIS_GOALS)
+    GOAL_NAMES = tuple(goal["name"] for goal in NDIS_GOALS.values())
+    GOAL_DESCRIPTIONS = tuple(goal["description"] for goal in NDIS_GOALS.values())
+    FAMILY_POSITIVE = tuple(_compile_bucket(goal["family_positive"]) for goal in NDIS_GOALS.values())
+    FAMILY_NEGATIVE = tuple(_compile_bucket(goal["family_negative"]) for goal in NDIS_GOALS.values())
+    PG_POSITIVE = tuple(_compile_bucket(goal["pg_positive"]) for goal in NDIS_GOALS.values())
+    PG_NEGATIVE = tuple(_compile_bucket(goal["pg_negative"]) for goal in NDIS_GOALS.values())
+    GOAL_ANCHORS = tuple(
+        _goal_anchors(buckets)
+        for buckets in zip(FAMILY_POSITIVE, FAMILY_NEGATIVE, PG_POSITIVE, PG_NEGATIVE)
+    )
+    # Every prefilter literal, located once per document for all goals and buckets
+    ALL_ANCHORS = frozenset().union(*(
+        bucket.anchors
+        for bucket in FAMILY_POSITIVE + FAMILY_NEGATIVE + PG_POSITIVE + PG_NEGATIVE
+        if bucket.anchors is not None
+    ))
+    BUCKET_SET = _compile_bucket_set(FAMILY_POSITIVE + FAMILY_NEGATIVE + PG_POSITIVE + PG_NEGATIVE)
+
     @classmethod
     async def analyze_goals_alignment(
         cls, request: GoalsAlignmentRequest
@@ -216,47 +621,51 @@ class NDISGoalsAnalyzer:
         CRITICAL TOOL for QCAT appeals.
         """
 
+        cache_key = (file_key(request.file_path), request.guardianship_context)
+        cached = _result_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # Extract text from NDIS plan
         pdf_request = PDFExtractionRequest(file_path=request.file_path)
         extraction_result = await extract_text_from_pdf(pdf_request)
-        full_text = extraction_result.full_text
-
-        goals_analysis: List[NDISGoal] = []
-        total_family_score = 0.0
-        total_pg_score = 0.0
+        document = await asyncio.to_thread(
+            _prepare_text, extraction_result.full_text, cls.ALL_ANCHORS, cls.BUCKET_SET
+        )
 
-        # Analyze each NDIS goal (G1-G7)
-        for goal_num, goal_config in cls.NDIS_GOALS.items():
-            goal_analysis = await cls._analyze_single_goal(
-                goal_num, goal_config, full_text, request.guardianship_context
+        # Analyze each NDIS goal (G1-G7) concurrently; the scans share no mutable state
+        goals_analysis: List[_GoalResult] = list(await asyncio.gather(*(
+            asyncio.to_thread(
+                cls._analyze_single_goal, index, document, request.guardianship_context
             )
-            goals_analysis.append(goal_analysis)
-            total_family_score += goal_analysis.family_alignment_score
-            total_pg_score += goal_analysis.pg_alignment_score
+            for index in range(len(cls.GOAL_NUMS))
+        )))
+        total_family_score = sum(goal.family_alignment_score for goal in goals_analysis)
+        total_pg_score = sum(goal.pg_alignment_score for goal in goals_analysis)
 
         # Calculate overall scores
-        num_goals = len(cls.NDIS_GOALS)
+        num_goals = len(cls.GOAL_NUMS)
         overall_family_alignment = round(total_family_score / num_goals, 1)
         overall_pg_alignment = round(total_pg_score / num_goals, 1)
         alignment_differential = round(overall_family_alignment - overall_pg_alignment, 1)
 
         # Generate recommendation
-        recommendation = cls._generate_recommendation(
+        recommendation = _generate_recommendation(
             overall_family_alignment, overall_pg_alignment, alignment_differential
         )
 
         # Generate QCAT argument
-        qcat_argument = cls._generate_qcat_argument(
+        qcat_argument = _generate_qcat_argument(
             goals_analysis, overall_family_alignment, overall_pg_alignment, alignment_differential
         )
 
         # Generate summary
-        analysis_summary = cls._generate_summary(
+        analysis_summary = _generate_summary(
             goals_analysis, overall_family_alignment, overall_pg_alignment, alignment_differential
         )
 
-        return GoalsAlignmentResponse(
-            goals_analysis=goals_analysis,
+        response = GoalsAlignmentResponse(
+            goals_analysis=[goal.to_model() for goal in goals_analysis],
             overall_family_alignment=overall_family_alignment,
             overall_pg_alignment=overall_pg_alignment,
             alignment_differential=alignment_differential,
@@ -265,74 +674,53 @@ class NDISGoalsAnalyzer:
             analysis_summary=analysis_summary,
         )
 
+        _result_cache.put(cache_key, response)
+
+        return response
+
     @classmethod
-    async def _analyze_single_goal(
-        cls, goal_num: str, goal_config: Dict, text: str, context: Optional[str]
-    ) -> NDISGoal:
-        """Analyze alignment for a single NDIS goal"""
-
-        # Count family positive indicators
-        family_positive_count = 0
-        family_positive_evidence = []
-        for pattern in goal_config["family_positive"]:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                family_positive_count += 1
-                # Extract context
-                start = max(0, match.start() - 100)
-                end = min(len(text), match.end() + 100)
-                evidence = text[start:end].strip()
-                family_positive_evidence.append(f'"{match.group(0)}" - {evidence[:80]}...')
-
-        # Count family negative indicators
-        family_negative_count = 0
-        for pattern in goal_config["family_negative"]:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            family_negative_count += len(matches)
-
-        # Count PG positive indicators
-        pg_positive_count = 0
-        pg_positive_evidence = []
-        for pattern in goal_config["pg_positive"]:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                pg_positive_count += 1
-                start = max(0, match.start() - 100)
-                end = min(len(text), match.end() + 100)
-                evidence = text[start:end].strip()
-                pg_positive_evidence.append(f'"{match.group(0)}" - {evidence[:80]}...')
-
-        # Count PG negative indicators
-        pg_negative_count = 0
-        pg_negative_evidence = []
-        for pattern in goal_config["pg_negative"]:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                pg_negative_count += 1
-                start = max(0, match.start() - 100)
-                end = min(len(text), match.end() + 100)
-                evidence = text[start:end].strip()
-                pg_negative_evidence.append(f'"{match.group(0)}" - {evidence[:80]}...')
-
-        # Calculate family alignment score (0-10)
-        if family_positive_count + family_negative_count == 0:
-            family_score = 5.0  # Neutral if no evidence
-        else:
-            family_score = (family_positive_count / (family_positive_count + family_negative_count)) * 10
+    def _analyze_single_goal(
+        cls, index: int, document: _PreparedText, context: Optional[str]
+    ) -> _GoalResult:
+        """Analyze alignment for the NDIS goal at position `index`"""
+
+        anchors = cls.GOAL_ANCHORS[index]
+        if anchors is None or any(document.anchor_positions[anchor] for anchor in anchors):
+            # Count family positive indicators, keeping the first hits as evidence
+            family_positive_count, family_positive_hits = cls._scan_bucket(
+                cls.FAMILY_POSITIVE[index], document, _EVIDENCE_LIMIT
+            )
 
-        # Calculate PG alignment score (0-10)
-        # Note: PG negative evidence LOWERS the score significantly
-        if pg_positive_count + pg_negative_count == 0:
-            pg_score = 5.0  # Neutral if no evidence
+            # Count family negative indicators
+            family_negative_count = cls._count_bucket(cls.FAMILY_NEGATIVE[index], document)
+
+            # Count PG positive indicators
+            pg_positive_count = cls._count_bucket(cls.PG_POSITIVE[index], document)
+
+            # Count PG negative indicators, keeping the first hits as evidence
+            pg_negative_count, pg_negative_hits = cls._scan_bucket(
+                cls.PG_NEGATIVE[index], document, _EVIDENCE_LIMIT
+            )
         else:
-            # Weight negative evidence more heavily for PG (since lack of capacity is critical)
-            weighted_negative = pg_negative_count * 1.5
-            pg_score = max(0, (pg_positive_count / (pg_positive_count + weighted_negative)) * 10)
+            # None of this goal's indicators can occur in the text
+            family_positive_count = family_negative_count = 0
+            pg_positive_count = pg_negative_count = 0
+            family_positive_hits, pg_negative_hits = [], []
+
+        # Calculate family alignment score (0-10), neutral (5.0) if no evidence
+        family_total = family_positive_count + family_negative_count
+        family_score = family_positive_count / family_total * 10 if family_total else 5.0
+
+        # Calculate PG alignment score (0-10), neutral (5.0) if no evidence
+        # Note: PG negative evidence LOWERS the score significantly; it is weighted more
+        # heavily for PG (since lack of capacity is critical)
+        pg_total = pg_positive_count + pg_negative_count * 1.5
+        pg_score = pg_positive_count / pg_total * 10 if pg_total else 5.0
 
         # Generate analysis narrative
         analysis = cls._generate_goal_analysis(
-            goal_num,
-            goal_config,
+            cls.GOAL_NUMS[index],
+            cls.GOAL_NAMES[index],
             family_positive_count,
             family_negative_count,
             pg_positive_count,
@@ -341,21 +729,79 @@ class NDISGoalsAnalyzer:
             pg_score,
         )
 
-        return NDISGoal(
-            goal_number=goal_num,
-            goal_name=goal_config["name"],
-            goal_description=goal_config["description"],
+        return _GoalResult(
+            goal_number=cls.GOAL_NUMS[index],
+            goal_name=cls.GOAL_NAMES[index],
+            goal_description=cls.GOAL_DESCRIPTIONS[index],
             family_alignment_score=round(family_score, 1),
             pg_alignment_score=round(pg_score, 1),
-            evidence_for_family=family_positive_evidence[:5],  # Top 5
-            evidence_against_pg=pg_negative_evidence[:5],  # Top 5
+            evidence_for_family=[cls._format_evidence(document, hit) for hit in family_positive_hits],
+            evidence_against_pg=[cls._format_evidence(document, hit) for hit in pg_negative_hits],
             analysis=analysis,
         )
 
+    @staticmethod
+    def _count_bucket(bucket: _IndicatorBucket, document: _PreparedText) -> int:
+        """Count hits of a fused bucket pattern without materializing or regrouping them"""
+
+        if not bucket.may_match(document):
+            return 0
+        anchors = bucket.anchors
+        if anchors is None:
+            return sum(1 for _ in bucket.finditer(document))
+
+        # Every hit starts with an anchor, so only the document's anchor positions need an
+        # anchored match attempt. Skipping positions inside the previous hit keeps the
+        # count identical to finditer's non-overlapping scan.
+        pattern, text_lc = bucket.pattern, document.text_lc
+        positions = document.anchor_positions
+        count = resume = 0
+        for position in sorted({pos for anchor in anchors for pos in positions[anchor]}):
+            if position < resume:
+                continue
+            match = pattern.match(text_lc, position)
+            if match:
+                count += 1
+                resume = match.end()
+        return count
+
+    @staticmethod
+    def _scan_bucket(
+        bucket: _IndicatorBucket, document: _PreparedText, limit: int
+    ) -> Tuple[int, List[Tuple[int, int]]]:
+        """
+        Scan text once with a fused bucket pattern. Returns the hit count and the
+        spans of the first `limit` hits in sub-pattern order.
+        """
+
+        if not bucket.may_match(document):
+            return 0, []
+
+        by_pattern: List[List[Tuple[int, int]]] = [[] for _ in range(bucket.pattern.groups)]
+        count = 0
+        for match in bucket.finditer(document):
+            count += 1
+            # Group n wraps sub-pattern n - 1
+            spans = by_pattern[match.lastindex - 1]
+            if len(spans) < limit:
+                spans.append(match.span())
+        return count, [span for spans in by_pattern for span in spans][:limit]
+
+    @staticmethod
+    def _format_evidence(document: _PreparedText, span: Tuple[int, int]) -> str:
+        """Quote a matched indicator with up to 100 characters of context from its sentence"""
+        text, sentence_starts = document.text, document.sentence_starts
+        start, end = span
+        sentence = bisect_right(sentence_starts, start)
+        sentence_start = sentence_starts[sentence - 1]
+        sentence_end = sentence_starts[sentence] if sentence < len(sentence_starts) else len(text)
+        context = text[max(sentence_start, start - 100):min(sentence_end, end + 100)].strip()
+        return f'"{text[start:end]}" - {context[:80]}...'
+
     @staticmethod
     def _generate_goal_analysis(
         goal_num: str,
-        goal_config: Dict,
+        goal_name: str,
         family_pos: int,
         family_neg: int,
         pg_pos: int,
@@ -366,219 +812,85 @@ class NDISGoalsAnalyzer:
         """Generate analysis narrative for a single goal"""
 
         differential = family_score - pg_score
-
-        analysis = [
-            f"{goal_num}: {goal_config['name']}",
-            f"Family Alignment: {family_score:.1f}/10 ({family_pos} positive, {family_neg} negative indicators)",
-            f"PG Alignment: {pg_score:.1f}/10 ({pg_pos} positive, {pg_neg} negative indicators)",
-            f"Differential: {differential:+.1f} ({'Family advantage' if differential > 0 else 'PG advantage' if differential < 0 else 'Neutral'})",
-        ]
-
-        if differential >= 3.0:
-            analysis.append(
-                f"\nSTRONG FAMILY ADVANTAGE: Evidence shows family guardianship significantly better "
-                f"supports {goal_config['name']} outcomes."
-            )
-        elif differential >= 1.0:
-            analysis.append(
-                f"\nFAMILY ADVANTAGE: Evidence indicates family guardianship better aligns with "
-                f"{goal_config['name']} goals."
-            )
-        elif differential <= -3.0:
-            analysis.append(
-                f"\nSTRONG PG ADVANTAGE: Evidence suggests Public Guardian better supports "
-                f"{goal_config['name']} outcomes."
-            )
-        elif differential <= -1.0:
-            analysis.append(
-                f"\nPG ADVANTAGE: Evidence indicates Public Guardian better aligns with "
-                f"{goal_config['name']} goals."
-            )
-        else:
-            analysis.append(
-                f"\nNEUTRAL: Evidence does not clearly favor either guardianship option for "
-                f"{goal_config['name']}."
-            )
-
-        return "\n".join(analysis)
-
-    @staticmethod
-    def _generate_recommendation(
-        family_score: float, pg_score: float, differential: float
-    ) -> str:
-        """Generate guardianship recommendation based on alignment scores"""
-
-        if differential >= 2.0:
-            return (
-                f"STRONG RECOMMENDATION: Family Guardianship (Family: {family_score}/10, PG: {pg_score}/10, "
-                f"Differential: {differential:+.1f}). Evidence shows family guardianship significantly "
-                f"better aligns with NDIS goals and client outcomes."
-            )
-        elif differential >= 0.5:
-            return (
-                f"RECOMMENDATION: Family Guardianship (Family: {family_score}/10, PG: {pg_score}/10, "
-                f"Differential: {differential:+.1f}). Evidence indicates family guardianship better "
-                f"supports NDIS goals."
-            )
-        elif differential <= -2.0:
-            return (
-                f"STRONG RECOMMENDATION: Public Guardian (Family: {family_score}/10, PG: {pg_score}/10, "
-                f"Differential: {differential:+.1f}). Evidence shows Public Guardian significantly "
-                f"better aligns with NDIS goals."
-            )
-        elif differential <= -0.5:
-            return (
-                f"RECOMMENDATION: Public Guardian (Family: {family_score}/10, PG: {pg_score}/10, "
-                f"Differential: {differential:+.1f}). Evidence indicates Public Guardian better "
-                f"supports NDIS goals."
-            )
-        else:
-            return (
-                f"NEUTRAL: No clear preference (Family: {family_score}/10, PG: {pg_score}/10, "
-                f"Differential: {differential:+.1f}). Both options show similar alignment with NDIS goals."
-            )
-
-    @staticmethod
-    def _generate_qcat_argument(
-        goals_analysis: List[NDISGoal],
-        family_score: float,
-        pg_score: float,
-        differential: float,
-    ) -> str:
-        """Generate QCAT-ready legal argument based on goals alignment"""
-
-        if differential >= 1.0:
-            # Family advantage
-            argument_parts = [
-                "QCAT LEGAL ARGUMENT: NDIS Goals Alignment Supports Family Guardianship\n",
-                "=" * 80,
-                "\n\n1. EVIDENCE-BASED ANALYSIS",
-                f"\nComprehensive analysis of the client's NDIS plan goals (G1-G7) demonstrates that "
-                f"family guardianship better aligns with the client's goals and outcomes:\n",
-                f"- Family Guardianship Alignment: {family_score}/10",
-                f"- Public Guardian Alignment: {pg_score}/10",
-                f"- Differential: {differential:+.1f} in favor of family\n",
-                "\n2. GOAL-BY-GOAL ANALYSIS\n",
-            ]
-
-            # Add analysis for goals where family has advantage
-            for goal in goals_analysis:
-                if goal.family_alignment_score > goal.pg_alignment_score:
-                    advantage = goal.family_alignment_score - goal.pg_alignment_score
-                    argument_parts.append(
-                        f"\n{goal.goal_number} - {goal.goal_name}:"
-                    )
-                    argument_parts.append(
-                        f"  Family: {goal.family_alignment_score}/10, PG: {goal.pg_alignment_score}/10 "
-                        f"(Family advantage: {advantage:+.1f})"
-                    )
-                    if goal.evidence_for_family:
-                        argument_parts.append(f"  Evidence: {goal.evidence_for_family[0]}")
-
-            argument_parts.extend([
-                "\n\n3. LEGAL FRAMEWORK",
-                "\nGuardianship and Administration Act 2000 (Qld) General Principles:",
-                "- GP5: The adult's will and preferences should be taken into account",
-                "- GP1: The guardianship should be the least restrictive of the adult's rights",
-                "- GP3: The adult's existing supportive relationships should be maintained",
-                "\nThe NDIS plan represents the client's goals and preferences. A guardianship decision "
-                "that undermines these goals fails to properly consider the adult's will and preferences "
-                "as required by GP5.",
-                "\n\n4. RECOMMENDATION",
-                f"\nBased on comprehensive NDIS goals analysis showing {differential:+.1f} point advantage "
-                f"for family guardianship, the Tribunal should find that family guardianship better serves "
-                f"the client's interests and goals as expressed in their NDIS plan.",
-                "\n\n5. STATUTORY COMPLIANCE",
-                "\nAppointing Public Guardian when family guardianship better aligns with NDIS goals would:",
-                "- Fail to give proper weight to the adult's will and preferences (GP5)",
-                "- Be more restrictive than necessary (GP1)",
-                "- Undermine existing supportive family relationships (GP3)",
-                "\n" + "=" * 80,
-            ])
-
-            return "\n".join(argument_parts)
-
-        elif differential <= -1.0:
-            # PG advantage
-            argument_parts = [
-                "QCAT LEGAL ARGUMENT: NDIS Goals Alignment Supports Public Guardian Appointment\n",
-                "=" * 80,
-                f"\n\nAnalysis of NDIS plan goals shows Public Guardian appointment better aligns "
-                f"with client outcomes (PG: {pg_score}/10, Family: {family_score}/10, "
-                f"Differential: {differential:+.1f}).",
-                "\n\nThis finding supports the proposed guardianship arrangement.",
-                "\n" + "=" * 80,
-            ]
-            return "\n".join(argument_parts)
-
-        else:
-            # Neutral
-            return (
-                "QCAT CONSIDERATION: NDIS Goals Analysis\n" + "=" * 80 + "\n\n"
-                f"Analysis of NDIS plan goals shows neutral alignment between family guardianship "
-                f"({family_score}/10) and Public Guardian ({pg_score}/10), with minimal differential "
-                f"({differential:+.1f}). Other factors should guide the guardianship decision.\n"
-                + "=" * 80
-            )
-
-    @staticmethod
-    def _generate_summary(
-        goals_analysis: List[NDISGoal],
-        family_score: float,
-        pg_score: float,
-        differential: float,
-    ) -> str:
-        """Generate executive summary"""
-
-        summary_parts = [
-            f"NDIS Goals Alignment Analysis - Executive Summary\n",
-            f"\nOverall Alignment Scores:",
-            f"- Family Guardianship: {family_score}/10",
-            f"- Public Guardian: {pg_score}/10",
-            f"- Differential: {differential:+.1f}\n",
-        ]
-
-        if differential >= 2.0:
-            summary_parts.append(
-                f"\nFINDING: Strong evidence that family guardianship better aligns with NDIS goals. "
-                f"The {differential:.1f} point advantage demonstrates that family guardianship is more "
-                f"likely to support the client in achieving their NDIS plan outcomes across multiple goal areas."
-            )
-        elif differential >= 0.5:
-            summary_parts.append(
-                f"\nFINDING: Evidence indicates family guardianship better aligns with NDIS goals. "
-                f"The analysis shows family guardianship provides better support for the client's "
-                f"goals and preferences as expressed in their NDIS plan."
-            )
-        elif differential <= -2.0:
-            summary_parts.append(
-                f"\nFINDING: Strong evidence that Public Guardian appointment better aligns with NDIS goals."
-            )
-        elif differential <= -0.5:
-            summary_parts.append(
-                f"\nFINDING: Evidence indicates Public Guardian appointment better aligns with NDIS goals."
-            )
-        else:
-            summary_parts.append(
-                f"\nFINDING: Neutral - both guardianship options show similar alignment with NDIS goals."
-            )
-
-        # Add goal-by-goal summary
-        summary_parts.append("\n\nGoal-by-Goal Results:")
-        for goal in goals_analysis:
-            diff = goal.family_alignment_score - goal.pg_alignment_score
-            winner = "Family" if diff > 0 else "PG" if diff < 0 else "Neutral"
-            summary_parts.append(
-                f"- {goal.goal_number} ({goal.goal_name}): {winner} (F:{goal.family_alignment_score}, PG:{goal.pg_alignment_score})"
-            )
-
+        template = _GOAL_ANALYSIS_TEMPLATES[_band(differential, (-3.0, -1.0), (1.0, 3.0))]
+        return template.format_map({
+            "goal_num": goal_num,
+            "name": goal_name,
+            "family_score": family_score,
+            "family_pos": family_pos,
+            "family_neg": family_neg,
+            "pg_score": pg_score,
+            "pg_pos": pg_pos,
+            "pg_neg": pg_neg,
+            "differential": differential,
+            "label": (
+                "Family advantage" if differential > 0
+                else "PG advantage" if differential < 0
+                else "Neutral"
+            ),
+        })
+
+
+def _generate_recommendation(
+    family_score: float, pg_score: float, differential: float
+) -> str:
+    """Generate guardianship recommendation based on alignment scores"""
+
+    template = _RECOMMENDATION_TEMPLATES[_band(differential, (-2.0, -0.5), (0.5, 2.0))]
+    return template.format_map(
+        {"family_score": family_score, "pg_score": pg_score, "differential": differential}
+    )
+
+
+def _generate_qcat_argument(
+    goals_analysis: List[_GoalResult],
+    family_score: float,
+    pg_score: float,
+    differential: float,
+) -> str:
+    """Generate QCAT-ready legal argument based on goals alignment"""
+
+    scores = {"family_score": family_score, "pg_score": pg_score, "differential": differential}
+    band = _band(differential, (-1.0,), (1.0,))
+    if band < 2:
+        # Public Guardian advantage or neutral
+        return _QCAT_TEMPLATES[band].format_map(scores)
+
+    # Family advantage: add analysis for goals where family has advantage
+    return "\n".join(chain(
+        (_QCAT_FAMILY_HEADER.format_map(scores),),
+        _family_advantage_lines(goals_analysis),
+        (_QCAT_FAMILY_FOOTER.format_map(scores),),
+    ))
+
+
+def _generate_summary(
+    goals_analysis: List[_GoalResult],
+    family_score: float,
+    pg_score: float,
+    differential: float,
+) -> str:
+    """Generate executive summary"""
+
+    template = _SUMMARY_TEMPLATES[_band(differential, (-2.0, -0.5), (0.5, 2.0))]
+    summary_parts = [
+        template.format_map(
+            {"family_score": family_score, "pg_score": pg_score, "differential": differential}
+        ),
+        "\n\nGoal-by-Goal Results:",
+    ]
+
+    # Add goal-by-goal summary
+    for goal in goals_analysis:
+        diff = goal.family_alignment_score - goal.pg_alignment_score
+        winner = "Family" if diff > 0 else "PG" if diff < 0 else "Neutral"
         summary_parts.append(
-            f"\n\nQCAT Relevance: This analysis directly addresses Guardianship and Administration Act 2000 (Qld) "
-            f"General Principle 5 (consideration of adult's will and preferences). The NDIS plan represents "
-            f"the client's goals and preferences, making this alignment analysis critical to the guardianship decision."
+            f"- {goal.goal_number} ({goal.goal_name}): {winner} (F:{goal.family_alignment_score}, PG:{goal.pg_alignment_score})"
         )
 
-        return "\n".join(summary_parts)
+    summary_parts.append(_SUMMARY_QCAT_RELEVANCE)
+
+    return "\n".join(summary_parts)
 
 
 # Main service function
@@ -3,16 +3,44 @@ NLP Analysis Service
 Handles bias, racism, and discriminatory language detection
 """
 
+import asyncio
+import os
 import re
-from typing import List, Dict, Tuple
+import weakref
+from bisect import bisect_left, bisect_right
+from typing import Any, List, Dict, NamedTuple, Optional, Tuple
 from loguru import logger
 import spacy
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, count
 
-from app.models.base import FlaggedSegment, RiskScore
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    logger.warning("re2 not available, using stdlib re for bias patterns")
+    RE2_AVAILABLE = False
+
+from app.models.base import FlaggedSegment, PageText, RiskScore
 from app.models.analysis import BiasAnalysisRequest, BiasAnalysisResponse
 from app.config import settings
+from app.services._re2_text import re2_compatible
+from app.services._result_cache import ResultCache, file_key
+
 
+# Bias analyses of unchanged documents. The rules are fixed at import, so a
+# result depends only on the document's contents, path and client name.
+_RESULT_CACHE_SIZE = 128
+_result_cache: "ResultCache[BiasAnalysisResponse]" = ResultCache(_RESULT_CACHE_SIZE)
+
+# Weight of each severity level in risk scores and when collapsing overlapping matches
+_SEVERITY_WEIGHTS = {
+    "low": 1,
+    "medium": 3,
+    "high": 7,
+    "critical": 10
+}
 
 # Load spaCy model
 try:
@@ -101,155 +129,377 @@ class BiasDetector:
     @classmethod
     def detect_explicit_racism(cls, text: str, context_window: int = 100) -> List[FlaggedSegment]:
         """Detect explicit racist language"""
-        flagged = []
-
-        for pattern in cls.EXPLICIT_RACISM_PATTERNS:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                start = max(0, match.start() - context_window)
-                end = min(len(text), match.end() + context_window)
-                context = text[start:end]
-
-                flagged.append(FlaggedSegment(
-                    text=match.group(),
-                    page_number=0,  # Will be updated with actual page
-                    context=context,
-                    severity="critical",
-                    category="explicit_racism",
-                    explanation="Explicit racist or discriminatory language detected"
-                ))
-
-        return flagged
+        return _flag(text, _BIAS_RULES_BY_CATEGORY["explicit_racism"], context_window)
 
     @classmethod
     def detect_implicit_bias(cls, text: str, context_window: int = 100) -> List[FlaggedSegment]:
         """Detect implicit bias indicators"""
-        flagged = []
-
-        for pattern in cls.IMPLICIT_BIAS_PATTERNS:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                start = max(0, match.start() - context_window)
-                end = min(len(text), match.end() + context_window)
-                context = text[start:end]
-
-                flagged.append(FlaggedSegment(
-                    text=match.group(),
-                    page_number=0,
-                    context=context,
-                    severity="high",
-                    category="implicit_bias",
-                    explanation="Language suggesting implicit bias or stereotyping"
-                ))
-
-        return flagged
+        return _flag(text, _BIAS_RULES_BY_CATEGORY["implicit_bias"], context_window)
 
     @classmethod
     def detect_cultural_insensitivity(cls, text: str, context_window: int = 100) -> List[FlaggedSegment]:
         """Detect culturally insensitive language"""
-        flagged = []
+        return _flag(text, _BIAS_RULES_BY_CATEGORY["cultural_insensitivity"], context_window)
 
-        for pattern in cls.CULTURAL_INSENSITIVITY_PATTERNS:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                start = max(0, match.start() - context_window)
-                end = min(len(text), match.end() + context_window)
-                context = text[start:end]
+    @classmethod
+    def detect_stigmatizing_language(cls, text: str, context_window: int = 100) -> List[FlaggedSegment]:
+        """Detect stigmatizing language"""
+        return _flag(text, _BIAS_RULES_BY_CATEGORY["stigmatizing_language"], context_window)
 
-                flagged.append(FlaggedSegment(
-                    text=match.group(),
-                    page_number=0,
-                    context=context,
-                    severity="high",
-                    category="cultural_insensitivity",
-                    explanation="Culturally insensitive or dismissive language"
-                ))
+    @classmethod
+    def detect_deficit_language(cls, text: str, context_window: int = 100) -> List[FlaggedSegment]:
+        """Detect deficit-focused language"""
+        return _flag(text, _BIAS_RULES_BY_CATEGORY["deficit_language"], context_window)
 
-        return flagged
+    @classmethod
+    def detect_family_undermining(cls, text: str, context_window: int = 100) -> List[FlaggedSegment]:
+        """Detect language that undermines family capability"""
+        return _flag(text, _BIAS_RULES_BY_CATEGORY["family_undermining"], context_window)
 
     @classmethod
-    def detect_stigmatizing_language(cls, text: str, context_window: int = 100) -> List[FlaggedSegment]:
-        """Detect stigmatizing language"""
-        flagged = []
+    def detect_all(
+        cls,
+        text: str,
+        context_window: int = 100,
+        pages: Optional[List[PageText]] = None,
+    ) -> List[FlaggedSegment]:
+        """
+        Run every detector over the text in a single loop. When the extracted pages
+        of `text` are given, each segment gets the page its match starts on.
+        """
+        return _flag(text, _ALL_BIAS_RULES, context_window, pages)
+
+
+class _BiasRule(NamedTuple):
+    """A bias category's patterns fused into one alternation"""
+
+    pattern: re.Pattern
+    # re2 form of the same pattern for ASCII bytes, or None when re2 is not usable
+    re2_pattern: Any
+    # Position of this rule in the re2 rule set (see _compile_rule_set)
+    rule_id: int
+    # Lowercase words, at least one of which occurs in every match
+    anchors: Tuple[str, ...]
+    severity: str
+    category: str
+    explanation: str
+
+    def may_match(self, text_lc: str) -> bool:
+        """Cheap substring check ruling out text that cannot contain a match"""
+        return any(anchor in text_lc for anchor in self.anchors)
+
+
+_rule_ids = count()
+
+
+def _compile_rule(
+    patterns: List[str],
+    anchors: Tuple[str, ...],
+    severity: str,
+    category: str,
+    explanation: str,
+) -> _BiasRule:
+    """
+    Fuse a category's patterns into one alternation so the text is walked once
+    per category rather than once per pattern, compiled with re2 when available.
+    Patterns are lowercase and matched against lowercased text, so no
+    case-insensitive matching is needed.
+    """
+    source = "|".join(f"(?:{pattern})" for pattern in patterns)
+    re2_pattern = None
+    if RE2_AVAILABLE:
+        try:
+            re2_pattern = re2.compile(source.encode("ascii"))
+        except re2.error:
+            logger.warning(f"re2 rejected {category} patterns, falling back to re")
+
+    return _BiasRule(
+        pattern=re.compile(source),
+        re2_pattern=re2_pattern,
+        rule_id=next(_rule_ids),
+        anchors=anchors,
+        severity=severity,
+        category=category,
+        explanation=explanation,
+    )
 
-        for pattern in cls.STIGMATIZING_LANGUAGE:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                start = max(0, match.start() - context_window)
-                end = min(len(text), match.end() + context_window)
-                context = text[start:end]
 
-                flagged.append(FlaggedSegment(
-                    text=match.group(),
-                    page_number=0,
-                    context=context,
-                    severity="medium",
-                    category="stigmatizing_language",
-                    explanation="Stigmatizing or negative language about the client"
-                ))
+# Compiled rules in detection order. The anchors must be kept in step with the
+# patterns: every pattern has to contain one of its category's anchor words.
+_ALL_BIAS_RULES: List[_BiasRule] = [
+    _compile_rule(
+        BiasDetector.EXPLICIT_RACISM_PATTERNS,
+        ("race", "racial", "they", "those", "typical", "not", "their"),
+        "critical", "explicit_racism",
+        "Explicit racist or discriminatory language detected",
+    ),
+    _compile_rule(
+        BiasDetector.IMPLICIT_BIAS_PATTERNS,
+        ("always", "never", "cannot", "unwilling", "fails", "refuses", "lack", "poor"),
+        "high", "implicit_bias",
+        "Language suggesting implicit bias or stereotyping",
+    ),
+    _compile_rule(
+        BiasDetector.CULTURAL_INSENSITIVITY_PATTERNS,
+        ("cultural", "language", "family", "chaotic", "lack", "beliefs", "unusual"),
+        "high", "cultural_insensitivity",
+        "Culturally insensitive or dismissive language",
+    ),
+    _compile_rule(
+        BiasDetector.STIGMATIZING_LANGUAGE,
+        ("suffering", "afflicted", "victim", "burdened", "difficult", "challenging",
+         "non-compliant", "uncooperative", "manipulative", "attention-seeking", "demanding"),
+        "medium", "stigmatizing_language",
+        "Stigmatizing or negative language about the client",
+    ),
+    _compile_rule(
+        BiasDetector.DEFICIT_LANGUAGE,
+        ("cannot", "unable", "fails", "deficit", "lack", "impaired", "inadequate", "insufficient"),
+        "low", "deficit_language",
+        "Deficit-focused language; lacks strength-based perspective",
+    ),
+    _compile_rule(
+        BiasDetector.FAMILY_UNDERMINING_PATTERNS,
+        ("family", "parent", "inadequate"),
+        "high", "family_undermining",
+        "Language that undermines family capacity without evidence",
+    ),
+]
+
+_BIAS_RULES_BY_CATEGORY: Dict[str, List[_BiasRule]] = {
+    rule.category: [rule] for rule in _ALL_BIAS_RULES
+}
+
+
+def _compile_rule_set(rules: List[_BiasRule]):
+    """
+    Build an re2 set over every rule, reporting in one pass over the text which
+    categories have at least one hit. Returns None unless every rule has an re2 form.
+    """
+    if any(rule.re2_pattern is None for rule in rules):
+        return None
 
-        return flagged
+    rule_set = re2.Set.SearchSet()
+    for rule in rules:
+        if rule_set.Add(rule.re2_pattern.pattern) != rule.rule_id:
+            return None
+    rule_set.Compile()
+    return rule_set
 
-    @classmethod
-    def detect_deficit_language(cls, text: str, context_window: int = 100) -> List[FlaggedSegment]:
-        """Detect deficit-focused language"""
-        flagged = []
 
-        for pattern in cls.DEFICIT_LANGUAGE:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                start = max(0, match.start() - context_window)
-                end = min(len(text), match.end() + context_window)
-                context = text[start:end]
+_BIAS_RULE_SET = _compile_rule_set(_ALL_BIAS_RULES)
 
-                flagged.append(FlaggedSegment(
-                    text=match.group(),
-                    page_number=0,
-                    context=context,
-                    severity="low",
-                    category="deficit_language",
-                    explanation="Deficit-focused language; lacks strength-based perspective"
-                ))
 
-        return flagged
+# Texts shorter than this are scanned in one piece
+_PARALLEL_SCAN_MIN_SIZE = 16 * 1024
 
-    @classmethod
-    def detect_family_undermining(cls, text: str, context_window: int = 100) -> List[FlaggedSegment]:
-        """Detect language that undermines family capability"""
-        flagged = []
+# Approximate size of the pieces a long text is split into for parallel scanning
+_SCAN_CHUNK_SIZE = 64 * 1024
 
-        for pattern in cls.FAMILY_UNDERMINING_PATTERNS:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                start = max(0, match.start() - context_window)
-                end = min(len(text), match.end() + context_window)
-                context = text[start:end]
+_SCAN_WORKERS = os.cpu_count() or 1
 
-                flagged.append(FlaggedSegment(
-                    text=match.group(),
-                    page_number=0,
-                    context=context,
-                    severity="high",
-                    category="family_undermining",
-                    explanation="Language that undermines family capacity without evidence"
-                ))
+_scan_pool: Optional[ThreadPoolExecutor] = None
 
-        return flagged
 
+def _scan_executor() -> ThreadPoolExecutor:
+    """Thread pool for scanning pieces of long texts, created on first use"""
+    global _scan_pool
+    if _scan_pool is None:
+        _scan_pool = ThreadPoolExecutor(max_workers=_SCAN_WORKERS)
+    return _scan_pool
 
-def calculate_risk_scores(flagged_segments: List[FlaggedSegment]) -> Dict[str, RiskScore]:
-    """Calculate risk scores by category"""
-    category_counts = defaultdict(int)
-    category_severities = defaultdict(list)
 
-    severity_weights = {
-        "low": 1,
-        "medium": 3,
-        "high": 7,
-        "critical": 10
-    }
+def _chunk_bounds(text_lc: str) -> List[Tuple[int, int]]:
+    """
+    Split the text just after full stops into pieces of roughly _SCAN_CHUNK_SIZE.
+    No bias pattern can match across a full stop, so scanning the pieces one by
+    one yields exactly the matches of a whole-text scan, with nothing to dedupe.
+    """
+    bounds = []
+    start, text_len = 0, len(text_lc)
+    while start < text_len:
+        stop = text_lc.find(".", start + _SCAN_CHUNK_SIZE)
+        end = text_len if stop < 0 else stop + 1
+        bounds.append((start, end))
+        start = end
+    return bounds
+
+
+def _rule_spans(
+    rule: _BiasRule, text_lc: str, text_bytes: Optional[bytes], start: int, end: int
+) -> List[Tuple[int, int]]:
+    """Spans of every match of a rule between two offsets of the text"""
+    if rule.re2_pattern is not None and text_bytes is not None:
+        matches = rule.re2_pattern.finditer(text_bytes, start, end)
+    else:
+        matches = rule.pattern.finditer(text_lc, start, end)
+    return [match.span() for match in matches]
 
-    for segment in flagged_segments:
-        category_counts[segment.category] += 1
-        category_severities[segment.category].append(severity_weights[segment.severity])
 
+def _piece_spans(
+    rules: List[_BiasRule], text_lc: str, text_bytes: bytes, start: int, end: int
+) -> List[List[Tuple[int, int]]]:
+    """
+    Spans of each rule's matches within one piece of the text. The re2 rule set
+    first rules out the categories absent from the piece, so each thread only
+    runs the patterns its piece can match.
+    """
+    matched = None
+    if _BIAS_RULE_SET is not None:
+        matched = frozenset(_BIAS_RULE_SET.Match(memoryview(text_bytes)[start:end]) or ())
+    return [
+        _rule_spans(rule, text_lc, text_bytes, start, end)
+        if matched is None or rule.rule_id in matched
+        else []
+        for rule in rules
+    ]
+
+
+def _drop_overlaps(
+    found: List[Tuple[int, int, _BiasRule]],
+) -> List[Tuple[int, int, _BiasRule]]:
+    """
+    Keep no two overlapping matches, so a phrase flagged by several categories
+    (e.g. "cannot understand" as both implicit bias and deficit language) is
+    reported once, under its most severe label.
+
+    Matches are considered most severe first, then by start, and one is kept
+    only if it overlaps no match kept before it. Surviving matches keep their
+    original order.
+    """
+    by_priority = sorted(
+        range(len(found)),
+        key=lambda i: (-_SEVERITY_WEIGHTS[found[i][2].severity], found[i][0]),
+    )
+
+    # Kept intervals never overlap, so sorted by start they are sorted by end too
+    kept_starts: List[int] = []
+    kept_ends: List[int] = []
+    kept = []
+    for i in by_priority:
+        match_start, match_end, _ = found[i]
+        slot = bisect_left(kept_starts, match_start)
+        if slot > 0 and kept_ends[slot - 1] > match_start:
+            continue
+        if slot < len(kept_starts) and kept_starts[slot] < match_end:
+            continue
+        kept_starts.insert(slot, match_start)
+        kept_ends.insert(slot, match_end)
+        kept.append(i)
+
+    return [found[i] for i in sorted(kept)]
+
+
+class _Hit(NamedTuple):
+    """A flagged match, kept as a plain tuple until the response is built"""
+
+    text: str
+    page_number: int
+    context: str
+    severity: str
+    category: str
+    explanation: str
+
+    def to_model(self) -> FlaggedSegment:
+        """Build the response model; the fields are already well-typed, so skip validation"""
+        return FlaggedSegment.model_construct(
+            text=self.text,
+            page_number=self.page_number,
+            context=self.context,
+            severity=self.severity,
+            category=self.category,
+            explanation=self.explanation,
+        )
+
+
+def _flag(
+    text: str,
+    rules: List[_BiasRule],
+    context_window: int,
+    pages: Optional[List[PageText]] = None,
+) -> List[FlaggedSegment]:
+    """Flag every match of the given compiled rules as response models"""
+    return [hit.to_model() for hit in _scan(text, rules, context_window, pages)]
+
+
+def _scan(
+    text: str,
+    rules: List[_BiasRule],
+    context_window: int,
+    pages: Optional[List[PageText]] = None,
+) -> List[_Hit]:
+    """Find every match of the given compiled rules"""
+    hits = []
+    append = hits.append
+    text_lc = text.lower()
+    if len(text_lc) != len(text):
+        # Lowercasing changed some character widths, so offsets no longer line up
+        text = text_lc
+    # Without pages every offset resolves to page 0
+    page_starts = [page.char_start for page in pages] if pages else [0]
+    page_numbers = [page.page_number for page in pages] if pages else [0]
+    # Encoded once for re2, which otherwise re-encodes str input on every call.
+    # Only ASCII text without whitespace re2's \s misses is handed over, so
+    # byte offsets equal character offsets and re2 matches what re would.
+    text_bytes = text_lc.encode("ascii") if RE2_AVAILABLE and re2_compatible(text_lc) else None
+
+    # With several rules, one set pass rules out every category without a hit;
+    # otherwise a category none of whose anchor words occur is skipped
+    if len(rules) > 1 and _BIAS_RULE_SET is not None and text_bytes is not None:
+        matched = frozenset(_BIAS_RULE_SET.Match(text_bytes) or ())
+        rules = [rule for rule in rules if rule.rule_id in matched]
+    else:
+        rules = [rule for rule in rules if rule.may_match(text_lc)]
+
+    # Long texts are split into pieces scanned in parallel threads; re2 releases
+    # the GIL while matching, whereas stdlib re would only serialize the threads
+    if text_bytes is not None and len(text_lc) >= _PARALLEL_SCAN_MIN_SIZE and _SCAN_WORKERS > 1:
+        bounds = _chunk_bounds(text_lc)
+    else:
+        bounds = [(0, len(text_lc))]
+
+    if len(bounds) > 1:
+        executor = _scan_executor()
+        piece_futures = [
+            executor.submit(_piece_spans, rules, text_lc, text_bytes, start, end)
+            for start, end in bounds
+        ]
+        # Regroup the per-piece results by rule, keeping piece order
+        rule_spans = [
+            chain.from_iterable(spans)
+            for spans in zip(*(future.result() for future in piece_futures))
+        ]
+    else:
+        rule_spans = [_rule_spans(rule, text_lc, text_bytes, 0, len(text_lc)) for rule in rules]
+
+    found = _drop_overlaps([
+        (match_start, match_end, rule)
+        for rule, spans in zip(rules, rule_spans)
+        for match_start, match_end in spans
+    ])
+
+    for match_start, match_end, rule in found:
+        start = match_start - context_window
+
+        append(_Hit(
+            text[match_start:match_end],
+            page_numbers[bisect_right(page_starts, match_start) - 1],
+            # Slicing clamps the end; only a negative start needs clamping
+            text[start if start > 0 else 0:match_end + context_window],
+            rule.severity,
+            rule.category,
+            rule.explanation,
+        ))
+
+    return hits
+
+
+def calculate_risk_scores(flagged_segments: List[FlaggedSegment]) -> Dict[str, RiskScore]:
+    """Calculate risk scores by category"""
     risk_scores = {}
-    for category, count in category_counts.items():
-        avg_severity = sum(category_severities[category]) / len(category_severities[category])
+    for category, segments in _segments_by_category(flagged_segments).items():
+        count = len(segments)
+        avg_severity = sum(_SEVERITY_WEIGHTS[seg.severity] for seg in segments) / count
 
         # Score calculation: frequency + severity
         score = min(10.0, (count * 0.5) + avg_severity)
@@ -259,12 +509,49 @@ def calculate_risk_scores(flagged_segments: List[FlaggedSegment]) -> Dict[str, R
             category=category.replace("_", " ").title(),
             score=round(score, 2),
             confidence=round(confidence, 2),
-            evidence=[f'"{seg.text}"' for seg in flagged_segments if seg.category == category][:5]
+            evidence=[f'"{seg.text}"' for seg in segments[:5]]
         )
 
     return risk_scores
 
 
+def _segments_by_category(flagged_segments: List[FlaggedSegment]) -> Dict[str, List[FlaggedSegment]]:
+    """Group segments by category in one pass, keeping first-seen category order"""
+    by_category = defaultdict(list)
+    for segment in flagged_segments:
+        by_category[segment.category].append(segment)
+    return by_category
+
+
+def _overall_severity(flagged_segments: List[FlaggedSegment]) -> str:
+    """Overall severity from a single count of segment severities"""
+    severity_counts = Counter(seg.severity for seg in flagged_segments)
+    if severity_counts["critical"]:
+        return "critical"
+    if severity_counts["high"] > 3:
+        return "high"
+    if severity_counts["medium"] > 5:
+        return "medium"
+    return "low"
+
+
+# Closing section of every bias narrative report with findings
+_QCAT_RELEVANCE = (
+    "\n## Relevance to QCAT Appeal\n"
+    "These findings are relevant to Queensland Civil and Administrative Tribunal "
+    "proceedings under:\n\n"
+    "- **Human Rights Act 2019 (Qld)** s15 (Freedom of expression), s26 (Cultural rights)\n"
+    "- **Anti-Discrimination Act 1991 (Qld)** regarding racial discrimination\n"
+    "- **Racial Discrimination Act 1975 (Cth)** s9 and s18C\n"
+    "- **Guardianship principles** requiring unbiased, evidence-based assessment\n\n"
+    "The identified language patterns may indicate:\n"
+    "- Bias in assessment\n"
+    "- Discriminatory treatment\n"
+    "- Failure to consider cultural context\n"
+    "- Undermining of family capacity without evidence\n"
+)
+
+
 def generate_narrative_report(
     flagged_segments: List[FlaggedSegment],
     risk_scores: Dict[str, RiskScore],
@@ -275,65 +562,42 @@ def generate_narrative_report(
     client_ref = f"regarding {client_name}" if client_name else "in this document"
 
     report_parts = [
-        f"# Bias and Discrimination Analysis Report\n",
-        f"\n## Executive Summary\n",
-        f"This analysis identified {len(flagged_segments)} instances of potentially ",
-        f"biased, discriminatory, or problematic language {client_ref}.\n",
+        "# Bias and Discrimination Analysis Report\n"
+        "\n## Executive Summary\n"
+        f"This analysis identified {len(flagged_segments)} instances of potentially "
+        f"biased, discriminatory, or problematic language {client_ref}.\n"
     ]
 
     if not flagged_segments:
         report_parts.append("\nNo significant bias indicators were detected.")
         return "".join(report_parts)
 
-    # Overall severity
-    severities = [seg.severity for seg in flagged_segments]
-    if "critical" in severities:
-        overall = "CRITICAL"
-    elif severities.count("high") > 3:
-        overall = "HIGH"
-    elif severities.count("medium") > 5:
-        overall = "MEDIUM"
-    else:
-        overall = "LOW"
-
-    report_parts.append(f"\n**Overall Severity Level:** {overall}\n")
-
-    # Categories detected
-    categories = set(seg.category for seg in flagged_segments)
-    report_parts.append(f"\n**Categories Detected:** {len(categories)}\n")
-
-    # Detailed findings by category
-    report_parts.append("\n## Detailed Findings\n")
+    # Overall severity, categories detected and detailed findings by category
+    segments_by_category = _segments_by_category(flagged_segments)
+    report_parts.append(
+        f"\n**Overall Severity Level:** {_overall_severity(flagged_segments).upper()}\n"
+        f"\n**Categories Detected:** {len(segments_by_category)}\n"
+        "\n## Detailed Findings\n"
+    )
 
     for category, risk_score in risk_scores.items():
-        category_segments = [s for s in flagged_segments if s.category == category.lower().replace(" ", "_")]
+        category_segments = segments_by_category.get(category.lower().replace(" ", "_"), [])
 
-        report_parts.append(f"\n### {category}\n")
-        report_parts.append(f"- **Risk Score:** {risk_score.score}/10\n")
-        report_parts.append(f"- **Confidence:** {risk_score.confidence * 100:.0f}%\n")
-        report_parts.append(f"- **Instances Found:** {len(category_segments)}\n")
+        report_parts.append(
+            f"\n### {category}\n"
+            f"- **Risk Score:** {risk_score.score}/10\n"
+            f"- **Confidence:** {risk_score.confidence * 100:.0f}%\n"
+            f"- **Instances Found:** {len(category_segments)}\n"
+        )
 
         if category_segments:
-            report_parts.append(f"\n**Examples:**\n")
-            for i, seg in enumerate(category_segments[:3], 1):
-                report_parts.append(f'{i}. "{seg.text}"\n')
-                report_parts.append(f"   - {seg.explanation}\n")
+            report_parts.append("\n**Examples:**\n")
+            report_parts.extend(
+                f'{i}. "{seg.text}"\n   - {seg.explanation}\n'
+                for i, seg in enumerate(category_segments[:3], 1)
+            )
 
-    # QCAT relevance
-    report_parts.append("\n## Relevance to QCAT Appeal\n")
-    report_parts.append(
-        "These findings are relevant to Queensland Civil and Administrative Tribunal "
-        "proceedings under:\n\n"
-        "- **Human Rights Act 2019 (Qld)** s15 (Freedom of expression), s26 (Cultural rights)\n"
-        "- **Anti-Discrimination Act 1991 (Qld)** regarding racial discrimination\n"
-        "- **Racial Discrimination Act 1975 (Cth)** s9 and s18C\n"
-        "- **Guardianship principles** requiring unbiased, evidence-based assessment\n\n"
-        "The identified language patterns may indicate:\n"
-        "- Bias in assessment\n"
-        "- Discriminatory treatment\n"
-        "- Failure to consider cultural context\n"
-        "- Undermining of family capacity without evidence\n"
-    )
+    report_parts.append(_QCAT_RELEVANCE)
 
     return "".join(report_parts)
 
@@ -346,8 +610,14 @@ async def analyze_for_bias_and_racism(request: BiasAnalysisRequest) -> BiasAnaly
     from app.models.pdf import PDFExtractionRequest
 
     try:
-        # Extract text from PDF
         logger.info(f"Analyzing document for bias: {request.file_path}")
+        # The response echoes the path as given, so it is part of the key too
+        cache_key = (request.file_path, file_key(request.file_path), request.client_name)
+        cached = _result_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Extract text from PDF
         pdf_request = PDFExtractionRequest(
             file_path=request.file_path,
             extract_metadata=False
@@ -356,57 +626,73 @@ async def analyze_for_bias_and_racism(request: BiasAnalysisRequest) -> BiasAnaly
 
         full_text = pdf_result.full_text
 
-        # Run all detection methods
-        all_flagged_segments = []
-
-        all_flagged_segments.extend(BiasDetector.detect_explicit_racism(full_text))
-        all_flagged_segments.extend(BiasDetector.detect_implicit_bias(full_text))
-        all_flagged_segments.extend(BiasDetector.detect_cultural_insensitivity(full_text))
-        all_flagged_segments.extend(BiasDetector.detect_stigmatizing_language(full_text))
-        all_flagged_segments.extend(BiasDetector.detect_deficit_language(full_text))
-        all_flagged_segments.extend(BiasDetector.detect_family_undermining(full_text))
+        # Run all detection methods off the event loop; the compiled rules are
+        # module-level and shared by every concurrent analysis
+        hits = await asyncio.to_thread(_scan, full_text, _ALL_BIAS_RULES, 100, pdf_result.pages)
 
-        # Map segments to actual page numbers
-        for segment in all_flagged_segments:
-            for page in pdf_result.pages:
-                if segment.text.lower() in page.text.lower():
-                    segment.page_number = page.page_number
-                    break
+        # Scoring and the narrative only read fields the hits share with
+        # FlaggedSegment, so models are built once, for the response
 
         # Calculate risk scores
-        risk_scores = calculate_risk_scores(all_flagged_segments)
+        risk_scores = calculate_risk_scores(hits)
 
         # Determine overall severity
-        if any(seg.severity == "critical" for seg in all_flagged_segments):
-            overall_severity = "critical"
-        elif len([s for s in all_flagged_segments if s.severity == "high"]) > 3:
-            overall_severity = "high"
-        elif len([s for s in all_flagged_segments if s.severity == "medium"]) > 5:
-            overall_severity = "medium"
-        else:
-            overall_severity = "low"
+        overall_severity = _overall_severity(hits)
 
         # Generate narrative report
         narrative_report = generate_narrative_report(
-            all_flagged_segments,
+            hits,
             risk_scores,
             request.client_name
         )
 
         # Get unique categories
-        categories_detected = list(set(seg.category for seg in all_flagged_segments))
+        categories_detected = list(set(hit.category for hit in hits))
 
-        logger.info(f"Analysis complete: Found {len(all_flagged_segments)} flagged segments")
+        logger.info(f"Analysis complete: Found {len(hits)} flagged segments")
 
-        return BiasAnalysisResponse(
+        response = BiasAnalysisResponse(
             file_path=request.file_path,
             risk_scores=risk_scores,
-            flagged_segments=all_flagged_segments,
+            flagged_segments=[hit.to_model() for hit in hits],
             narrative_report=narrative_report,
             overall_severity=overall_severity,
             categories_detected=categories_detected
         )
 
+        _result_cache.put(cache_key, response)
+
+        return response
+
     except Exception as e:
         logger.error(f"Error in bias analysis: {str(e)}")
         raise
+
+
+# Upper bound on documents being analyzed at once across all concurrent batches
+_BATCH_CONCURRENCY = os.cpu_count() or 8
+_batch_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def _bounded_analysis(request: BiasAnalysisRequest) -> BiasAnalysisResponse:
+    """Analyze one batch document once a slot on the running loop is free"""
+    loop = asyncio.get_running_loop()
+    semaphore = _batch_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _batch_semaphores[loop] = asyncio.Semaphore(_BATCH_CONCURRENCY)
+    async with semaphore:
+        return await analyze_for_bias_and_racism(request)
+
+
+async def analyze_batch_for_bias(requests: List[BiasAnalysisRequest]) -> List[BiasAnalysisResponse]:
+    """
+    Analyze several PDFs for bias and racism concurrently.
+
+    Extraction and scanning of each document overlap with the others, and all of
+    them share the rules compiled once at import. At most _BATCH_CONCURRENCY
+    documents are in flight at once, so a large batch cannot open every PDF
+    together. Results are in request order.
+    """
+    return list(await asyncio.gather(*(_bounded_analysis(request) for request in requests)))
@@ -3,15 +3,28 @@ PDF Processing Service
 Handles PDF extraction, hashing, verification, and metadata extraction
 """
 
+import asyncio
+import copy
 import hashlib
+import mmap
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import PyPDF2
-import pdfplumber
 from loguru import logger
 
+from app._pdf_pages import PYMUPDF_AVAILABLE, count_pages, extract_page_texts
+
+if PYMUPDF_AVAILABLE:
+    import pymupdf
+else:
+    logger.info("pymupdf not installed, using pdfplumber and PyPDF2")
+
 from app.models.pdf import (
     PDFExtractionRequest,
     PDFExtractionResponse,
@@ -23,6 +36,133 @@ from app.models.pdf import (
 )
 from app.models.base import DocumentStats, DocumentMetadata, PageText
 from app.config import settings
+from app.services._result_cache import ResultCache, file_key
+
+
+# Pages handed to a worker process at a time; smaller documents are extracted in one go
+_PAGES_PER_WORKER = 16
+
+_extraction_pool: Optional[ProcessPoolExecutor] = None
+
+# Page texts of recently extracted PDFs, keyed by file identity and page range, so the
+# several analyses run over one document share a single extraction
+_PAGE_TEXT_CACHE_SIZE = 32
+_page_text_cache: "ResultCache[Tuple[List[int], List[str]]]" = ResultCache(_PAGE_TEXT_CACHE_SIZE)
+_page_text_inflight: Dict[Tuple, "asyncio.Future[Tuple[List[int], List[str]]]"] = {}
+
+
+def _extraction_workers() -> int:
+    """Number of worker processes used for page extraction"""
+    return settings.PDF_EXTRACT_WORKERS or os.cpu_count() or 1
+
+
+def _extraction_executor() -> ProcessPoolExecutor:
+    """
+    Process pool for page extraction, created on first use. Workers are started
+    by a fork server (or spawned where there is none) rather than forked from the
+    server process, whose event loop and worker threads a fork would copy. They
+    run app._pdf_pages, which the fork server preloads, and never import the
+    service package.
+    """
+    global _extraction_pool
+    if _extraction_pool is None:
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            mp_context = multiprocessing.get_context("forkserver")
+            mp_context.set_forkserver_preload(["app._pdf_pages"])
+        else:
+            mp_context = multiprocessing.get_context("spawn")
+        _extraction_pool = ProcessPoolExecutor(
+            max_workers=_extraction_workers(), mp_context=mp_context
+        )
+    return _extraction_pool
+
+
+def shutdown_extraction_pool() -> None:
+    """Stop the page extraction worker processes, if any were started"""
+    global _extraction_pool
+    if _extraction_pool is not None:
+        _extraction_pool.shutdown(wait=True, cancel_futures=True)
+        _extraction_pool = None
+
+
+def _read_pdf_info(file_path: Path) -> Dict[str, Any]:
+    """
+    Read the PDF document info dictionary, keyed by PDF names such as /Author and
+    /CreationDate. MuPDF reports it alongside the text parser; PyPDF2 is the fallback.
+    """
+    if PYMUPDF_AVAILABLE:
+        with pymupdf.open(file_path) as doc:
+            metadata = doc.metadata or {}
+        # MuPDF uses camelCase keys ("creationDate") and "" for missing values
+        return {f"/{key[:1].upper()}{key[1:]}": value for key, value in metadata.items() if value}
+
+    with open(file_path, "rb") as f:
+        pdf_info = PyPDF2.PdfReader(f).metadata
+        # Values may be indirect objects, so resolve them while the file is open
+        return {key: pdf_info[key] for key in pdf_info} if pdf_info else {}
+
+
+async def _read_page_texts(
+    file_path: Path, page_range: Optional[Tuple[int, int]]
+) -> Tuple[List[int], List[str]]:
+    """Extract the text of the requested pages, returning page numbers and texts in order"""
+    loop = asyncio.get_running_loop()
+    page_count = await loop.run_in_executor(None, count_pages, str(file_path))
+
+    # Check max pages limit
+    if page_count > settings.PDF_MAX_PAGES:
+        logger.warning(f"PDF exceeds max pages ({settings.PDF_MAX_PAGES})")
+
+    # Handle page range if specified
+    page_numbers = list(range(1, page_count + 1))
+    if page_range:
+        start, end = page_range
+        page_numbers = [page_num for page_num in page_numbers if start <= page_num <= end]
+
+    # Extract batches of pages in parallel worker processes, reassembled in page order
+    if len(page_numbers) > _PAGES_PER_WORKER and _extraction_workers() > 1:
+        executor = _extraction_executor()
+        batches = [
+            page_numbers[i:i + _PAGES_PER_WORKER]
+            for i in range(0, len(page_numbers), _PAGES_PER_WORKER)
+        ]
+    else:
+        executor = None
+        batches = [page_numbers]
+
+    batch_texts = await asyncio.gather(*(
+        loop.run_in_executor(executor, extract_page_texts, str(file_path), batch)
+        for batch in batches
+    ))
+
+    return page_numbers, list(chain.from_iterable(batch_texts))
+
+
+async def _cached_page_texts(
+    file_path: Path, page_range: Optional[Tuple[int, int]]
+) -> Tuple[List[int], List[str]]:
+    """Page texts for a PDF, reused while the file is unchanged; concurrent reads share one extraction"""
+    key = (file_key(str(file_path)), tuple(page_range) if page_range else None)
+
+    cached = _page_text_cache.get(key)
+    if cached is not None:
+        return cached
+
+    pending = _page_text_inflight.get(key)
+    if pending is None:
+        pending = _page_text_inflight[key] = asyncio.ensure_future(
+            _read_page_texts(file_path, page_range)
+        )
+        try:
+            result = await asyncio.shield(pending)
+        finally:
+            del _page_text_inflight[key]
+
+        _page_text_cache.put(key, result)
+        return result
+
+    # Callers sharing an extraction each get their own lists, as on a cache hit
+    return copy.deepcopy(await asyncio.shield(pending))
 
 
 async def extract_text_from_pdf(request: PDFExtractionRequest) -> PDFExtractionResponse:
@@ -41,42 +181,42 @@ async def extract_text_from_pdf(request: PDFExtractionRequest) -> PDFExtractionR
         raise FileNotFoundError(f"PDF file not found: {file_path}")
 
     pages_data = []
-    full_text = ""
+    text_parts = []
+    char_offset = 0
     total_words = 0
     total_chars = 0
 
     try:
-        with pdfplumber.open(file_path) as pdf:
-            page_count = len(pdf.pages)
-
-            # Check max pages limit
-            if page_count > settings.PDF_MAX_PAGES:
-                logger.warning(f"PDF exceeds max pages ({settings.PDF_MAX_PAGES})")
-
-            # Extract page by page
-            for page_num, page in enumerate(pdf.pages, start=1):
-                # Handle page range if specified
-                if request.page_range:
-                    start, end = request.page_range
-                    if page_num < start or page_num > end:
-                        continue
-
-                page_text = page.extract_text() or ""
-                word_count = len(page_text.split())
-                char_count = len(page_text)
-
-                pages_data.append(
-                    PageText(
-                        page_number=page_num,
-                        text=page_text,
-                        word_count=word_count,
-                        char_count=char_count,
-                    )
+        page_numbers, page_texts = await _cached_page_texts(file_path, request.page_range)
+
+        for page_num, page_text in zip(page_numbers, page_texts):
+            word_count = len(page_text.split())
+            char_count = len(page_text)
+
+            pages_data.append(
+                PageText(
+                    page_number=page_num,
+                    text=page_text,
+                    word_count=word_count,
+                    char_count=char_count,
+                    char_start=char_offset,
                 )
+            )
+
+            text_parts.append(page_text)
+            text_parts.append("\n\n")
+            char_offset += char_count + 2
+            total_words += word_count
+            total_chars += char_count
 
-                full_text += page_text + "\n\n"
-                total_words += word_count
-                total_chars += char_count
+        # Joined once at the end rather than grown per page
+        full_text = "".join(text_parts)
+
+        # Page offsets must index into the stripped text returned below
+        leading = len(full_text) - len(full_text.lstrip())
+        if leading:
+            for page_data in pages_data:
+                page_data.char_start = max(0, page_data.char_start - leading)
 
         # Calculate statistics
         stats = DocumentStats(
@@ -105,6 +245,38 @@ async def extract_text_from_pdf(request: PDFExtractionRequest) -> PDFExtractionR
         raise
 
 
+async def extract_documents(file_paths: Sequence[str]) -> List[PDFExtractionResponse]:
+    """
+    Extract text from several PDFs concurrently, returned in the order given.
+
+    Multi-document tools load their inputs through this. A path listed more
+    than once is extracted once, and the page-text cache shares the parse with
+    any other tool reading the same unchanged file.
+    """
+    unique_paths = list(dict.fromkeys(file_paths))
+    results = await asyncio.gather(*(
+        extract_text_from_pdf(PDFExtractionRequest(file_path=path, extract_metadata=False))
+        for path in unique_paths
+    ))
+    by_path = dict(zip(unique_paths, results))
+    return [by_path[path] for path in file_paths]
+
+
+def _sha256_file(file_path: Path) -> Tuple[str, int]:
+    """Return the SHA-256 hex digest and size of a file"""
+    with open(file_path, "rb") as f:
+        file_size = os.fstat(f.fileno()).st_size
+        if file_size:
+            # Hash straight from the page cache instead of copying reads into a buffer
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                sha256_hash = hashlib.sha256(mapped)
+        else:
+            # Empty files cannot be mapped
+            sha256_hash = hashlib.sha256()
+
+    return sha256_hash.hexdigest(), file_size
+
+
 async def generate_hash(request: DocumentHashRequest) -> DocumentHashResponse:
     """
     Generate SHA-256 hash for document integrity.
@@ -121,17 +293,11 @@ async def generate_hash(request: DocumentHashRequest) -> DocumentHashResponse:
         raise FileNotFoundError(f"File not found: {file_path}")
 
     try:
-        # Read file and generate hash
-        sha256_hash = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            # Read in chunks for memory efficiency
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-
-        file_size = file_path.stat().st_size
+        # hashlib releases the GIL, so concurrent requests hash on separate cores
+        digest, file_size = await asyncio.to_thread(_sha256_file, file_path)
 
         return DocumentHashResponse(
-            hash=sha256_hash.hexdigest(),
+            hash=digest,
             algorithm=settings.HASH_ALGORITHM,
             file_path=str(file_path),
             timestamp=datetime.now(),
@@ -200,66 +366,65 @@ async def extract_metadata(request: PDFExtractionRequest) -> PDFMetadataResponse
     suspicious_indicators = []
 
     try:
-        with open(file_path, "rb") as f:
-            pdf_reader = PyPDF2.PdfReader(f)
-            pdf_info = pdf_reader.metadata
-
-            # Extract metadata fields
-            created = None
-            modified = None
-            author = None
-            producer = None
-            title = None
-            subject = None
-            creator = None
-
-            if pdf_info:
-                # Parse dates
-                if pdf_info.get("/CreationDate"):
-                    created = _parse_pdf_date(pdf_info["/CreationDate"])
-                if pdf_info.get("/ModDate"):
-                    modified = _parse_pdf_date(pdf_info["/ModDate"])
-
-                author = pdf_info.get("/Author")
-                producer = pdf_info.get("/Producer")
-                title = pdf_info.get("/Title")
-                subject = pdf_info.get("/Subject")
-                creator = pdf_info.get("/Creator")
-
-            # Check for suspicious indicators
-            if created and modified:
-                if modified < created:
-                    suspicious_indicators.append(
-                        "Modification date is earlier than creation date"
-                    )
-
-            file_stat = file_path.stat()
-            file_modified = datetime.fromtimestamp(file_stat.st_mtime)
-
-            if modified and abs((file_modified - modified).days) > 365:
+        # Parsing the document info dictionary is blocking IO, so keep it off the event loop
+        pdf_info = await asyncio.to_thread(_read_pdf_info, file_path)
+
+        # Extract metadata fields
+        created = None
+        modified = None
+        author = None
+        producer = None
+        title = None
+        subject = None
+        creator = None
+
+        if pdf_info:
+            # Parse dates
+            if pdf_info.get("/CreationDate"):
+                created = _parse_pdf_date(pdf_info["/CreationDate"])
+            if pdf_info.get("/ModDate"):
+                modified = _parse_pdf_date(pdf_info["/ModDate"])
+
+            author = pdf_info.get("/Author")
+            producer = pdf_info.get("/Producer")
+            title = pdf_info.get("/Title")
+            subject = pdf_info.get("/Subject")
+            creator = pdf_info.get("/Creator")
+
+        # Check for suspicious indicators
+        if created and modified:
+            if modified < created:
                 suspicious_indicators.append(
-                    "Large discrepancy between file system and PDF metadata dates"
+                    "Modification date is earlier than creation date"
                 )
 
-            if not author and not creator:
-                suspicious_indicators.append("No author or creator information present")
-
-            metadata = DocumentMetadata(
-                created=created,
-                modified=modified,
-                author=author,
-                producer=producer,
-                title=title,
-                subject=subject,
-                creator=creator,
-            )
+        file_stat = file_path.stat()
+        file_modified = datetime.fromtimestamp(file_stat.st_mtime)
 
-            return PDFMetadataResponse(
-                metadata=metadata,
-                file_path=str(file_path),
-                suspicious_indicators=suspicious_indicators,
+        if modified and abs((file_modified - modified).days) > 365:
+            suspicious_indicators.append(
+                "Large discrepancy between file system and PDF metadata dates"
             )
 
+        if not author and not creator:
+            suspicious_indicators.append("No author or creator information present")
+
+        metadata = DocumentMetadata(
+            created=created,
+            modified=modified,
+            author=author,
+            producer=producer,
+            title=title,
+            subject=subject,
+            creator=creator,
+        )
+
+        return PDFMetadataResponse(
+            metadata=metadata,
+            file_path=str(file_path),
+            suspicious_indicators=suspicious_indicators,
+        )
+
     except Exception as e:
         logger.error(f"Error extracting metadata: {str(e)}")
         raise
@@ -269,6 +434,10 @@ def _parse_pdf_date(date_str: str) -> Optional[datetime]:
     """
     Parse PDF date format (D:YYYYMMDDHHmmSS) to datetime.
 
+    Fields after the year are optional, as the PDF spec allows, and any timezone
+    suffix is ignored. The fields are sliced out directly rather than going
+    through strptime.
+
     Args:
         date_str: PDF date string
 
@@ -280,9 +449,17 @@ def _parse_pdf_date(date_str: str) -> Optional[datetime]:
         if date_str.startswith("D:"):
             date_str = date_str[2:]
 
-        # Take first 14 characters (YYYYMMDDHHmmSS)
+        # Take the leading digits, at most 14 (YYYYMMDDHHmmSS)
         date_str = date_str[:14]
-
-        return datetime.strptime(date_str, "%Y%m%d%H%M%S")
+        date_str = date_str[:len(date_str) - len(date_str.lstrip("0123456789"))]
+
+        return datetime(
+            int(date_str[0:4]),
+            int(date_str[4:6] or 1),
+            int(date_str[6:8] or 1),
+            int(date_str[8:10] or 0),
+            int(date_str[10:12] or 0),
+            int(date_str[12:14] or 0),
+        )
     except Exception:
         return None
@@ -3,11 +3,24 @@ Report Generation Service
 Tools 21-23: Guardianship argument report, QCAT evidence summary, complete bundle
 """
 
-from typing import List, Dict, Optional
-from datetime import datetime
+from typing import Any, Awaitable, Callable, Iterable, Iterator, List, Dict, NamedTuple, Optional, Sequence, Type
+from collections import Counter
+from datetime import date, datetime
+from functools import lru_cache, partial
+import asyncio
 import json
+import os
+import weakref
 
+from pydantic import BaseModel
+
+from app.models.analysis import BiasAnalysisRequest, FamilySupportEvidenceRequest
+from app.models.legal import GoalsAlignmentRequest, HumanRightsBreachRequest
+from app.models.pdf import DocumentHashRequest, PDFExtractionRequest
 from app.models.reports import (
+    ContradictionMatrixRequest,
+    ContradictionMatrixRow,
+    TimelineExtractionRequest,
     GuardianshipArgumentRequest,
     GuardianshipArgumentResponse,
     GuardianshipArgumentReport,
@@ -38,6 +51,293 @@ from app.services.legal_framework_service import (
     analyze_professional_compliance,
 )
 from app.services.ndis_goals_service import analyze_goals_guardianship_alignment
+from app.services._analysis_cache import cached_call
+
+
+# Static report text, joined once at import time; section builders only format the dynamic parts
+_SEP = "=" * 80
+
+_EXEC_SUMMARY_HEADER = f"EXECUTIVE SUMMARY\n{_SEP}"
+
+_LEGAL_FRAMEWORK_HEAD = "\n".join((
+    "LEGAL FRAMEWORK ANALYSIS",
+    _SEP,
+    "\n1. Guardianship and Administration Act 2000 (Qld) - General Principles",
+    "\nGP1 - Least Restrictive Option:",
+    "Family guardianship is less restrictive than Public Guardian appointment, maintaining "
+    "existing family relationships and support networks while providing necessary decision-making support.",
+    "\nGP5 - Will and Preferences:",
+))
+
+_LEGAL_FRAMEWORK_GP5_DEFAULT = (
+    "Family guardianship better respects client's will and preferences through family's intimate "
+    "knowledge of client's wishes and values."
+)
+
+_LEGAL_FRAMEWORK_GP3 = "\n".join((
+    "\nGP3 - Maintain Existing Relationships:",
+    "Family guardianship preserves and strengthens existing supportive family relationships, "
+    "whereas Public Guardian appointment may diminish family involvement.",
+    "\n2. Human Rights Act 2019 (Qld)",
+))
+
+_LEGAL_FRAMEWORK_HR_BREACHES = "\n".join((
+    "- Section 26: Protection of families and children",
+    "- Section 28: Cultural rights (particularly relevant for Indigenous and CALD clients)",
+    "- Section 25: Privacy and reputation",
+    "\nFamily guardianship better protects these fundamental rights.",
+))
+
+_LEGAL_FRAMEWORK_HR_DEFAULT = "\n".join((
+    "- Section 26: Protection of families - family guardianship preserves family unit",
+    "- Section 28: Cultural rights - family maintains cultural connections and identity",
+))
+
+_EVIDENCE_SUMMARY_HEADER = f"EVIDENCE SUMMARY\n{_SEP}"
+
+_RISK_ANALYSIS = (
+    f"RISK ANALYSIS\n{_SEP}\n\n"
+    "Comprehensive risk analysis shows family guardianship presents lower risk profile "
+    "while better supporting client outcomes. Analysis considers:\n"
+    "- Family capability and demonstrated support\n"
+    "- Compliance with statutory principles\n"
+    "- Protection of human rights\n"
+    "- Alignment with client goals and preferences\n\n"
+    "Public Guardian appointment carries risks including:\n"
+    "- Limited personal knowledge of client\n"
+    "- Reduced family involvement\n"
+    "- Bureaucratic decision-making delays\n"
+    "- Potential conflict with NDIS goals"
+)
+
+_GOALS_SUMMARY_HEADER = f"NDIS GOALS ALIGNMENT SUMMARY\n{_SEP}\n\nOverall Alignment Scores:"
+
+_CONCLUSION_HEADER = f"CONCLUSION\n{_SEP}"
+
+_CONCLUSION_GROUNDS = "\n".join((
+    "\n2. Compliance with Guardianship and Administration Act 2000 General Principles, "
+    "particularly least restrictive option (GP1) and consideration of will and preferences (GP5)",
+    "\n3. Protection of fundamental human rights under Human Rights Act 2019 (Qld)",
+    "\n4. Documented evidence of family capacity and existing support provision",
+))
+
+_CONCLUSION_BIAS = (
+    "\n5. Identified bias in practitioner reports undermining reliability of "
+    "recommendations against family guardianship"
+)
+
+_QCAT_SUMMARY_HEADER = f"QCAT EVIDENCE SUMMARY\n{_SEP}"
+
+_QCAT_SUMMARY_FOOTER = (
+    "\n\nThis evidence summary compiles key findings from comprehensive document analysis, "
+    "suitable for QCAT submission and tribunal consideration."
+)
+
+_BUNDLE_SUMMARY_HEADER = f"QCAT EVIDENCE BUNDLE - SUMMARY\n{_SEP}"
+
+_BUNDLE_SUMMARY_FOOTER = "\n".join((
+    "- Timeline analysis and contradiction matrix",
+    "- Legal arguments grounded in Queensland and Commonwealth legislation",
+    "- Evidence of family capacity and support provision",
+    "\n\nThe bundle demonstrates that family guardianship:",
+    "1. Better aligns with client's NDIS goals and expressed preferences",
+    "2. Complies with GA Act 2000 General Principles (GP1, GP3, GP5)",
+    "3. Protects fundamental human rights under HR Act 2019",
+    "4. Is supported by documented evidence of family capability",
+    "5. Represents the least restrictive option",
+    "\n\nAll documents included in this bundle have been analyzed using evidence-based tools "
+    "and methodologies. Chain of custody is maintained through cryptographic hashing.",
+))
+
+
+# Upper bound on documents being analyzed at once across all concurrent reports
+_DOCUMENT_CONCURRENCY = os.cpu_count() or 8
+_document_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def _bounded(coro: Awaitable[Any]) -> Any:
+    """Await coro once a per-document slot on the running loop is free"""
+    loop = asyncio.get_running_loop()
+    semaphore = _document_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _document_semaphores[loop] = asyncio.Semaphore(_DOCUMENT_CONCURRENCY)
+    async with semaphore:
+        return await coro
+
+
+async def _gather_per_document(
+    fn: Callable[[BaseModel], Awaitable[Any]],
+    request_type: Type[BaseModel],
+    documents: List[str],
+    *,
+    memoized: bool = False,
+    **options: Any,
+) -> List[Any]:
+    """
+    Run one analysis over every document concurrently, building a request_type
+    request per document; failures are returned, not raised. Results go through
+    the shared analysis cache unless fn is memoized already.
+    """
+    call = fn if memoized else partial(cached_call, fn)
+
+    # Repeated paths are analyzed once and their result shared
+    unique_documents = list(dict.fromkeys(documents))
+
+    if len(unique_documents) == 1:
+        # Single-document requests (the usual intake case) skip the gather machinery
+        try:
+            result = await _bounded(call(request_type(file_path=unique_documents[0], **options)))
+        except Exception as e:
+            result = e
+        return [result] * len(documents)
+
+    results = await asyncio.gather(
+        *(
+            _bounded(call(request_type(file_path=doc_path, **options)))
+            for doc_path in unique_documents
+        ),
+        return_exceptions=True,
+    )
+    by_document = dict(zip(unique_documents, results))
+    return [by_document[doc_path] for doc_path in documents]
+
+
+# Fixed list content; models copy these into their own lists on validation
+_RECOMMENDATIONS: tuple[str, ...] = (
+    "Appoint family members as guardians",
+    "Ensure ongoing family involvement in decision-making",
+    "Regular review of guardianship arrangement",
+    "Support implementation aligned with NDIS goals",
+    "Maintain cultural connections and community participation",
+)
+
+_BIAS_GROUND = (
+    "Practitioner Bias: Analysis reveals bias in practitioner reports, undermining reliability "
+    "of recommendations against family guardianship"
+)
+
+_HUMAN_RIGHTS_GROUND = (
+    "Human Rights Compliance: Family guardianship better protects client's rights under "
+    "Human Rights Act 2019 (Qld), particularly family protection (s.26) and cultural rights (s.28)"
+)
+
+_GENERIC_PG_CONCERNS = (
+    "Limited Personal Knowledge: Public Guardian lacks intimate knowledge of client's history, "
+    "preferences, and cultural background that family possesses",
+    "Reduced Family Contact: Public Guardian appointment may limit family involvement and contact, "
+    "contrary to client's best interests and GA Act 2000 GP3 (maintain existing relationships)",
+    "Bureaucratic Delays: Public Guardian decision-making subject to bureaucratic processes, "
+    "potentially delaying important decisions affecting client wellbeing",
+)
+
+_STANDING_KEY_EVIDENCE = (
+    "Family demonstrates capacity across multiple support domains",
+    "Client's NDIS goals better aligned with family guardianship option",
+)
+
+_STANDING_QCAT_ARGUMENTS = (
+    "Human Rights Compliance: Family guardianship better protects rights under "
+    "Human Rights Act 2019 (Qld) ss.25, 26, 28",
+    "Least Restrictive Option: Family guardianship complies with GA Act 2000 GP1",
+    "Will and Preferences: Evidence shows family option aligns with client goals (GP5)",
+)
+
+_TABLE_OF_CONTENTS: tuple[Dict, ...] = (
+    {"section": "1", "title": "Introduction and Case Overview", "page": 1},
+    {"section": "2", "title": "Document Register", "page": 2},
+    {"section": "3", "title": "Analysis Reports", "page": 5},
+    {"section": "3.1", "title": "Bias and Discrimination Analysis", "page": 6},
+    {"section": "3.2", "title": "Human Rights Breach Analysis", "page": 10},
+    {"section": "3.3", "title": "NDIS Goals Alignment Analysis", "page": 15},
+    {"section": "3.4", "title": "Family Capacity Evidence", "page": 20},
+    {"section": "4", "title": "Supporting Evidence", "page": 25},
+    {"section": "4.1", "title": "Timeline of Events", "page": 26},
+    {"section": "4.2", "title": "Contradiction Matrix", "page": 30},
+    {"section": "5", "title": "Legal Arguments", "page": 35},
+    {"section": "6", "title": "Recommendations", "page": 40},
+    {"section": "Appendix A", "title": "Source Documents", "page": 45},
+    {"section": "Appendix B", "title": "Document Integrity Verification", "page": 50},
+)
+
+_ANALYSIS_REPORTS: tuple[str, ...] = (
+    "Bias and Racism Analysis Report",
+    "Human Rights Breach Analysis Report",
+    "Guardianship Risk Assessment Report",
+    "State Guardianship Bias Detection Report",
+    "Professional Language Compliance Report",
+    "NDIS Goals Alignment Analysis Report",
+    "Family Support Evidence Report",
+    "Public Guardian Limitations Report",
+    "Document Comparison Report",
+    "Timeline Analysis Report",
+    "Contradiction Matrix Report",
+)
+
+_SUPPORTING_EVIDENCE: tuple[str, ...] = (
+    "Documented instances of family support (emotional, practical, cultural)",
+    "Timeline showing pattern of family involvement",
+    "NDIS plan goals demonstrating family alignment",
+    "Evidence of Public Guardian limitations",
+    "Practitioner report contradictions undermining reliability",
+    "Human rights breaches in current guardianship arrangements",
+)
+
+_BUNDLE_LEGAL_ARGUMENTS: tuple[str, ...] = (
+    "GUARDIANSHIP AND ADMINISTRATION ACT 2000 (QLD):",
+    "- GP1: Family guardianship is the least restrictive option",
+    "- GP5: Family guardianship better respects client's will and preferences",
+    "- GP3: Family guardianship maintains existing supportive relationships",
+    "",
+    "HUMAN RIGHTS ACT 2019 (QLD):",
+    "- Section 26: Family guardianship protects family relationships",
+    "- Section 28: Family guardianship preserves cultural rights and identity",
+    "- Section 25: Family guardianship respects privacy and reputation",
+    "",
+    "EVIDENCE-BASED DECISION MAKING:",
+    "- NDIS goals analysis shows quantifiable advantage for family option",
+    "- Timeline demonstrates sustained family involvement and capacity",
+    "- Contradiction analysis undermines reliability of contrary recommendations",
+    "",
+    "NATURAL JUSTICE AND PROCEDURAL FAIRNESS:",
+    "- Identified bias in assessment process",
+    "- Inadequate consideration of family option",
+    "- Failure to properly assess family capacity",
+)
+
+
+@lru_cache(maxsize=1)
+def _format_date(ordinal: int) -> str:
+    """Long-form report date (e.g. '05 March 2025'); only changes once a day"""
+    return date.fromordinal(ordinal).strftime('%d %B %Y')
+
+
+def _severity_counts(contradictions: Sequence[ContradictionMatrixRow]) -> Counter:
+    """Tally contradiction severities in a single pass"""
+    return Counter(row.severity for row in contradictions)
+
+
+class _Aggregates(NamedTuple):
+    """Totals across all analyzed documents, shared by several report sections"""
+
+    total_flags: int
+    total_breaches: int
+    total_evidence: int
+
+    @classmethod
+    def from_results(cls, results: Dict) -> "_Aggregates":
+        return cls(
+            total_flags=sum(
+                len(b["analysis"].flagged_segments) for b in results.get("bias", [])
+            ),
+            total_breaches=sum(
+                hr["analysis"].total_breaches for hr in results.get("human_rights", [])
+            ),
+            total_evidence=sum(
+                fe["evidence"].total_instances for fe in results.get("family_evidence", [])
+            ),
+        )
 
 
 class GuardianshipArgumentGenerator:
@@ -52,98 +352,78 @@ class GuardianshipArgumentGenerator:
     ) -> GuardianshipArgumentResponse:
         """Generate comprehensive guardianship argument report"""
 
-        report = GuardianshipArgumentReport(
-            report_title=request.report_title or "Family Guardianship Application - Legal Argument",
-            client_name=request.client_name,
-            report_date=datetime.now().isoformat(),
-            executive_summary="",
-            grounds_for_family_guardianship=[],
-            grounds_against_pg=[],
-            legal_framework_analysis="",
-            evidence_summary="",
-            risk_analysis="",
-            goals_alignment_summary="",
-            conclusion="",
-            recommendations=[],
-            supporting_documents=request.documents,
-        )
+        # One timestamp for the whole report so its dates agree
+        now = datetime.now()
 
         # Collect all analysis results
         analysis_results = {}
 
-        # Run NDIS goals analysis if requested
+        # Run the per-document analyses, and the NDIS goals analysis if requested, concurrently
+        pending = {}
         if request.include_goals_analysis and request.ndis_plan_path:
-            goals_result = await analyze_goals_guardianship_alignment({
-                "file_path": request.ndis_plan_path,
-                "guardianship_context": request.guardianship_context,
-            })
-            analysis_results["goals"] = goals_result
-
-        # Run bias analysis on each document
-        bias_results = []
-        for doc_path in request.documents:
-            try:
-                bias_result = await analyze_for_bias_and_racism({
-                    "file_path": doc_path,
-                })
-                bias_results.append({"document": doc_path, "analysis": bias_result})
-            except Exception as e:
-                # Continue even if one document fails
-                pass
+            pending["goals"] = analyze_goals_guardianship_alignment(GoalsAlignmentRequest(
+                file_path=request.ndis_plan_path,
+                guardianship_context=request.guardianship_context,
+            ))
+        pending["bias"] = _gather_per_document(
+            analyze_for_bias_and_racism, BiasAnalysisRequest, request.documents, memoized=True
+        )
+        if request.include_human_rights:
+            pending["human_rights"] = _gather_per_document(
+                extract_human_rights_breaches, HumanRightsBreachRequest, request.documents
+            )
+        pending["family_evidence"] = _gather_per_document(
+            extract_family_support_evidence, FamilySupportEvidenceRequest, request.documents
+        )
+        outcomes = dict(zip(pending, await asyncio.gather(*pending.values())))
+
+        if "goals" in outcomes:
+            analysis_results["goals"] = outcomes["goals"]
 
+        # Continue even if one document fails
+        bias_results = [
+            {"document": doc_path, "analysis": result}
+            for doc_path, result in zip(request.documents, outcomes["bias"])
+            if not isinstance(result, Exception)
+        ]
         if bias_results:
             analysis_results["bias"] = bias_results
 
-        # Run human rights analysis if requested
-        if request.include_human_rights:
-            hr_results = []
-            for doc_path in request.documents:
-                try:
-                    hr_result = await extract_human_rights_breaches({
-                        "file_path": doc_path,
-                    })
-                    hr_results.append({"document": doc_path, "analysis": hr_result})
-                except Exception:
-                    pass
+        if "human_rights" in outcomes:
+            hr_results = [
+                {"document": doc_path, "analysis": result}
+                for doc_path, result in zip(request.documents, outcomes["human_rights"])
+                if not isinstance(result, Exception)
+            ]
             if hr_results:
                 analysis_results["human_rights"] = hr_results
 
-        # Extract family support evidence
-        family_evidence_results = []
-        for doc_path in request.documents:
-            try:
-                family_result = await extract_family_support_evidence({
-                    "file_path": doc_path,
-                })
-                if family_result.get("evidence"):
-                    family_evidence_results.append({
-                        "document": doc_path,
-                        "evidence": family_result,
-                    })
-            except Exception:
-                pass
+        family_evidence_results = [
+            {"document": doc_path, "evidence": family_result}
+            for doc_path, family_result in zip(request.documents, outcomes["family_evidence"])
+            if not isinstance(family_result, Exception) and family_result.family_support_instances
+        ]
 
         if family_evidence_results:
             analysis_results["family_evidence"] = family_evidence_results
 
-        # Generate report sections
-        report.executive_summary = cls._generate_executive_summary(
-            analysis_results, request
-        )
-        report.grounds_for_family_guardianship = cls._generate_family_grounds(
-            analysis_results
-        )
-        report.grounds_against_pg = cls._generate_pg_concerns(analysis_results)
-        report.legal_framework_analysis = cls._generate_legal_framework(
-            analysis_results
-        )
-        report.evidence_summary = cls._generate_evidence_summary(analysis_results)
-        report.risk_analysis = cls._generate_risk_analysis(analysis_results)
-        report.goals_alignment_summary = cls._generate_goals_summary(
-            analysis_results.get("goals")
+        # Generate report sections; list sections are yielded straight into model validation
+        agg = _Aggregates.from_results(analysis_results)
+        report = GuardianshipArgumentReport(
+            report_title=request.report_title or "Family Guardianship Application - Legal Argument",
+            client_name=request.client_name,
+            report_date=now.isoformat(),
+            executive_summary=cls._generate_executive_summary(analysis_results, request, agg, now),
+            grounds_for_family_guardianship=cls._generate_family_grounds(analysis_results, agg),
+            grounds_against_pg=cls._generate_pg_concerns(analysis_results),
+            legal_framework_analysis=cls._generate_legal_framework(analysis_results, agg),
+            evidence_summary=cls._generate_evidence_summary(analysis_results),
+            risk_analysis=cls._generate_risk_analysis(analysis_results),
+            goals_alignment_summary=cls._generate_goals_summary(analysis_results.get("goals")),
+            conclusion=cls._generate_conclusion(analysis_results, request),
+            recommendations=cls._generate_recommendations(analysis_results),
+            supporting_documents=request.documents,
         )
-        report.conclusion = cls._generate_conclusion(analysis_results, request)
-        report.recommendations = cls._generate_recommendations(analysis_results)
 
         return GuardianshipArgumentResponse(
             report=report,
@@ -153,29 +433,27 @@ class GuardianshipArgumentGenerator:
         )
 
     @staticmethod
-    def _generate_executive_summary(results: Dict, request: GuardianshipArgumentRequest) -> str:
+    def _generate_executive_summary(
+        results: Dict, request: GuardianshipArgumentRequest, agg: _Aggregates, now: datetime
+    ) -> str:
         """Generate executive summary"""
         summary_parts = [
-            f"EXECUTIVE SUMMARY",
-            f"=" * 80,
-            f"\nClient: {request.client_name}",
-            f"Application: Family Guardianship",
-            f"Date: {datetime.now().strftime('%d %B %Y')}",
+            _EXEC_SUMMARY_HEADER,
+            f"\nClient: {request.client_name}\n"
+            f"Application: Family Guardianship\n"
+            f"Date: {_format_date(now.toordinal())}\n"
             f"\n\nThis report presents a comprehensive legal argument supporting family guardianship "
             f"for {request.client_name}. The analysis draws on:",
         ]
 
-        analyses = []
         if "goals" in results:
-            analyses.append("- NDIS Goals Alignment Analysis (7 goals)")
+            summary_parts.append("- NDIS Goals Alignment Analysis (7 goals)")
         if "bias" in results:
-            analyses.append(f"- Bias and Racism Analysis ({len(results['bias'])} documents)")
+            summary_parts.append(f"- Bias and Racism Analysis ({len(results['bias'])} documents)")
         if "human_rights" in results:
-            analyses.append(f"- Human Rights Breach Analysis ({len(results['human_rights'])} documents)")
+            summary_parts.append(f"- Human Rights Breach Analysis ({len(results['human_rights'])} documents)")
         if "family_evidence" in results:
-            analyses.append(f"- Family Support Evidence Extraction ({len(results['family_evidence'])} documents)")
-
-        summary_parts.extend(analyses)
+            summary_parts.append(f"- Family Support Evidence Extraction ({len(results['family_evidence'])} documents)")
 
         # Add key findings
         summary_parts.append("\n\nKEY FINDINGS:")
@@ -189,21 +467,18 @@ class GuardianshipArgumentGenerator:
             )
 
         if "bias" in results and results["bias"]:
-            total_flags = sum(b["analysis"].get("total_flagged_segments", 0) for b in results["bias"])
             summary_parts.append(
-                f"2. Bias Analysis: {total_flags} instances of bias, racism, or discriminatory language detected"
+                f"2. Bias Analysis: {agg.total_flags} instances of bias, racism, or discriminatory language detected"
             )
 
         if "human_rights" in results and results["human_rights"]:
-            total_breaches = sum(hr["analysis"].get("total_breaches", 0) for hr in results["human_rights"])
             summary_parts.append(
-                f"3. Human Rights: {total_breaches} potential breaches of Human Rights Act 2019 (Qld) identified"
+                f"3. Human Rights: {agg.total_breaches} potential breaches of Human Rights Act 2019 (Qld) identified"
             )
 
         if "family_evidence" in results:
-            total_evidence = sum(len(fe["evidence"].get("evidence", [])) for fe in results["family_evidence"])
             summary_parts.append(
-                f"4. Family Capacity: {total_evidence} documented instances of family support and capability"
+                f"4. Family Capacity: {agg.total_evidence} documented instances of family support and capability"
             )
 
         summary_parts.append(
@@ -214,79 +489,48 @@ class GuardianshipArgumentGenerator:
         return "\n".join(summary_parts)
 
     @staticmethod
-    def _generate_family_grounds(results: Dict) -> List[str]:
+    def _generate_family_grounds(results: Dict, agg: _Aggregates) -> Iterator[str]:
         """Generate grounds supporting family guardianship"""
-        grounds = []
-
         if "goals" in results:
             goals = results["goals"]
             if goals.alignment_differential > 0:
-                grounds.append(
+                yield (
                     f"NDIS Goals Alignment: Family guardianship better aligns with client's NDIS goals "
                     f"(differential: {goals.alignment_differential:+.1f}), demonstrating that family "
                     f"guardianship better supports the client's will and preferences (GA Act 2000 GP5)"
                 )
 
-        if "family_evidence" in results:
-            total_evidence = sum(len(fe["evidence"].get("evidence", [])) for fe in results["family_evidence"])
-            if total_evidence > 0:
-                grounds.append(
-                    f"Documented Family Capacity: {total_evidence} documented instances of family support "
-                    f"across multiple domains (emotional, practical, cultural, employment, decision-making), "
-                    f"demonstrating family capability for guardianship role"
-                )
+        if "family_evidence" in results and agg.total_evidence > 0:
+            yield (
+                f"Documented Family Capacity: {agg.total_evidence} documented instances of family support "
+                f"across multiple domains (emotional, practical, cultural, employment, decision-making), "
+                f"demonstrating family capability for guardianship role"
+            )
 
         if "bias" in results:
-            grounds.append(
-                f"Practitioner Bias: Analysis reveals bias in practitioner reports, undermining reliability "
-                f"of recommendations against family guardianship"
-            )
+            yield _BIAS_GROUND
 
         if "human_rights" in results:
-            grounds.append(
-                f"Human Rights Compliance: Family guardianship better protects client's rights under "
-                f"Human Rights Act 2019 (Qld), particularly family protection (s.26) and cultural rights (s.28)"
-            )
-
-        return grounds
+            yield _HUMAN_RIGHTS_GROUND
 
     @staticmethod
-    def _generate_pg_concerns(results: Dict) -> List[str]:
+    def _generate_pg_concerns(results: Dict) -> Iterator[str]:
         """Generate concerns about Public Guardian appointment"""
-        concerns = []
-
         if "goals" in results:
             goals = results["goals"]
             if goals.alignment_differential > 0:
-                concerns.append(
+                yield (
                     f"NDIS Goals Misalignment: Public Guardian appointment scores {goals.overall_pg_alignment}/10 "
                     f"for NDIS goals alignment, {goals.alignment_differential:.1f} points lower than family option"
                 )
 
         # Add generic PG concerns
-        concerns.extend([
-            "Limited Personal Knowledge: Public Guardian lacks intimate knowledge of client's history, "
-            "preferences, and cultural background that family possesses",
-            "Reduced Family Contact: Public Guardian appointment may limit family involvement and contact, "
-            "contrary to client's best interests and GA Act 2000 GP3 (maintain existing relationships)",
-            "Bureaucratic Delays: Public Guardian decision-making subject to bureaucratic processes, "
-            "potentially delaying important decisions affecting client wellbeing",
-        ])
-
-        return concerns
+        yield from _GENERIC_PG_CONCERNS
 
     @staticmethod
-    def _generate_legal_framework(results: Dict) -> str:
+    def _generate_legal_framework(results: Dict, agg: _Aggregates) -> str:
         """Generate legal framework analysis"""
-        framework_parts = [
-            "LEGAL FRAMEWORK ANALYSIS",
-            "=" * 80,
-            "\n1. Guardianship and Administration Act 2000 (Qld) - General Principles",
-            "\nGP1 - Least Restrictive Option:",
-            "Family guardianship is less restrictive than Public Guardian appointment, maintaining "
-            "existing family relationships and support networks while providing necessary decision-making support.",
-            "\nGP5 - Will and Preferences:",
-        ]
+        framework_parts = [_LEGAL_FRAMEWORK_HEAD]
 
         if "goals" in results:
             goals = results["goals"]
@@ -296,61 +540,44 @@ class GuardianshipArgumentGenerator:
                 f"consideration of the adult's will."
             )
         else:
-            framework_parts.append(
-                "Family guardianship better respects client's will and preferences through family's intimate "
-                "knowledge of client's wishes and values."
-            )
+            framework_parts.append(_LEGAL_FRAMEWORK_GP5_DEFAULT)
 
-        framework_parts.extend([
-            "\nGP3 - Maintain Existing Relationships:",
-            "Family guardianship preserves and strengthens existing supportive family relationships, "
-            "whereas Public Guardian appointment may diminish family involvement.",
-            "\n2. Human Rights Act 2019 (Qld)",
-        ])
+        framework_parts.append(_LEGAL_FRAMEWORK_GP3)
 
         if "human_rights" in results:
-            total_breaches = sum(hr["analysis"].get("total_breaches", 0) for hr in results["human_rights"])
-            framework_parts.append(
-                f"\nAnalysis identified {total_breaches} potential breaches of the Human Rights Act, including:"
-            )
-            framework_parts.extend([
-                "- Section 26: Protection of families and children",
-                "- Section 28: Cultural rights (particularly relevant for Indigenous and CALD clients)",
-                "- Section 25: Privacy and reputation",
-                "\nFamily guardianship better protects these fundamental rights."
-            ])
+            framework_parts += [
+                f"\nAnalysis identified {agg.total_breaches} potential breaches of the Human Rights Act, including:",
+                _LEGAL_FRAMEWORK_HR_BREACHES,
+            ]
         else:
-            framework_parts.extend([
-                "- Section 26: Protection of families - family guardianship preserves family unit",
-                "- Section 28: Cultural rights - family maintains cultural connections and identity",
-            ])
+            framework_parts.append(_LEGAL_FRAMEWORK_HR_DEFAULT)
 
         return "\n".join(framework_parts)
 
     @staticmethod
     def _generate_evidence_summary(results: Dict) -> str:
         """Generate evidence summary"""
-        summary_parts = ["EVIDENCE SUMMARY", "=" * 80]
+        if "family_evidence" not in results and "bias" not in results:
+            return ""
+
+        summary_parts = [_EVIDENCE_SUMMARY_HEADER]
 
         if "family_evidence" in results:
             summary_parts.append("\n1. Family Support Evidence:")
             for idx, fe in enumerate(results["family_evidence"][:3], 1):
-                evidence_items = fe["evidence"].get("evidence", [])
+                evidence_items = fe["evidence"].family_support_instances
                 if evidence_items:
                     summary_parts.append(f"\nDocument {idx}: {len(evidence_items)} instances")
                     # Group by theme
-                    themes = {}
-                    for item in evidence_items:
-                        theme = item.get("theme", "Other")
-                        themes[theme] = themes.get(theme, 0) + 1
-                    for theme, count in themes.items():
-                        summary_parts.append(f"  - {theme}: {count} instances")
+                    themes = Counter(item.category for item in evidence_items)
+                    summary_parts += (
+                        f"  - {theme}: {count} instances" for theme, count in themes.items()
+                    )
 
         if "bias" in results:
             summary_parts.append("\n2. Bias and Discrimination Evidence:")
             for idx, bias in enumerate(results["bias"][:3], 1):
-                analysis = bias["analysis"]
-                total_flags = analysis.get("total_flagged_segments", 0)
+                total_flags = len(bias["analysis"].flagged_segments)
                 if total_flags > 0:
                     summary_parts.append(f"\nDocument {idx}: {total_flags} flagged segments")
 
@@ -359,20 +586,7 @@ class GuardianshipArgumentGenerator:
     @staticmethod
     def _generate_risk_analysis(results: Dict) -> str:
         """Generate risk analysis"""
-        return (
-            "RISK ANALYSIS\n" + "=" * 80 + "\n\n"
-            "Comprehensive risk analysis shows family guardianship presents lower risk profile "
-            "while better supporting client outcomes. Analysis considers:\n"
-            "- Family capability and demonstrated support\n"
-            "- Compliance with statutory principles\n"
-            "- Protection of human rights\n"
-            "- Alignment with client goals and preferences\n\n"
-            "Public Guardian appointment carries risks including:\n"
-            "- Limited personal knowledge of client\n"
-            "- Reduced family involvement\n"
-            "- Bureaucratic decision-making delays\n"
-            "- Potential conflict with NDIS goals"
-        )
+        return _RISK_ANALYSIS
 
     @staticmethod
     def _generate_goals_summary(goals_result) -> str:
@@ -380,24 +594,19 @@ class GuardianshipArgumentGenerator:
         if not goals_result:
             return ""
 
-        summary_parts = [
-            "NDIS GOALS ALIGNMENT SUMMARY",
-            "=" * 80,
-            f"\nOverall Alignment Scores:",
-            f"- Family Guardianship: {goals_result.overall_family_alignment}/10",
-            f"- Public Guardian: {goals_result.overall_pg_alignment}/10",
-            f"- Differential: {goals_result.alignment_differential:+.1f}",
-            "\n" + goals_result.qcat_argument,
-        ]
-
-        return "\n".join(summary_parts)
+        return (
+            f"{_GOALS_SUMMARY_HEADER}\n"
+            f"- Family Guardianship: {goals_result.overall_family_alignment}/10\n"
+            f"- Public Guardian: {goals_result.overall_pg_alignment}/10\n"
+            f"- Differential: {goals_result.alignment_differential:+.1f}\n"
+            f"\n{goals_result.qcat_argument}"
+        )
 
     @staticmethod
     def _generate_conclusion(results: Dict, request: GuardianshipArgumentRequest) -> str:
         """Generate conclusion"""
         conclusion_parts = [
-            "CONCLUSION",
-            "=" * 80,
+            _CONCLUSION_HEADER,
             f"\nBased on comprehensive analysis of multiple evidence sources, family guardianship "
             f"is recommended for {request.client_name}. This recommendation is grounded in:",
         ]
@@ -409,18 +618,10 @@ class GuardianshipArgumentGenerator:
                 f"advantage for family guardianship"
             )
 
-        conclusion_parts.extend([
-            "\n2. Compliance with Guardianship and Administration Act 2000 General Principles, "
-            "particularly least restrictive option (GP1) and consideration of will and preferences (GP5)",
-            "\n3. Protection of fundamental human rights under Human Rights Act 2019 (Qld)",
-            "\n4. Documented evidence of family capacity and existing support provision",
-        ])
+        conclusion_parts.append(_CONCLUSION_GROUNDS)
 
         if "bias" in results:
-            conclusion_parts.append(
-                "\n5. Identified bias in practitioner reports undermining reliability of "
-                "recommendations against family guardianship"
-            )
+            conclusion_parts.append(_CONCLUSION_BIAS)
 
         conclusion_parts.append(
             f"\n\nFamily guardianship represents the option that best serves {request.client_name}'s "
@@ -430,15 +631,9 @@ class GuardianshipArgumentGenerator:
         return "\n".join(conclusion_parts)
 
     @staticmethod
-    def _generate_recommendations(results: Dict) -> List[str]:
+    def _generate_recommendations(results: Dict) -> Iterable[str]:
         """Generate recommendations"""
-        return [
-            "Appoint family members as guardians",
-            "Ensure ongoing family involvement in decision-making",
-            "Regular review of guardianship arrangement",
-            "Support implementation aligned with NDIS goals",
-            "Maintain cultural connections and community participation",
-        ]
+        return _RECOMMENDATIONS
 
     @staticmethod
     def _generate_brief_summary(report: GuardianshipArgumentReport) -> str:
@@ -460,39 +655,36 @@ class QCATEvidenceSummaryGenerator:
     ) -> QCATEvidenceSummaryResponse:
         """Generate QCAT evidence summary"""
 
+        now = datetime.now()
+
         # Run timeline analysis if requested
         timeline_events = []
         if request.include_timeline:
-            for doc_path in request.documents:
-                try:
-                    timeline_result = await extract_timeline_events({
-                        "file_path": doc_path,
-                        "sort_chronological": True,
-                    })
-                    timeline_events.extend(timeline_result.get("events", []))
-                except Exception:
-                    pass
-
-        # Run contradiction analysis if multiple documents
+            timeline_results = await _gather_per_document(
+                extract_timeline_events, TimelineExtractionRequest, request.documents
+            )
+            for timeline_result in timeline_results:
+                if not isinstance(timeline_result, Exception):
+                    timeline_events.extend(timeline_result.timeline)
+
+        # Run contradiction analysis if multiple distinct documents
         contradictions = []
-        if len(request.documents) > 1:
+        if len(set(request.documents)) > 1:
             try:
-                contradiction_result = await generate_contradiction_matrix({
-                    "documents": [
-                        {"file_path": doc, "document_label": f"Document {i+1}"}
-                        for i, doc in enumerate(request.documents)
-                    ],
-                })
-                contradictions = contradiction_result.get("matrix_rows", [])
+                contradiction_result = await generate_contradiction_matrix(
+                    ContradictionMatrixRequest(documents=request.documents)
+                )
+                contradictions = contradiction_result.matrix
             except Exception:
                 pass
 
         # Generate summary sections
         evidence_summary = cls._generate_summary_text(
-            request, timeline_events, contradictions
+            request, timeline_events, contradictions, now
         )
 
-        key_evidence = cls._extract_key_evidence(timeline_events, contradictions)
+        severity_counts = _severity_counts(contradictions)
+        key_evidence = cls._extract_key_evidence(timeline_events, contradictions, severity_counts)
 
         legal_arguments = cls._generate_legal_arguments(
             timeline_events, contradictions, request
@@ -503,19 +695,18 @@ class QCATEvidenceSummaryGenerator:
             key_evidence_points=key_evidence,
             legal_arguments=legal_arguments,
             timeline_summary=cls._format_timeline_summary(timeline_events),
-            contradiction_summary=cls._format_contradiction_summary(contradictions),
+            contradiction_summary=cls._format_contradiction_summary(contradictions, severity_counts),
             documents_reviewed=len(request.documents),
         )
 
     @staticmethod
-    def _generate_summary_text(request, timeline_events, contradictions) -> str:
+    def _generate_summary_text(request, timeline_events, contradictions, now: datetime) -> str:
         """Generate evidence summary text"""
         summary_parts = [
-            "QCAT EVIDENCE SUMMARY",
-            "=" * 80,
-            f"\nCase: {request.case_name}",
-            f"Documents Reviewed: {len(request.documents)}",
-            f"Date: {datetime.now().strftime('%d %B %Y')}",
+            _QCAT_SUMMARY_HEADER,
+            f"\nCase: {request.case_name}\n"
+            f"Documents Reviewed: {len(request.documents)}\n"
+            f"Date: {_format_date(now.toordinal())}\n"
             "\n\nEVIDENCE OVERVIEW:",
         ]
 
@@ -531,15 +722,12 @@ class QCATEvidenceSummaryGenerator:
                 f"across documents, undermining practitioner reliability"
             )
 
-        summary_parts.append(
-            "\n\nThis evidence summary compiles key findings from comprehensive document analysis, "
-            "suitable for QCAT submission and tribunal consideration."
-        )
+        summary_parts.append(_QCAT_SUMMARY_FOOTER)
 
         return "\n".join(summary_parts)
 
     @staticmethod
-    def _extract_key_evidence(timeline_events, contradictions) -> List[str]:
+    def _extract_key_evidence(timeline_events, contradictions, severity_counts: Counter) -> List[str]:
         """Extract key evidence points"""
         evidence_points = []
 
@@ -550,19 +738,12 @@ class QCATEvidenceSummaryGenerator:
             )
 
         if contradictions:
-            high_severity = sum(1 for c in contradictions if c.get("severity") == "high")
             evidence_points.append(
                 f"Contradiction matrix reveals {len(contradictions)} inconsistencies "
-                f"({high_severity} high severity), questioning evidence reliability"
+                f"({severity_counts['high']} high severity), questioning evidence reliability"
             )
 
-        evidence_points.append(
-            "Family demonstrates capacity across multiple support domains"
-        )
-
-        evidence_points.append(
-            "Client's NDIS goals better aligned with family guardianship option"
-        )
+        evidence_points += _STANDING_KEY_EVIDENCE
 
         return evidence_points
 
@@ -583,12 +764,7 @@ class QCATEvidenceSummaryGenerator:
                 "credibility and weight of recommendations (Evidence Act principles)"
             )
 
-        arguments.extend([
-            "Human Rights Compliance: Family guardianship better protects rights under "
-            "Human Rights Act 2019 (Qld) ss.25, 26, 28",
-            "Least Restrictive Option: Family guardianship complies with GA Act 2000 GP1",
-            "Will and Preferences: Evidence shows family option aligns with client goals (GP5)",
-        ])
+        arguments += _STANDING_QCAT_ARGUMENTS
 
         return arguments
 
@@ -601,16 +777,41 @@ class QCATEvidenceSummaryGenerator:
         return f"Timeline contains {len(events)} events spanning documented interactions and support provision"
 
     @staticmethod
-    def _format_contradiction_summary(contradictions) -> str:
+    def _format_contradiction_summary(contradictions, severity_counts: Counter) -> str:
         """Format contradiction summary"""
         if not contradictions:
             return "No contradictions analyzed"
 
-        high = sum(1 for c in contradictions if c.get("severity") == "high")
-        medium = sum(1 for c in contradictions if c.get("severity") == "medium")
-        low = sum(1 for c in contradictions if c.get("severity") == "low")
+        return (
+            f"Total: {len(contradictions)} ({severity_counts['high']} high, "
+            f"{severity_counts['medium']} medium, {severity_counts['low']} low severity)"
+        )
+
 
-        return f"Total: {len(contradictions)} ({high} high, {medium} medium, {low} low severity)"
+# The bundle summary is a pure function of a few scalars, so regenerating a bundle
+# for the same case reuses it
+@lru_cache(maxsize=256)
+def _build_bundle_summary(
+    client_name: str,
+    case_number: Optional[str],
+    bundle_date: str,
+    n_documents: int,
+    n_reports: int,
+) -> str:
+    """Assemble the bundle summary text"""
+    summary_parts = [
+        _BUNDLE_SUMMARY_HEADER,
+        f"\nClient: {client_name}\n"
+        f"Case Number: {case_number or 'TBD'}\n"
+        f"Bundle Date: {bundle_date}\n"
+        f"\n\nThis evidence bundle contains comprehensive analysis supporting family guardianship "
+        f"for {client_name}. The bundle includes:\n"
+        f"\n- {n_documents} source documents with integrity verification (SHA-256 hashing)\n"
+        f"- {n_reports} detailed analysis reports",
+        _BUNDLE_SUMMARY_FOOTER,
+    ]
+
+    return "\n".join(summary_parts)
 
 
 class QCATBundleAssembler:
@@ -620,60 +821,59 @@ class QCATBundleAssembler:
     async def assemble_bundle(cls, request: QCATBundleRequest) -> QCATBundleResponse:
         """Assemble complete QCAT evidence bundle"""
 
+        # One timestamp for the whole bundle so its dates agree
+        now = datetime.now()
+
+        # The static sections are validated into the bundle's lists at construction
         bundle = QCATEvidenceBundle(
             bundle_title=request.bundle_title or f"QCAT Evidence Bundle - {request.client_name}",
             client_name=request.client_name,
             case_number=request.case_number,
-            bundle_date=datetime.now().isoformat(),
-            table_of_contents=[],
+            bundle_date=now.isoformat(),
+            table_of_contents=cls._build_table_of_contents(request),
             document_register=[],
-            analysis_reports=[],
-            supporting_evidence=[],
-            legal_arguments=[],
+            analysis_reports=cls._compile_analysis_reports(request),
+            supporting_evidence=cls._compile_supporting_evidence(request),
+            legal_arguments=cls._generate_bundle_legal_arguments(request),
             bundle_summary="",
         )
 
-        # Generate document register with hashes
+        # Generate document register with hashes (all documents are processed concurrently)
+        # Repeated paths are hashed once but still listed as separate register items
+        async with asyncio.TaskGroup() as tg:
+            register_tasks = {
+                doc_path: tg.create_task(_bounded(cls._register_document(doc_path)))
+                for doc_path in dict.fromkeys(request.documents)
+            }
+
         for idx, doc_path in enumerate(request.documents, 1):
+            hash_result, metadata_result = register_tasks[doc_path].result()
+            document_name = os.path.basename(doc_path)
             try:
-                # Generate hash for chain of custody
-                hash_result = await generate_hash({"file_path": doc_path})
-
-                # Extract metadata
-                metadata_result = await extract_metadata({"file_path": doc_path})
+                for result in (hash_result, metadata_result):
+                    if isinstance(result, Exception):
+                        raise result
 
                 bundle.document_register.append({
                     "item_number": idx,
-                    "document_name": doc_path.split("/")[-1],
+                    "document_name": document_name,
                     "document_path": doc_path,
-                    "document_hash": hash_result.get("hash"),
+                    "document_hash": hash_result.hash,
                     "hash_algorithm": "SHA-256",
-                    "timestamp": hash_result.get("timestamp"),
-                    "metadata": metadata_result,
+                    "timestamp": hash_result.timestamp.isoformat(),
+                    "metadata": metadata_result.model_dump(mode="json"),
                 })
             except Exception as e:
                 # Add without hash if extraction fails
                 bundle.document_register.append({
                     "item_number": idx,
-                    "document_name": doc_path.split("/")[-1],
+                    "document_name": document_name,
                     "document_path": doc_path,
                     "error": str(e),
                 })
 
-        # Build table of contents
-        bundle.table_of_contents = cls._build_table_of_contents(bundle, request)
-
-        # Compile analysis reports
-        bundle.analysis_reports = cls._compile_analysis_reports(request)
-
-        # Compile supporting evidence
-        bundle.supporting_evidence = cls._compile_supporting_evidence(request)
-
-        # Generate legal arguments
-        bundle.legal_arguments = cls._generate_bundle_legal_arguments(request)
-
         # Generate bundle summary
-        bundle.bundle_summary = cls._generate_bundle_summary(bundle, request)
+        bundle.bundle_summary = cls._generate_bundle_summary(bundle, request, now)
 
         return QCATBundleResponse(
             bundle=bundle,
@@ -686,114 +886,44 @@ class QCATBundleAssembler:
         )
 
     @staticmethod
-    def _build_table_of_contents(bundle, request) -> List[Dict]:
-        """Build table of contents"""
-        toc = [
-            {"section": "1", "title": "Introduction and Case Overview", "page": 1},
-            {"section": "2", "title": "Document Register", "page": 2},
-            {"section": "3", "title": "Analysis Reports", "page": 5},
-            {"section": "3.1", "title": "Bias and Discrimination Analysis", "page": 6},
-            {"section": "3.2", "title": "Human Rights Breach Analysis", "page": 10},
-            {"section": "3.3", "title": "NDIS Goals Alignment Analysis", "page": 15},
-            {"section": "3.4", "title": "Family Capacity Evidence", "page": 20},
-            {"section": "4", "title": "Supporting Evidence", "page": 25},
-            {"section": "4.1", "title": "Timeline of Events", "page": 26},
-            {"section": "4.2", "title": "Contradiction Matrix", "page": 30},
-            {"section": "5", "title": "Legal Arguments", "page": 35},
-            {"section": "6", "title": "Recommendations", "page": 40},
-            {"section": "Appendix A", "title": "Source Documents", "page": 45},
-            {"section": "Appendix B", "title": "Document Integrity Verification", "page": 50},
-        ]
+    async def _register_document(doc_path: str) -> List[Any]:
+        """Generate the chain-of-custody hash and metadata for one document concurrently"""
+        return await asyncio.gather(
+            cached_call(generate_hash, DocumentHashRequest(file_path=doc_path)),
+            cached_call(extract_metadata, PDFExtractionRequest(file_path=doc_path)),
+            return_exceptions=True,
+        )
 
-        return toc
+    @staticmethod
+    def _build_table_of_contents(request) -> Sequence[Dict]:
+        """Build table of contents"""
+        return _TABLE_OF_CONTENTS
 
     @staticmethod
-    def _compile_analysis_reports(request) -> List[str]:
+    def _compile_analysis_reports(request) -> Sequence[str]:
         """Compile analysis report summaries"""
-        reports = [
-            "Bias and Racism Analysis Report",
-            "Human Rights Breach Analysis Report",
-            "Guardianship Risk Assessment Report",
-            "State Guardianship Bias Detection Report",
-            "Professional Language Compliance Report",
-            "NDIS Goals Alignment Analysis Report",
-            "Family Support Evidence Report",
-            "Public Guardian Limitations Report",
-            "Document Comparison Report",
-            "Timeline Analysis Report",
-            "Contradiction Matrix Report",
-        ]
-
-        return reports
+        return _ANALYSIS_REPORTS
 
     @staticmethod
-    def _compile_supporting_evidence(request) -> List[str]:
+    def _compile_supporting_evidence(request) -> Sequence[str]:
         """Compile supporting evidence list"""
-        evidence = [
-            "Documented instances of family support (emotional, practical, cultural)",
-            "Timeline showing pattern of family involvement",
-            "NDIS plan goals demonstrating family alignment",
-            "Evidence of Public Guardian limitations",
-            "Practitioner report contradictions undermining reliability",
-            "Human rights breaches in current guardianship arrangements",
-        ]
-
-        return evidence
+        return _SUPPORTING_EVIDENCE
 
     @staticmethod
-    def _generate_bundle_legal_arguments(request) -> List[str]:
+    def _generate_bundle_legal_arguments(request) -> Sequence[str]:
         """Generate legal arguments for bundle"""
-        arguments = [
-            "GUARDIANSHIP AND ADMINISTRATION ACT 2000 (QLD):",
-            "- GP1: Family guardianship is the least restrictive option",
-            "- GP5: Family guardianship better respects client's will and preferences",
-            "- GP3: Family guardianship maintains existing supportive relationships",
-            "",
-            "HUMAN RIGHTS ACT 2019 (QLD):",
-            "- Section 26: Family guardianship protects family relationships",
-            "- Section 28: Family guardianship preserves cultural rights and identity",
-            "- Section 25: Family guardianship respects privacy and reputation",
-            "",
-            "EVIDENCE-BASED DECISION MAKING:",
-            "- NDIS goals analysis shows quantifiable advantage for family option",
-            "- Timeline demonstrates sustained family involvement and capacity",
-            "- Contradiction analysis undermines reliability of contrary recommendations",
-            "",
-            "NATURAL JUSTICE AND PROCEDURAL FAIRNESS:",
-            "- Identified bias in assessment process",
-            "- Inadequate consideration of family option",
-            "- Failure to properly assess family capacity",
-        ]
-
-        return arguments
+        return _BUNDLE_LEGAL_ARGUMENTS
 
     @staticmethod
-    def _generate_bundle_summary(bundle, request) -> str:
+    def _generate_bundle_summary(bundle, request, now: datetime) -> str:
         """Generate bundle summary"""
-        summary_parts = [
-            f"QCAT EVIDENCE BUNDLE - SUMMARY",
-            "=" * 80,
-            f"\nClient: {request.client_name}",
-            f"Case Number: {request.case_number or 'TBD'}",
-            f"Bundle Date: {datetime.now().strftime('%d %B %Y')}",
-            f"\n\nThis evidence bundle contains comprehensive analysis supporting family guardianship "
-            f"for {request.client_name}. The bundle includes:",
-            f"\n- {len(bundle.document_register)} source documents with integrity verification (SHA-256 hashing)",
-            f"- {len(bundle.analysis_reports)} detailed analysis reports",
-            f"- Timeline analysis and contradiction matrix",
-            f"- Legal arguments grounded in Queensland and Commonwealth legislation",
-            f"- Evidence of family capacity and support provision",
-            "\n\nThe bundle demonstrates that family guardianship:",
-            "1. Better aligns with client's NDIS goals and expressed preferences",
-            "2. Complies with GA Act 2000 General Principles (GP1, GP3, GP5)",
-            "3. Protects fundamental human rights under HR Act 2019",
-            "4. Is supported by documented evidence of family capability",
-            "5. Represents the least restrictive option",
-            "\n\nAll documents included in this bundle have been analyzed using evidence-based tools "
-            "and methodologies. Chain of custody is maintained through cryptographic hashing.",
-        ]
-
-        return "\n".join(summary_parts)
+        return _build_bundle_summary(
+            request.client_name,
+            request.case_number,
+            _format_date(now.toordinal()),
+            len(bundle.document_register),
+            len(bundle.analysis_reports),
+        )
 
 
 # Main service functions
@@ -0,0 +1,42 @@
+"""
+Request preflight checks shared by the tool routers
+"""
+
+import functools
+import os
+import stat
+from typing import Any, Awaitable, Callable, TypeVar, cast
+
+from fastapi import HTTPException
+
+
+Handler = TypeVar("Handler", bound=Callable[..., Awaitable[Any]])
+
+
+def require_file(*fields: str) -> Callable[[Handler], Handler]:
+    """
+    Answer 404 before a handler runs when a document path on its request is not a file.
+
+    Each named request field may hold one path or a list of paths. The check is
+    a single os.stat per path, so the common case of a mistyped path never
+    reaches PDF extraction. It does not replace the handlers' own
+    FileNotFoundError handling: a file can still disappear between this check
+    and the read.
+    """
+    def decorator(handler: Handler) -> Handler:
+        @functools.wraps(handler)
+        async def wrapper(request: Any, **kwargs: Any) -> Any:
+            for field in fields:
+                value = getattr(request, field)
+                for path in (value,) if isinstance(value, str) else value:
+                    try:
+                        is_file = stat.S_ISREG(os.stat(path).st_mode)
+                    except (OSError, ValueError):
+                        is_file = False
+                    if not is_file:
+                        raise HTTPException(status_code=404, detail=f"File not found: {path}")
+            return await handler(request, **kwargs)
+
+        return cast(Handler, wrapper)
+
+    return decorator
@@ -3,7 +3,10 @@ Document Analysis Tools (Tools 5-15)
 Bias detection, inconsistencies, template reuse, evidence extraction, comparisons
 """
 
+from typing import AsyncIterator
+
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from loguru import logger
 
 from app.models.analysis import (
@@ -19,6 +22,8 @@ from app.models.analysis import (
     NonEvidenceBasedResponse,
     FamilySupportEvidenceRequest,
     FamilySupportEvidenceResponse,
+    DocumentSuiteRequest,
+    DocumentSuiteResponse,
 )
 from app.models.reports import (
     ComparisonReportRequest,
@@ -34,6 +39,7 @@ from app.services.document_analysis_service import (
     detect_template_reuse as detect_template_reuse_service,
     detect_omitted_context as detect_omitted_context_service,
     detect_non_evidence_based_statements as detect_non_evidence_service,
+    analyze_document_suite as analyze_document_suite_service,
 )
 from app.services.evidence_extraction_service import (
     extract_family_support_evidence as extract_family_support_service,
@@ -44,12 +50,15 @@ from app.services.comparison_timeline_service import (
     analyze_and_compare_pdfs as analyze_compare_service,
     extract_timeline_events as extract_timeline_service,
     generate_contradiction_matrix as generate_matrix_service,
+    iter_contradiction_matrix,
 )
+from app.tools._preflight import require_file
 
 router = APIRouter()
 
 
 @router.post("/analyze-racism-bias", response_model=BiasAnalysisResponse)
+@require_file("file_path")
 async def analyze_pdf_for_racism(request: BiasAnalysisRequest):
     """
     Tool 5: Detect explicit racism, implicit bias, cultural insensitivity, and stigmatizing language.
@@ -60,18 +69,19 @@ async def analyze_pdf_for_racism(request: BiasAnalysisRequest):
     **Use Case:** Showing discriminatory reporting for QCAT appeals.
     """
     try:
-        logger.info(f"Analyzing document for bias: {request.file_path}")
+        logger.info("Analyzing document for bias: {}", request.file_path)
         result = await analyze_for_bias_and_racism(request)
-        logger.info(f"Bias analysis complete: {len(result.flagged_segments)} segments flagged")
+        logger.info("Bias analysis complete: {} segments flagged", len(result.flagged_segments))
         return result
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"File not found: {request.file_path}")
     except Exception as e:
-        logger.error(f"Error in bias analysis: {str(e)}")
+        logger.error("Error in bias analysis: {}", e)
         raise HTTPException(status_code=500, detail=f"Bias analysis failed: {str(e)}")
 
 
 @router.post("/detect-inconsistencies", response_model=InconsistencyResponse)
+@require_file("documents")
 async def detect_inconsistent_statements(request: InconsistencyRequest):
     """
     Tool 6: Identify contradictions across one or more practitioner documents.
@@ -82,18 +92,19 @@ async def detect_inconsistent_statements(request: InconsistencyRequest):
     **Use Case:** Discrediting practitioner reliability.
     """
     try:
-        logger.info(f"Detecting inconsistencies across {len(request.documents)} documents")
+        logger.info("Detecting inconsistencies across {} documents", len(request.documents))
         result = await detect_inconsistencies_service(request)
-        logger.info(f"Found {len(result.contradictions)} contradictions")
+        logger.info("Found {} contradictions", len(result.contradictions))
         return result
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
-        logger.error(f"Error detecting inconsistencies: {str(e)}")
+        logger.error("Error detecting inconsistencies: {}", e)
         raise HTTPException(status_code=500, detail=f"Inconsistency detection failed: {str(e)}")
 
 
 @router.post("/detect-template-reuse", response_model=TemplateReuseResponse)
+@require_file("documents")
 async def detect_template_reuse_and_copying(request: TemplateReuseRequest):
     """
     Tool 7: Detect copy/paste text used across multiple clients or reports.
@@ -104,18 +115,19 @@ async def detect_template_reuse_and_copying(request: TemplateReuseRequest):
     **Use Case:** Proving assessments are generic or fabricated.
     """
     try:
-        logger.info(f"Detecting template reuse across {len(request.documents)} documents")
+        logger.info("Detecting template reuse across {} documents", len(request.documents))
         result = await detect_template_reuse_service(request)
-        logger.info(f"Found {len(result.matching_blocks)} matching blocks, {result.percentage_similarity:.1f}% similarity")
+        logger.info("Found {} matching blocks, {:.1f}% similarity", len(result.matching_blocks), result.percentage_similarity)
         return result
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
-        logger.error(f"Error detecting template reuse: {str(e)}")
+        logger.error("Error detecting template reuse: {}", e)
         raise HTTPException(status_code=500, detail=f"Template reuse detection failed: {str(e)}")
 
 
 @router.post("/detect-omitted-context", response_model=OmittedContextResponse)
+@require_file("file_path")
 async def detect_omitted_context(request: OmittedContextRequest):
     """
     Tool 8: Identify missing context such as antecedents, triggers, positive behaviours.
@@ -126,18 +138,19 @@ async def detect_omitted_context(request: OmittedContextRequest):
     **Use Case:** Demonstrating biased, one-sided reporting.
     """
     try:
-        logger.info(f"Detecting omitted context in: {request.file_path}")
+        logger.info("Detecting omitted context in: {}", request.file_path)
         result = await detect_omitted_context_service(request)
-        logger.info(f"Found {len(result.missing_context_items)} omitted context items")
+        logger.info("Found {} omitted context items", len(result.missing_context_items))
         return result
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"File not found: {request.file_path}")
     except Exception as e:
-        logger.error(f"Error detecting omitted context: {str(e)}")
+        logger.error("Error detecting omitted context: {}", e)
         raise HTTPException(status_code=500, detail=f"Omitted context detection failed: {str(e)}")
 
 
 @router.post("/detect-non-evidence-based", response_model=NonEvidenceBasedResponse)
+@require_file("file_path")
 async def detect_non_evidence_based_statements(request: NonEvidenceBasedRequest):
     """
     Tool 9: Flag statements with no evidence, dates, or examples.
@@ -148,18 +161,19 @@ async def detect_non_evidence_based_statements(request: NonEvidenceBasedRequest)
     **Use Case:** Challenging validity of practitioner conclusions.
     """
     try:
-        logger.info(f"Detecting non-evidence-based statements in: {request.file_path}")
+        logger.info("Detecting non-evidence-based statements in: {}", request.file_path)
         result = await detect_non_evidence_service(request)
-        logger.info(f"Found {len(result.unsupported_claims)} unsupported claims, justification score: {result.justification_score:.1f}/10")
+        logger.info("Found {} unsupported claims, justification score: {:.1f}/10", len(result.unsupported_claims), result.justification_score)
         return result
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"File not found: {request.file_path}")
     except Exception as e:
-        logger.error(f"Error detecting non-evidence-based statements: {str(e)}")
+        logger.error("Error detecting non-evidence-based statements: {}", e)
         raise HTTPException(status_code=500, detail=f"Non-evidence-based statement detection failed: {str(e)}")
 
 
 @router.post("/extract-family-support", response_model=FamilySupportEvidenceResponse)
+@require_file("file_path")
 async def extract_family_support_evidence(request: FamilySupportEvidenceRequest):
     """
     Tool 10: Identify all mentions of family involvement and support.
@@ -170,18 +184,19 @@ async def extract_family_support_evidence(request: FamilySupportEvidenceRequest)
     **Use Case:** Showing parents are supportive and capable.
     """
     try:
-        logger.info(f"Extracting family support evidence from: {request.file_path}")
+        logger.info("Extracting family support evidence from: {}", request.file_path)
         result = await extract_family_support_service(request)
-        logger.info(f"Found {result.total_instances} family support instances")
+        logger.info("Found {} family support instances", result.total_instances)
         return result
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"File not found: {request.file_path}")
     except Exception as e:
-        logger.error(f"Error extracting family support evidence: {str(e)}")
+        logger.error("Error extracting family support evidence: {}", e)
         raise HTTPException(status_code=500, detail=f"Family support extraction failed: {str(e)}")
 
 
 @router.post("/extract-pg-limitations", response_model=FamilySupportEvidenceResponse)
+@require_file("file_path")
 async def extract_public_guardian_limitations(request: FamilySupportEvidenceRequest):
     """
     Tool 11: Identify risks or negative impacts from Public Guardian oversight.
@@ -192,18 +207,19 @@ async def extract_public_guardian_limitations(request: FamilySupportEvidenceRequ
     **Use Case:** Showing Public Guardian may not align with client needs.
     """
     try:
-        logger.info(f"Extracting Public Guardian limitations from: {request.file_path}")
+        logger.info("Extracting Public Guardian limitations from: {}", request.file_path)
         result = await extract_pg_limitations_service(request)
-        logger.info(f"Found {result.total_instances} Public Guardian limitation instances")
+        logger.info("Found {} Public Guardian limitation instances", result.total_instances)
         return result
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"File not found: {request.file_path}")
     except Exception as e:
-        logger.error(f"Error extracting Public Guardian limitations: {str(e)}")
+        logger.error("Error extracting Public Guardian limitations: {}", e)
         raise HTTPException(status_code=500, detail=f"Public Guardian limitation extraction failed: {str(e)}")
 
 
 @router.post("/compare-documents", response_model=ComparisonReportResponse)
+@require_file("file_a", "file_b")
 async def compare_pdf_documents(request: ComparisonReportRequest):
     """
     Tool 12: Compare two practitioner reports and highlight differences.
@@ -214,18 +230,19 @@ async def compare_pdf_documents(request: ComparisonReportRequest):
     **Use Case:** Showing changed recommendations or new claims.
     """
     try:
-        logger.info(f"Comparing documents: {request.file_a} vs {request.file_b}")
+        logger.info("Comparing documents: {} vs {}", request.file_a, request.file_b)
         result = await compare_documents_service(request)
-        logger.info(f"Comparison complete: {result.similarity_score:.1f}% similar, {len(result.differences)} differences")
+        logger.info("Comparison complete: {:.1f}% similar, {} differences", result.similarity_score, len(result.differences))
         return result
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
-        logger.error(f"Error comparing documents: {str(e)}")
+        logger.error("Error comparing documents: {}", e)
         raise HTTPException(status_code=500, detail=f"Document comparison failed: {str(e)}")
 
 
 @router.post("/analyze-and-compare", response_model=ComparisonReportResponse)
+@require_file("file_a", "file_b")
 async def analyze_and_compare_pdfs(request: ComparisonReportRequest):
     """
     Tool 13: Full analysis + comparison of two documents in a single tool.
@@ -235,18 +252,19 @@ async def analyze_and_compare_pdfs(request: ComparisonReportRequest):
     **Use Case:** Identifying changes used to justify guardianship transfer.
     """
     try:
-        logger.info(f"Analyzing and comparing: {request.file_a} vs {request.file_b}")
+        logger.info("Analyzing and comparing: {} vs {}", request.file_a, request.file_b)
         result = await analyze_compare_service(request)
-        logger.info(f"Analysis and comparison complete")
+        logger.info("Analysis and comparison complete")
         return result
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
-        logger.error(f"Error in analyze and compare: {str(e)}")
+        logger.error("Error in analyze and compare: {}", e)
         raise HTTPException(status_code=500, detail=f"Analysis and comparison failed: {str(e)}")
 
 
 @router.post("/extract-timeline", response_model=TimelineExtractionResponse)
+@require_file("file_path")
 async def extract_timeline_events(request: TimelineExtractionRequest):
     """
     Tool 14: Extract all date+event pairs to build a timeline.
@@ -256,18 +274,19 @@ async def extract_timeline_events(request: TimelineExtractionRequest):
     **Use Case:** Showing patterns of involvement or misreporting.
     """
     try:
-        logger.info(f"Extracting timeline from: {request.file_path}")
+        logger.info("Extracting timeline from: {}", request.file_path)
         result = await extract_timeline_service(request)
-        logger.info(f"Timeline extraction complete: {result.total_events} events found")
+        logger.info("Timeline extraction complete: {} events found", result.total_events)
         return result
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"File not found: {request.file_path}")
     except Exception as e:
-        logger.error(f"Error extracting timeline: {str(e)}")
+        logger.error("Error extracting timeline: {}", e)
         raise HTTPException(status_code=500, detail=f"Timeline extraction failed: {str(e)}")
 
 
 @router.post("/contradiction-matrix", response_model=ContradictionMatrixResponse)
+@require_file("documents")
 async def generate_contradiction_matrix(request: ContradictionMatrixRequest):
     """
     Tool 15: Create structured contradictions table.
@@ -277,12 +296,72 @@ async def generate_contradiction_matrix(request: ContradictionMatrixRequest):
     **Use Case:** Highlighting unreliable practitioner evidence.
     """
     try:
-        logger.info(f"Generating contradiction matrix for {len(request.documents)} documents")
+        logger.info("Generating contradiction matrix for {} documents", len(request.documents))
         result = await generate_matrix_service(request)
-        logger.info(f"Matrix generated: {result.total_contradictions} contradictions found")
+        logger.info("Matrix generated: {} contradictions found", result.total_contradictions)
         return result
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
-        logger.error(f"Error generating contradiction matrix: {str(e)}")
+        logger.error("Error generating contradiction matrix: {}", e)
+        raise HTTPException(status_code=500, detail=f"Contradiction matrix generation failed: {str(e)}")
+
+
+@router.post("/contradiction-matrix/stream")
+@require_file("documents")
+async def stream_contradiction_matrix(request: ContradictionMatrixRequest):
+    """
+    Tool 15 (streaming): Contradiction matrix rows as newline-delimited JSON.
+
+    Each line is one matrix row, written as soon as it is found instead of
+    after the whole table is built.
+
+    **Use Case:** Agents consuming contradictions incrementally on large document sets.
+    """
+    logger.info("Streaming contradiction matrix for {} documents", len(request.documents))
+    rows = iter_contradiction_matrix(request.documents)
+
+    # Documents are extracted before the first row, so read it here to report
+    # extraction failures as an HTTP error before streaming starts
+    try:
+        first_row = await anext(rows, None)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.error("Error generating contradiction matrix: {}", e)
         raise HTTPException(status_code=500, detail=f"Contradiction matrix generation failed: {str(e)}")
+
+    async def ndjson() -> AsyncIterator[str]:
+        if first_row is None:
+            return
+        yield first_row.model_dump_json() + "\n"
+        async for row in rows:
+            yield row.model_dump_json() + "\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
+@router.post("/analyze-all", response_model=DocumentSuiteResponse)
+@require_file("file_path")
+async def analyze_all_single_document_tools(request: DocumentSuiteRequest):
+    """
+    Run Tools 5, 8, 9, 10, 11 and 14 on one document in a single call.
+
+    The PDF is extracted once and shared by all analyzers, which run concurrently.
+
+    **Use Case:** Running the full single-document analysis suite on a new report.
+    """
+    try:
+        logger.info("Running full analysis suite on: {}", request.file_path)
+        result = await analyze_document_suite_service(request)
+        logger.debug(
+            "Analysis suite complete: {} bias segments, {} timeline events",
+            len(result.bias.flagged_segments),
+            result.timeline.total_events,
+        )
+        return result
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail=f"File not found: {request.file_path}")
+    except Exception as e:
+        logger.error("Error in analysis suite: {}", e)
+        raise HTTPException(status_code=500, detail=f"Analysis suite failed: {str(e)}")
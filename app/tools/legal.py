@@ -27,11 +27,13 @@ from app.services.legal_framework_service import (
 from app.services.ndis_goals_service import (
     analyze_goals_guardianship_alignment as analyze_goals_service,
 )
+from app.tools._preflight import require_file
 
 router = APIRouter()
 
 
 @router.post("/human-rights-breaches", response_model=HumanRightsBreachResponse)
+@require_file("file_path")
 async def extract_human_rights_breaches(request: HumanRightsBreachRequest):
     """
     Tool 16: Extract human rights breaches from practitioner reports.
@@ -52,18 +54,19 @@ async def extract_human_rights_breaches(request: HumanRightsBreachRequest):
     **Use Case:** Supporting QCAT appeals by documenting rights violations
     """
     try:
-        logger.info(f"Analyzing human rights breaches: {request.file_path}")
+        logger.info("Analyzing human rights breaches: {}", request.file_path)
         result = await extract_hr_breaches_service(request)
-        logger.info(f"Human rights analysis complete: {result.total_breaches} breaches found, risk score: {result.risk_score}/10")
+        logger.info("Human rights analysis complete: {} breaches found, risk score: {}/10", result.total_breaches, result.risk_score)
         return result
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"File not found: {request.file_path}")
     except Exception as e:
-        logger.error(f"Error analyzing human rights breaches: {str(e)}")
+        logger.error("Error analyzing human rights breaches: {}", e)
         raise HTTPException(status_code=500, detail=f"Human rights analysis failed: {str(e)}")
 
 
 @router.post("/guardianship-risk-assessment", response_model=GuardianshipRiskResponse)
+@require_file("file_path")
 async def analyze_guardianship_risk_assessment(request: GuardianshipRiskRequest):
     """
     Tool 17: Analyze guardianship risk assessment quality and compliance.
@@ -83,18 +86,19 @@ async def analyze_guardianship_risk_assessment(request: GuardianshipRiskRequest)
     **Use Case:** Challenging inadequate or non-compliant assessments
     """
     try:
-        logger.info(f"Analyzing guardianship risk assessment: {request.file_path}")
+        logger.info("Analyzing guardianship risk assessment: {}", request.file_path)
         result = await analyze_guardianship_service(request)
-        logger.info(f"Risk assessment analysis complete: {result.compliance_rating}, overall score: {result.assessment.overall_compliance_score}/10")
+        logger.info("Risk assessment analysis complete: {}, overall score: {}/10", result.compliance_rating, result.assessment.overall_compliance_score)
         return result
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"File not found: {request.file_path}")
     except Exception as e:
-        logger.error(f"Error analyzing guardianship risk: {str(e)}")
+        logger.error("Error analyzing guardianship risk: {}", e)
         raise HTTPException(status_code=500, detail=f"Guardianship risk analysis failed: {str(e)}")
 
 
 @router.post("/detect-state-guardianship-bias", response_model=StateGuardianshipBiasResponse)
+@require_file("file_path")
 async def detect_bias_toward_state_guardianship(request: StateGuardianshipBiasRequest):
     """
     Tool 18: Detect bias toward state/public guardianship appointment.
@@ -114,18 +118,19 @@ async def detect_bias_toward_state_guardianship(request: StateGuardianshipBiasRe
     **Use Case:** Demonstrating practitioner bias in QCAT appeals
     """
     try:
-        logger.info(f"Detecting state guardianship bias: {request.file_path}")
+        logger.info("Detecting state guardianship bias: {}", request.file_path)
         result = await detect_bias_service(request)
-        logger.info(f"Bias detection complete: {result.bias_level} bias level, {result.total_indicators} indicators found")
+        logger.info("Bias detection complete: {} bias level, {} indicators found", result.bias_level, result.total_indicators)
         return result
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"File not found: {request.file_path}")
     except Exception as e:
-        logger.error(f"Error detecting state guardianship bias: {str(e)}")
+        logger.error("Error detecting state guardianship bias: {}", e)
         raise HTTPException(status_code=500, detail=f"State guardianship bias detection failed: {str(e)}")
 
 
 @router.post("/professional-language-compliance", response_model=ProfessionalComplianceResponse)
+@require_file("file_path")
 async def analyze_professional_language_compliance(request: ProfessionalComplianceRequest):
     """
     Tool 19: Analyze professional language compliance.
@@ -145,18 +150,19 @@ async def analyze_professional_language_compliance(request: ProfessionalComplian
     **Use Case:** Challenging practitioner credibility and professional standards
     """
     try:
-        logger.info(f"Analyzing professional language compliance: {request.file_path}")
+        logger.info("Analyzing professional language compliance: {}", request.file_path)
         result = await analyze_compliance_service(request)
-        logger.info(f"Compliance analysis complete: {result.compliance_level} compliance, {result.total_issues} issues found")
+        logger.info("Compliance analysis complete: {} compliance, {} issues found", result.compliance_level, result.total_issues)
         return result
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"File not found: {request.file_path}")
     except Exception as e:
-        logger.error(f"Error analyzing professional compliance: {str(e)}")
+        logger.error("Error analyzing professional compliance: {}", e)
         raise HTTPException(status_code=500, detail=f"Professional compliance analysis failed: {str(e)}")
 
 
 @router.post("/goals-guardianship-alignment", response_model=GoalsAlignmentResponse)
+@require_file("file_path")
 async def analyze_goals_guardianship_alignment(request: GoalsAlignmentRequest):
     """
     Tool 20: Analyze NDIS goals alignment with guardianship options. ⭐ CRITICAL
@@ -184,15 +190,17 @@ async def analyze_goals_guardianship_alignment(request: GoalsAlignmentRequest):
     better supports NDIS goals and client outcomes
     """
     try:
-        logger.info(f"Analyzing NDIS goals alignment: {request.file_path}")
+        logger.info("Analyzing NDIS goals alignment: {}", request.file_path)
         result = await analyze_goals_service(request)
         logger.info(
-            f"Goals alignment complete: Family {result.overall_family_alignment}/10, "
-            f"PG {result.overall_pg_alignment}/10, Differential: {result.alignment_differential:+.1f}"
+            "Goals alignment complete: Family {}/10, PG {}/10, Differential: {:+.1f}",
+            result.overall_family_alignment,
+            result.overall_pg_alignment,
+            result.alignment_differential,
         )
         return result
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"File not found: {request.file_path}")
     except Exception as e:
-        logger.error(f"Error analyzing goals alignment: {str(e)}")
+        logger.error("Error analyzing goals alignment: {}", e)
         raise HTTPException(status_code=500, detail=f"Goals alignment analysis failed: {str(e)}")
@@ -11,6 +11,10 @@ from typing import Dict, Any
 
 BASE_URL = "http://localhost:8000"
 SAMPLE_PDF = "/path/to/sample_document.pdf"  # Replace with actual test PDF
+MISSING_PDF = "/nonexistent/missing_document.pdf"
+
+# Fields of every contradiction matrix row
+MATRIX_ROW_FIELDS = {"topic", "version_1", "version_2", "conflict", "severity", "explanation", "source_1", "source_2"}
 
 
 class TestPDFProcessing:
@@ -257,6 +261,23 @@ class TestComparisonTimeline:
             assert "matrix_rows" in data
             print(f"✅ Tool 15: Found {data['total_contradictions']} contradictions")
 
+    def test_tool_15_contradiction_matrix_stream(self):
+        """Tool 15 (streaming): One JSON matrix row per line"""
+        endpoint = f"{BASE_URL}/api/analysis/contradiction-matrix/stream"
+        payload = {"documents": [SAMPLE_PDF, SAMPLE_PDF]}
+
+        response = requests.post(endpoint, json=payload)
+        assert response.status_code in [200, 404]
+
+        if response.status_code == 200:
+            assert response.headers["content-type"].startswith("application/x-ndjson")
+            # An empty matrix is an empty body, not a blank line
+            assert response.text == "" or response.text.endswith("\n")
+            rows = [json.loads(line) for line in response.text.splitlines()]
+            for row in rows:
+                assert set(row) == MATRIX_ROW_FIELDS
+            print(f"✅ Tool 15 (stream): Streamed {len(rows)} rows")
+
 
 class TestLegalFramework:
     """Tests for Tools 16-19: Legal Framework"""
@@ -398,6 +419,49 @@ class TestReportGeneration:
             print(f"✅ Tool 23: Bundle with {data['total_documents']} documents")
 
 
+class TestCombinedAnalysis:
+    """Tests for endpoints running several tools in one call"""
+
+    def test_analyze_all(self):
+        """Tools 5, 8, 9, 10, 11 and 14 on one document"""
+        endpoint = f"{BASE_URL}/api/analysis/analyze-all"
+        payload = {"file_path": SAMPLE_PDF}
+
+        response = requests.post(endpoint, json=payload)
+        assert response.status_code in [200, 404]
+
+        if response.status_code == 200:
+            data = response.json()
+            assert data["file_path"] == SAMPLE_PDF
+            assert "flagged_segments" in data["bias"]
+            assert "omitted_context" in data
+            assert "non_evidence_based" in data
+            assert "family_support" in data
+            assert "pg_limitations" in data
+            assert "total_events" in data["timeline"]
+            print(f"✅ Analysis suite: {len(data['bias']['flagged_segments'])} bias segments, "
+                  f"{data['timeline']['total_events']} events")
+
+
+class TestMissingFiles:
+    """Tests for the missing-document check shared by the document endpoints"""
+
+    @pytest.mark.parametrize("path, payload", [
+        ("/api/analysis/analyze-racism-bias", {"file_path": MISSING_PDF}),
+        ("/api/analysis/analyze-all", {"file_path": MISSING_PDF}),
+        ("/api/analysis/detect-inconsistencies", {"documents": [SAMPLE_PDF, MISSING_PDF]}),
+        ("/api/analysis/contradiction-matrix/stream", {"documents": [MISSING_PDF, MISSING_PDF]}),
+        ("/api/analysis/compare-documents", {"file_a": MISSING_PDF, "file_b": MISSING_PDF}),
+        ("/api/legal/human-rights-breaches", {"file_path": MISSING_PDF}),
+    ])
+    def test_missing_file_returns_404(self, path, payload):
+        """A missing document is answered with 404 naming the path"""
+        response = requests.post(f"{BASE_URL}{path}", json=payload)
+        assert response.status_code == 404
+        assert response.json()["detail"].startswith("File not found: ")
+        print(f"✅ {path}: {response.json()['detail']}")
+
+
 class TestServerHealth:
     """Test server health and status"""
 
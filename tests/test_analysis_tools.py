@@ -0,0 +1,131 @@
+"""
+Tests for document analysis endpoints
+"""
+
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import app.tools.analysis as analysis_tools
+from app.models.reports import ContradictionMatrixRow
+
+
+@pytest.fixture
+def client():
+    """Client for the analysis router alone, so tests need no running server"""
+    app = FastAPI()
+    app.include_router(analysis_tools.router, prefix="/api/analysis")
+    return TestClient(app)
+
+
+@pytest.fixture
+def documents(tmp_path):
+    """Two existing document paths; the analyses using them are replaced per test"""
+    paths = [tmp_path / "report_1.pdf", tmp_path / "report_2.pdf"]
+    for path in paths:
+        path.write_bytes(b"%PDF-1.4\n")
+    return [str(path) for path in paths]
+
+
+def _matrix_row(topic: str) -> ContradictionMatrixRow:
+    """A contradiction matrix row about topic"""
+    return ContradictionMatrixRow(
+        topic=topic,
+        version_1="Described as calm",
+        version_2="Described as aggressive",
+        conflict="Contradictory behavioral characterization",
+        severity="medium",
+        explanation="Documents disagree",
+        source_1="report_1.pdf",
+        source_2="report_2.pdf",
+    )
+
+
+def _stream_rows(monkeypatch, rows):
+    """Make the streaming endpoint emit the given rows"""
+    async def iter_rows(documents):
+        for row in rows:
+            yield row
+
+    monkeypatch.setattr(analysis_tools, "iter_contradiction_matrix", iter_rows)
+
+
+class TestPreflight:
+    """Test the missing-document check"""
+
+    def test_missing_file_returns_404(self, client, documents):
+        """Test a missing document is reported before the handler runs"""
+        missing = documents[0] + ".missing"
+        response = client.post(
+            "/api/analysis/contradiction-matrix/stream",
+            json={"documents": [documents[0], missing]},
+        )
+
+        assert response.status_code == 404
+        assert response.json() == {"detail": f"File not found: {missing}"}
+
+    def test_directory_returns_404(self, client, tmp_path):
+        """Test a directory path is rejected rather than failing inside extraction"""
+        response = client.post("/api/analysis/extract-timeline", json={"file_path": str(tmp_path)})
+
+        assert response.status_code == 404
+        assert response.json() == {"detail": f"File not found: {tmp_path}"}
+
+    def test_file_removed_after_preflight_returns_404(self, client, documents, monkeypatch):
+        """Test the handler still maps a late FileNotFoundError to 404"""
+        async def extract(request):
+            raise FileNotFoundError(f"PDF file not found: {request.file_path}")
+
+        monkeypatch.setattr(analysis_tools, "extract_timeline_service", extract)
+
+        response = client.post("/api/analysis/extract-timeline", json={"file_path": documents[0]})
+
+        assert response.status_code == 404
+        assert response.json() == {"detail": f"File not found: {documents[0]}"}
+
+
+class TestContradictionMatrixStream:
+    """Test the newline-delimited JSON contradiction matrix"""
+
+    def test_one_row_per_line(self, client, documents, monkeypatch):
+        """Test every row is a complete JSON object on its own line"""
+        rows = [_matrix_row("Behavioral assessment: calm/aggressive"), _matrix_row("Dates")]
+        _stream_rows(monkeypatch, rows)
+
+        response = client.post(
+            "/api/analysis/contradiction-matrix/stream", json={"documents": documents}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        assert response.text.endswith("\n")
+        lines = response.text.splitlines()
+        assert [ContradictionMatrixRow(**json.loads(line)) for line in lines] == rows
+
+    def test_empty_matrix(self, client, documents, monkeypatch):
+        """Test a matrix without rows streams an empty body"""
+        _stream_rows(monkeypatch, [])
+
+        response = client.post(
+            "/api/analysis/contradiction-matrix/stream", json={"documents": documents}
+        )
+
+        assert response.status_code == 200
+        assert response.text == ""
+
+    def test_extraction_failure_returns_500(self, client, documents, monkeypatch):
+        """Test a failure before the first row is an HTTP error, not a truncated stream"""
+        async def failing_rows(documents):
+            raise ValueError("unreadable PDF")
+            yield
+
+        monkeypatch.setattr(analysis_tools, "iter_contradiction_matrix", failing_rows)
+
+        response = client.post(
+            "/api/analysis/contradiction-matrix/stream", json={"documents": documents}
+        )
+
+        assert response.status_code == 500
+        assert "unreadable PDF" in response.json()["detail"]
@@ -0,0 +1,320 @@
+"""
+Tests for bias and racism analysis
+"""
+
+import asyncio
+import os
+import re
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import app.services.nlp_service as nlp_service
+import app.services.pdf_service as pdf_service
+from app.models.analysis import BiasAnalysisRequest
+
+
+class TestBatchAnalysis:
+    """Test analyzing several documents in one call"""
+
+    async def test_results_in_request_order(self, monkeypatch):
+        """Test each result belongs to the request at the same position"""
+        async def analyze(request):
+            # Later documents finish first
+            await asyncio.sleep(0.01 / (1 + len(request.file_path)))
+            return request.file_path
+
+        monkeypatch.setattr(nlp_service, "analyze_for_bias_and_racism", analyze)
+        paths = [f"report_{'x' * i}.pdf" for i in range(5)]
+
+        results = await nlp_service.analyze_batch_for_bias(
+            [BiasAnalysisRequest(file_path=path) for path in paths]
+        )
+
+        assert results == paths
+
+    async def test_concurrency_is_bounded(self, monkeypatch):
+        """Test no more than _BATCH_CONCURRENCY documents are analyzed at once"""
+        running = 0
+        peak = 0
+
+        async def analyze(request):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return request.file_path
+
+        monkeypatch.setattr(nlp_service, "analyze_for_bias_and_racism", analyze)
+        monkeypatch.setattr(nlp_service, "_BATCH_CONCURRENCY", 3)
+        monkeypatch.setattr(nlp_service, "_batch_semaphores", type(nlp_service._batch_semaphores)())
+
+        results = await nlp_service.analyze_batch_for_bias(
+            [BiasAnalysisRequest(file_path=f"report_{i}.pdf") for i in range(20)]
+        )
+
+        assert len(results) == 20
+        assert peak == 3
+
+
+class TestBiasCache:
+    """Test memoization of bias analyses"""
+
+    async def test_unchanged_file_is_analyzed_once(self, tmp_path, monkeypatch):
+        """Test a repeated request is served without extracting or hashing the document"""
+        extracted = []
+
+        async def extract_text_from_pdf(request):
+            extracted.append(request.file_path)
+            return SimpleNamespace(full_text="Those people are always aggressive.", pages=[])
+
+        async def generate_hash(request):
+            raise AssertionError("cache lookups must not hash the document")
+
+        monkeypatch.setattr(pdf_service, "extract_text_from_pdf", extract_text_from_pdf)
+        monkeypatch.setattr(pdf_service, "generate_hash", generate_hash)
+        path = tmp_path / "report.pdf"
+        path.write_bytes(b"%PDF-1.4\n")
+        request = BiasAnalysisRequest(file_path=str(path))
+
+        first = await nlp_service.analyze_for_bias_and_racism(request)
+        second = await nlp_service.analyze_for_bias_and_racism(request)
+
+        assert extracted == [str(path)]
+        assert second == first
+
+    async def test_cached_result_is_not_shared(self, tmp_path, monkeypatch):
+        """Test mutating a returned response does not alter later results"""
+        async def extract_text_from_pdf(request):
+            return SimpleNamespace(full_text="Those people are always aggressive.", pages=[])
+
+        monkeypatch.setattr(pdf_service, "extract_text_from_pdf", extract_text_from_pdf)
+        path = tmp_path / "report.pdf"
+        path.write_bytes(b"%PDF-1.4\n")
+        request = BiasAnalysisRequest(file_path=str(path))
+
+        first = await nlp_service.analyze_for_bias_and_racism(request)
+        flagged = list(first.flagged_segments)
+        first.flagged_segments.clear()
+        first.risk_scores.clear()
+
+        second = await nlp_service.analyze_for_bias_and_racism(request)
+
+        assert flagged
+        assert second.flagged_segments == flagged
+        assert second.risk_scores
+
+    async def test_rewritten_file_is_reanalyzed(self, tmp_path, monkeypatch):
+        """Test a file rewritten with its modification time restored is not served stale"""
+        texts = iter(["Those people are always aggressive.", "The client is calm."])
+
+        async def extract_text_from_pdf(request):
+            return SimpleNamespace(full_text=next(texts), pages=[])
+
+        monkeypatch.setattr(pdf_service, "extract_text_from_pdf", extract_text_from_pdf)
+        path = tmp_path / "report.pdf"
+        path.write_bytes(b"%PDF-1.4\n")
+        request = BiasAnalysisRequest(file_path=str(path))
+
+        first = await nlp_service.analyze_for_bias_and_racism(request)
+        stat = os.stat(path)
+        # Change times advance at clock-tick granularity
+        time.sleep(0.05)
+        path.write_bytes(b"%PDF-1.5\n")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        second = await nlp_service.analyze_for_bias_and_racism(request)
+
+        assert first.flagged_segments
+        assert not second.flagged_segments
+
+
+def _match(start: int, end: int, severity: str, category: str = "implicit_bias"):
+    """A (start, end, rule) match as collected by the scanner"""
+    rule = nlp_service._BiasRule(
+        pattern=None,
+        re2_pattern=None,
+        rule_id=0,
+        anchors=(),
+        severity=severity,
+        category=category,
+        explanation="",
+    )
+    return (start, end, rule)
+
+
+def _spans(found):
+    """(start, end, severity, category) of each match"""
+    return [(start, end, rule.severity, rule.category) for start, end, rule in found]
+
+
+class TestDropOverlaps:
+    """Test collapsing of overlapping bias matches"""
+
+    def test_nested_match_keeps_most_severe(self):
+        """Test a severe phrase inside a milder one is reported once, as the severe one"""
+        found = [_match(0, 30, "low"), _match(5, 10, "high")]
+
+        assert _spans(nlp_service._drop_overlaps(found)) == [(5, 10, "high", "implicit_bias")]
+
+    def test_chained_overlaps(self):
+        """Test a match dropped for a severe one cannot shadow a later match"""
+        found = [_match(0, 30, "medium"), _match(5, 10, "high"), _match(12, 20, "medium")]
+
+        assert _spans(nlp_service._drop_overlaps(found)) == [
+            (5, 10, "high", "implicit_bias"),
+            (12, 20, "medium", "implicit_bias"),
+        ]
+
+    def test_no_kept_matches_overlap(self):
+        """Test a match overlapping a kept match is dropped even when an earlier one ended sooner"""
+        found = [_match(0, 30, "medium"), _match(5, 10, "medium"), _match(12, 20, "medium")]
+
+        assert _spans(nlp_service._drop_overlaps(found)) == [(0, 30, "medium", "implicit_bias")]
+
+    def test_same_severity_across_categories(self):
+        """Test equally severe overlapping categories keep the earlier-starting match"""
+        found = [
+            _match(5, 15, "high", "deficit_language"),
+            _match(0, 10, "high", "implicit_bias"),
+            _match(0, 10, "high", "cultural_bias"),
+        ]
+
+        assert _spans(nlp_service._drop_overlaps(found)) == [(0, 10, "high", "implicit_bias")]
+
+    def test_adjacent_matches_are_kept_in_order(self):
+        """Test touching but non-overlapping matches all survive, in their original order"""
+        found = [_match(10, 20, "low"), _match(0, 10, "high"), _match(20, 25, "medium")]
+
+        assert _spans(nlp_service._drop_overlaps(found)) == [
+            (10, 20, "low", "implicit_bias"),
+            (0, 10, "high", "implicit_bias"),
+            (20, 25, "medium", "implicit_bias"),
+        ]
+
+
+# Sentences with hits in every bias category, several overlapping across categories
+BIAS_SENTENCES = [
+    "Those people are always aggressive and never cooperative with staff.",
+    "The client cannot understand the plan and fails to comply with directions.",
+    "Cultural barriers and language problems were observed; family dysfunction was noted.",
+    "The client is suffering from anxiety and is a victim of neglect.",
+    "Staff describe a difficult client who is non-compliant and manipulative.",
+    "The parents lack insight and the family does not provide consistent support.",
+    "There is a lack of parenting skills and a chaotic household.",
+    "Their culture is seen as the cause, with backward beliefs and unusual family practices.",
+    "He is unable to manage money and has deficits in planning, with impaired memory.",
+    "Support was adequate on most days and the visit went well.",
+]
+
+
+def _long_report(sentence_count):
+    """A report of numbered sentences cycling through BIAS_SENTENCES"""
+    return " ".join(
+        f"Entry {i}. {BIAS_SENTENCES[i % len(BIAS_SENTENCES)]}" for i in range(sentence_count)
+    )
+
+
+def _per_pattern_hits(text, context_window=100):
+    """
+    Hits found the way the detectors used to: every pattern of every category
+    run separately with re.finditer(..., re.IGNORECASE). Overlapping matches
+    are then collapsed by _drop_overlaps, which the fused scan applies as well.
+    """
+    patterns = {
+        "explicit_racism": nlp_service.BiasDetector.EXPLICIT_RACISM_PATTERNS,
+        "implicit_bias": nlp_service.BiasDetector.IMPLICIT_BIAS_PATTERNS,
+        "cultural_insensitivity": nlp_service.BiasDetector.CULTURAL_INSENSITIVITY_PATTERNS,
+        "stigmatizing_language": nlp_service.BiasDetector.STIGMATIZING_LANGUAGE,
+        "deficit_language": nlp_service.BiasDetector.DEFICIT_LANGUAGE,
+        "family_undermining": nlp_service.BiasDetector.FAMILY_UNDERMINING_PATTERNS,
+    }
+    found = [
+        (match.start(), match.end(), rule)
+        for rule in nlp_service._ALL_BIAS_RULES
+        for pattern in patterns[rule.category]
+        for match in re.finditer(pattern, text, re.IGNORECASE)
+    ]
+    return sorted(
+        (text[max(0, start - context_window):end + context_window], text[start:end], rule.category)
+        for start, end, rule in nlp_service._drop_overlaps(found)
+    )
+
+
+def _scanned_hits(text):
+    """The fused scan's hits in the form _per_pattern_hits gives them"""
+    return sorted(
+        (hit.context, hit.text, hit.category)
+        for hit in nlp_service._scan(text, nlp_service._ALL_BIAS_RULES, 100)
+    )
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    """Split texts over 1,000 characters into pieces of about 300 for four scan threads"""
+    monkeypatch.setattr(nlp_service, "_PARALLEL_SCAN_MIN_SIZE", 1000)
+    monkeypatch.setattr(nlp_service, "_SCAN_CHUNK_SIZE", 300)
+    monkeypatch.setattr(nlp_service, "_SCAN_WORKERS", 4)
+
+    pieces = []
+    piece_spans = nlp_service._piece_spans
+
+    def record_piece(rules, text_lc, text_bytes, start, end):
+        pieces.append((start, end))
+        return piece_spans(rules, text_lc, text_bytes, start, end)
+
+    monkeypatch.setattr(nlp_service, "_piece_spans", record_piece)
+    return pieces
+
+
+class TestChunkedScan:
+    """Test the parallel scan of long texts against whole-text and per-pattern scans"""
+
+    def test_chunk_bounds_cover_text_at_full_stops(self, small_chunks):
+        """Test pieces are contiguous, each at least the chunk size and ending on a full stop but the last"""
+        text = _long_report(40).lower()
+
+        bounds = nlp_service._chunk_bounds(text)
+
+        assert bounds[0][0] == 0 and bounds[-1][1] == len(text)
+        assert all(end == next_start for (_, end), (next_start, _) in zip(bounds, bounds[1:]))
+        assert all(text[end - 1] == "." and end - start > 300 for start, end in bounds[:-1])
+
+    def test_chunk_bounds_without_full_stops(self, small_chunks):
+        """Test a text with no full stop after the first chunk is one piece"""
+        text = "word " * 200
+
+        assert nlp_service._chunk_bounds(text) == [(0, len(text))]
+
+    @pytest.mark.skipif(not nlp_service.RE2_AVAILABLE, reason="the parallel scan needs re2")
+    def test_parallel_scan_matches_whole_text_scan(self, small_chunks, monkeypatch):
+        """Test splitting a long text changes no hit, context or order"""
+        text = _long_report(120)
+
+        chunked = nlp_service._scan(text, nlp_service._ALL_BIAS_RULES, 100)
+        assert len(small_chunks) > 10
+
+        monkeypatch.setattr(nlp_service, "_PARALLEL_SCAN_MIN_SIZE", len(text) + 1)
+        whole = nlp_service._scan(text, nlp_service._ALL_BIAS_RULES, 100)
+
+        assert chunked == whole
+
+    def test_scan_matches_per_pattern_scan(self, small_chunks):
+        """Test the fused, chunked scan flags what the per-pattern detectors flagged"""
+        text = _long_report(120)
+
+        expected = _per_pattern_hits(text)
+
+        assert len(expected) > 200
+        assert {category for _, _, category in expected} == {
+            rule.category for rule in nlp_service._ALL_BIAS_RULES
+        }
+        assert _scanned_hits(text) == expected
+
+    def test_mixed_case_text(self, small_chunks):
+        """Test matching stays case-insensitive and quotes the original casing"""
+        text = _long_report(60).upper()
+
+        assert _scanned_hits(text) == _per_pattern_hits(text)
+        assert any(hit_text == "ALWAYS AGGRESSIVE" for _, hit_text, _ in _scanned_hits(text))
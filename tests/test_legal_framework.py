@@ -0,0 +1,134 @@
+"""
+Tests for legal framework analysis tools
+"""
+
+import uuid
+
+import app.services.legal_framework_service as legal_service
+from app.models.base import PageText
+from app.models.legal import (
+    GuardianshipRiskRequest,
+    HumanRightsBreachRequest,
+    ProfessionalComplianceRequest,
+    StateGuardianshipBiasRequest,
+)
+from app.services.legal_framework_service import ProfessionalLanguageAnalyzer
+
+
+def _pages(texts):
+    """Pages and full text laid out as extract_text_from_pdf joins them"""
+    pages = []
+    offset = 0
+    for number, text in enumerate(texts, start=1):
+        pages.append(
+            PageText(
+                page_number=number,
+                text=text,
+                word_count=len(text.split()),
+                char_count=len(text),
+                char_start=offset,
+            )
+        )
+        offset += len(text) + 2
+    return "\n\n".join(texts), pages
+
+
+def _sample_text() -> str:
+    """Report text unique to the calling test, so earlier cache entries never match"""
+    return (
+        f"Report {uuid.uuid4()}. The client is non-compliant and refuses to engage. "
+        "Staff believe the family is obviously manipulative."
+    )
+
+
+class TestProfessionalComplianceCache:
+    """Test memoization of professional language compliance results"""
+
+    def test_second_call_hits_cache(self, monkeypatch):
+        """Test an identical text is only scanned once"""
+        scanned = []
+        uncached = ProfessionalLanguageAnalyzer._analyze_text_uncached
+
+        def counting(full_text):
+            scanned.append(full_text)
+            return uncached(full_text)
+
+        monkeypatch.setattr(
+            ProfessionalLanguageAnalyzer, "_analyze_text_uncached", staticmethod(counting)
+        )
+        text = _sample_text()
+
+        first = ProfessionalLanguageAnalyzer._analyze_text(text)
+        second = ProfessionalLanguageAnalyzer._analyze_text(text)
+
+        assert len(scanned) == 1
+        assert second == first
+
+    def test_cached_result_is_not_shared(self):
+        """Test mutating a returned response does not alter later results"""
+        text = _sample_text()
+
+        first = ProfessionalLanguageAnalyzer._analyze_text(text)
+        expected_issues = list(first.compliance_issues)
+        first.compliance_issues.clear()
+        first.recommendations.append("tampered")
+
+        second = ProfessionalLanguageAnalyzer._analyze_text(text)
+
+        assert second is not first
+        assert second.compliance_issues == expected_issues
+        assert "tampered" not in second.recommendations
+
+
+class TestAnalyzeAllLegal:
+    """Test running Tools 16-19 over one extraction"""
+
+    async def test_matches_individual_tools(self, monkeypatch):
+        """Test each combined result equals the tool run on its own, from one extraction"""
+        text = _sample_text() + " The guardian restricted family contact without consultation."
+        page = PageText(page_number=1, text=text, word_count=len(text.split()), char_count=len(text))
+        extracted = []
+
+        async def extract_document(file_path):
+            extracted.append(file_path)
+            return text, [page]
+
+        monkeypatch.setattr(legal_service, "_extract_document", extract_document)
+
+        results = await legal_service.analyze_all_legal("report.pdf")
+        assert extracted == ["report.pdf"]
+
+        assert results == {
+            "human_rights_breaches": await legal_service.extract_human_rights_breaches(
+                HumanRightsBreachRequest(file_path="report.pdf")
+            ),
+            "guardianship_risk": await legal_service.analyze_guardianship_risk(
+                GuardianshipRiskRequest(file_path="report.pdf")
+            ),
+            "state_guardianship_bias": await legal_service.detect_state_guardianship_bias(
+                StateGuardianshipBiasRequest(file_path="report.pdf")
+            ),
+            "professional_compliance": await legal_service.analyze_professional_compliance(
+                ProfessionalComplianceRequest(file_path="report.pdf")
+            ),
+        }
+
+
+class TestHumanRightsPageNumbers:
+    """Test breaches are attributed to the page they occur on"""
+
+    def test_page_separators_are_counted(self):
+        """Test a breach late in the document is not shifted by the page separators"""
+        full_text, pages = _pages(["Intro."] * 20 + ["Staff shared private information.", "Closing notes."])
+
+        response = legal_service.HumanRightsAnalyzer._analyze_text(full_text, pages)
+
+        assert [breach.page_number for breach in response.breaches] == [21]
+
+    def test_breach_at_page_start(self):
+        """Test a breach on the first character of a page belongs to that page"""
+        full_text, pages = _pages(["Intro.", "Shared private information without notice."])
+
+        response = legal_service.HumanRightsAnalyzer._analyze_text(full_text, pages)
+
+        assert [breach.page_number for breach in response.breaches] == [2]
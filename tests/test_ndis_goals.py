@@ -0,0 +1,242 @@
+"""
+Tests for NDIS goals alignment analysis
+"""
+
+import os
+import re
+from types import SimpleNamespace
+
+import pytest
+
+import app.services.ndis_goals_service as ndis_service
+from app.models.legal import GoalsAlignmentRequest
+
+
+PLAN_TEXT = (
+    "The family supports choice and control in daily decisions. "
+    "Family members consult the client about their wishes and preferences. "
+    "The Public Guardian restricted family contact without consultation."
+)
+
+# One or more hits for most indicator patterns of every goal
+INDICATOR_TEXT = (
+    "Plan review, March 2024. The family supports choice in daily matters and the family respects wishes "
+    "expressed by the client. Staff consult client about their preferences each week. "
+    "The client makes own decisions with family support. Family encourages independence at home. "
+    "Workers noted the family respects their wishes. However the family makes all decisions about money, "
+    "and on one occasion the client has no say. The Public Guardian respects choice in principle, "
+    "but the PG makes decisions remotely and the Public Guardian limited contact was noted. "
+    "Bureaucratic delays affected approvals. The PG doesn't know the client. "
+    "The family facilitates community participation and family takes to community events on weekends. "
+    "He maintains cultural ties through family. Family introduces to cultural groups. "
+    "Family supports employment at the local bakery, and family provides transport to work daily. "
+    "The PG limited capacity to support employment was raised. "
+    "Family helps with personal care. Family prepares meals. Family assists with showering. "
+    "Family provides transport. Family helps with medication. The family takes over at times. "
+    "PG doesn't provide practical support. Family monitors health. Family takes to appointments. "
+    "Family manages medication. Family advocates for medical needs. PG rarely visit. "
+    "Delays in medical decisions occurred. Family encourages learning. Family enrolls in courses. "
+    "Family helps with study. Family supports cultural participation. Family brings to church. "
+    "Family maintains cultural identity. He attends cultural events with family. "
+    "PG limited understanding in cultural matters. Lacking cultural sensitivity was noted. "
+    "The PG unfamiliar with religious traditions."
+)
+
+# How the text is prepared: with the re2 bucket set, with anchor prefiltering
+# only, and as non-ASCII text, which keeps every scan on the re module
+PREPARATIONS = {
+    "re2_set": lambda text: ndis_service._prepare_text(
+        text, ndis_service.NDISGoalsAnalyzer.ALL_ANCHORS, ndis_service.NDISGoalsAnalyzer.BUCKET_SET
+    ),
+    "anchors": lambda text: ndis_service._prepare_text(
+        text, ndis_service.NDISGoalsAnalyzer.ALL_ANCHORS, None
+    ),
+    "non_ascii": lambda text: ndis_service._prepare_text(
+        text + " Café visits.", ndis_service.NDISGoalsAnalyzer.ALL_ANCHORS, None
+    ),
+}
+
+
+def _per_pattern_hits(sources, text, limit=ndis_service._EVIDENCE_LIMIT):
+    """Hit count and first spans as the per-pattern re.finditer scan found them"""
+    spans = [match.span() for source in sources for match in re.finditer(source, text, re.IGNORECASE)]
+    return len(spans), spans[:limit]
+
+
+def _indicator_buckets():
+    """(goal, bucket name, pattern sources, fused bucket) for every bucket of every goal"""
+    analyzer = ndis_service.NDISGoalsAnalyzer
+    fused = {
+        "family_positive": analyzer.FAMILY_POSITIVE,
+        "family_negative": analyzer.FAMILY_NEGATIVE,
+        "pg_positive": analyzer.PG_POSITIVE,
+        "pg_negative": analyzer.PG_NEGATIVE,
+    }
+    for name, buckets in fused.items():
+        for (goal_num, goal), bucket in zip(analyzer.NDIS_GOALS.items(), buckets):
+            yield goal_num, name, goal[name], bucket
+
+
+@pytest.fixture
+def plan(tmp_path, monkeypatch):
+    """An NDIS plan whose extraction returns PLAN_TEXT, counting extractions"""
+    extracted = []
+
+    async def extract_text_from_pdf(request):
+        extracted.append(request.file_path)
+        return SimpleNamespace(full_text=PLAN_TEXT, pages=[])
+
+    monkeypatch.setattr(ndis_service, "extract_text_from_pdf", extract_text_from_pdf)
+    path = tmp_path / "plan.pdf"
+    path.write_bytes(b"%PDF-1.4\n")
+    return SimpleNamespace(path=str(path), extracted=extracted)
+
+
+class TestGoalsAlignmentCache:
+    """Test memoization of goals alignment responses"""
+
+    async def test_second_call_hits_cache(self, plan):
+        """Test an unchanged plan is only extracted and analyzed once"""
+        request = GoalsAlignmentRequest(file_path=plan.path)
+
+        first = await ndis_service.analyze_goals_guardianship_alignment(request)
+        second = await ndis_service.analyze_goals_guardianship_alignment(request)
+
+        assert plan.extracted == [plan.path]
+        assert second == first
+
+    async def test_lookalike_plans_are_analyzed_separately(self, plan, tmp_path):
+        """Test a second plan with equal size, header and mtime is not served the first's result"""
+        twin = tmp_path / "twin_plan.pdf"
+        twin.write_bytes(open(plan.path, "rb").read())
+        stat = os.stat(plan.path)
+        os.utime(twin, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        await ndis_service.analyze_goals_guardianship_alignment(GoalsAlignmentRequest(file_path=plan.path))
+        await ndis_service.analyze_goals_guardianship_alignment(GoalsAlignmentRequest(file_path=str(twin)))
+
+        assert plan.extracted == [plan.path, str(twin)]
+
+    async def test_cached_result_is_not_shared(self, plan):
+        """Test mutating a returned response or its goals does not alter later results"""
+        request = GoalsAlignmentRequest(file_path=plan.path)
+
+        first = await ndis_service.analyze_goals_guardianship_alignment(request)
+        expected = first.model_copy(deep=True)
+        first.goals_analysis[0].evidence_for_family.append("tampered")
+        first.goals_analysis.pop()
+        first.recommendation = "tampered"
+
+        second = await ndis_service.analyze_goals_guardianship_alignment(request)
+
+        assert second == expected
+
+
+class TestFusedIndicatorBuckets:
+    """Test fused bucket scans against the per-pattern finditer scans they replaced"""
+
+    @pytest.mark.parametrize("preparation", PREPARATIONS)
+    def test_counts_and_spans_match_per_pattern_scan(self, preparation):
+        """Test every bucket finds the same hits, and the same first spans in pattern order"""
+        document = PREPARATIONS[preparation](INDICATOR_TEXT)
+        analyzer = ndis_service.NDISGoalsAnalyzer
+
+        total = 0
+        for goal_num, name, sources, bucket in _indicator_buckets():
+            expected = _per_pattern_hits(sources, document.text)
+            total += expected[0]
+
+            assert analyzer._count_bucket(bucket, document) == expected[0], (goal_num, name)
+            assert analyzer._scan_bucket(bucket, document, ndis_service._EVIDENCE_LIMIT) == expected, (
+                goal_num, name
+            )
+
+        assert total == 46
+
+    @pytest.mark.parametrize("preparation", ["anchors", "non_ascii"])
+    def test_bucket_without_anchors(self, preparation):
+        """Test a bucket whose patterns have no leading literal is scanned in full"""
+        sources = [r"[a-z]+\s+(?:limited|no)\s+contact", r"(?:makes?|decides?)\s+all"]
+        bucket = ndis_service._compile_bucket(sources)
+        document = PREPARATIONS[preparation](INDICATOR_TEXT)
+
+        assert bucket.anchors is None
+        expected = _per_pattern_hits(sources, document.text)
+        assert expected[0] == 2
+        assert ndis_service.NDISGoalsAnalyzer._count_bucket(bucket, document) == expected[0]
+        assert ndis_service.NDISGoalsAnalyzer._scan_bucket(bucket, document, 5) == expected
+
+    def test_text_without_indicators(self):
+        """Test a document with no hits scores every goal as neutral"""
+        document = PREPARATIONS["re2_set"]("The plan was reviewed on 1 March 2024.")
+
+        results = [
+            ndis_service.NDISGoalsAnalyzer._analyze_single_goal(index, document, None)
+            for index in range(len(ndis_service.NDISGoalsAnalyzer.GOAL_NUMS))
+        ]
+
+        assert {(goal.family_alignment_score, goal.pg_alignment_score) for goal in results} == {(5.0, 5.0)}
+        assert all(not goal.evidence_for_family and not goal.evidence_against_pg for goal in results)
+
+    def test_overlapping_sub_patterns_count_once(self):
+        """Test hits of two sub-patterns overlapping in the text count once, where the per-pattern scan counted both"""
+        sources = [r"family\s+supports", r"supports\s+choice"]
+        bucket = ndis_service._compile_bucket(sources)
+        document = ndis_service._prepare_text("The family supports choice.", bucket.anchors, None)
+
+        assert _per_pattern_hits(sources, document.text)[0] == 2
+        assert ndis_service.NDISGoalsAnalyzer._count_bucket(bucket, document) == 1
+
+
+def _unbounded_evidence(sources, text):
+    """Evidence quotes as the per-pattern scan wrote them, with 100 characters either side"""
+    quotes = []
+    for source in sources:
+        for match in re.finditer(source, text, re.IGNORECASE):
+            context = text[max(0, match.start() - 100):min(len(text), match.end() + 100)].strip()
+            quotes.append(f'"{match.group(0)}" - {context[:80]}...')
+    return quotes[:ndis_service._EVIDENCE_LIMIT]
+
+
+class TestGoalEvidence:
+    """Test evidence quotes, whose context stops at the sentence of the hit"""
+
+    def test_long_sentences_quote_as_before(self):
+        """Test hits deep inside long sentences are quoted exactly as the unbounded scan quoted them"""
+        filler = "while the weekly schedule, meals, outings and appointments were discussed at length "
+        text = (
+            f"During the review {filler * 2}the family supports choice {filler * 2}today. "
+            f"At the second meeting {filler * 2}the PG makes decisions remotely {filler * 2}again."
+        )
+        goals = ndis_service.NDISGoalsAnalyzer.NDIS_GOALS["G1"]
+
+        result = ndis_service.NDISGoalsAnalyzer._analyze_single_goal(
+            0, PREPARATIONS["re2_set"](text), None
+        )
+
+        assert result.evidence_for_family == _unbounded_evidence(goals["family_positive"], text)
+        assert result.evidence_against_pg == _unbounded_evidence(goals["pg_negative"], text)
+        assert len(result.evidence_for_family) == len(result.evidence_against_pg) == 1
+
+    def test_context_stops_at_sentence_boundaries(self):
+        """Test neighbouring sentences are left out of a quote's context"""
+        text = "Goals were set. The family supports choice. The PG makes decisions. Review due."
+
+        result = ndis_service.NDISGoalsAnalyzer._analyze_single_goal(
+            0, PREPARATIONS["re2_set"](text), None
+        )
+
+        assert result.evidence_for_family == ['"family supports choice" - The family supports choice....']
+        assert result.evidence_against_pg == ['"PG makes" - The PG makes decisions....']
+
+    def test_evidence_is_limited_per_side(self):
+        """Test only the first hits are quoted while every hit is counted"""
+        text = " ".join(f"Visit {i}: the family supports choice." for i in range(8))
+
+        result = ndis_service.NDISGoalsAnalyzer._analyze_single_goal(
+            0, PREPARATIONS["re2_set"](text), None
+        )
+
+        assert len(result.evidence_for_family) == ndis_service._EVIDENCE_LIMIT
+        assert result.evidence_for_family[0] == '"family supports choice" - Visit 0: the family supports choice....'
+        assert "8 positive" in result.analysis
@@ -3,8 +3,10 @@ Tests for PDF processing tools
 """
 
 import pytest
+from datetime import datetime
 from pathlib import Path
 
+import app.services.pdf_service as pdf_service
 from app.services.pdf_service import extract_text_from_pdf, generate_hash
 from app.models.pdf import PDFExtractionRequest, DocumentHashRequest
 
@@ -66,6 +68,88 @@ class TestMetadataExtraction:
         pass
 
 
+class TestPageOffsets:
+    """Test each page's char_start offset into the extracted full text"""
+
+    @pytest.fixture
+    def extract(self, tmp_path, monkeypatch):
+        """Extract a PDF whose pages read as the given texts"""
+        async def run(texts):
+            async def read_page_texts(file_path, page_range):
+                return list(range(1, len(texts) + 1)), list(texts)
+
+            monkeypatch.setattr(pdf_service, "_read_page_texts", read_page_texts)
+            path = tmp_path / f"report_{len(texts)}.pdf"
+            path.write_bytes(b"%PDF-1.4\n")
+            return await extract_text_from_pdf(
+                PDFExtractionRequest(file_path=str(path), extract_metadata=False)
+            )
+
+        return run
+
+    async def test_full_text_is_unchanged(self, extract):
+        """Test the full text is joined and stripped as it was before pages carried offsets"""
+        texts = ["", "  Intro page", "Second page.", "", "Last page\n"]
+
+        result = await extract(texts)
+
+        assert result.full_text == "".join(text + "\n\n" for text in texts).strip()
+
+    async def test_each_page_starts_at_its_offset(self, extract):
+        """Test every page's text is found in the full text at its char_start"""
+        texts = ["First page, line one.\nLine two.", "Second page.", "Third page\nends here."]
+
+        result = await extract(texts)
+
+        assert [page.char_start for page in result.pages] == [0, 33, 47]
+        for page in result.pages:
+            assert result.full_text[page.char_start:page.char_start + len(page.text)] == page.text
+
+    async def test_offsets_follow_stripped_leading_whitespace(self, extract):
+        """Test offsets index the stripped full text when leading blank pages or spaces are removed"""
+        texts = ["", "  Intro page", "Second page.", "", "Last page"]
+
+        result = await extract(texts)
+
+        assert [page.char_start for page in result.pages] == [0, 0, 12, 26, 28]
+        assert result.full_text[12:24] == "Second page."
+        assert result.full_text[28:] == "Last page"
+
+
+class TestPDFDateParsing:
+    """Test parsing of PDF date strings (D:YYYYMMDDHHmmSSOHH'mm)"""
+
+    @pytest.mark.parametrize("date_str", [
+        "D:20230102030405",
+        "20230102030405",
+        "D:19991231235959",
+        "D:20240229120000",
+        "D:20230102030405Z",
+        "D:20230102030405+10'00'",
+    ])
+    def test_full_dates_match_strptime(self, date_str):
+        """Test complete dates parse as the strptime-based parser parsed them"""
+        digits = date_str.removeprefix("D:")[:14]
+
+        assert pdf_service._parse_pdf_date(date_str) == datetime.strptime(digits, "%Y%m%d%H%M%S")
+
+    @pytest.mark.parametrize("date_str, expected", [
+        ("D:2023", datetime(2023, 1, 1)),
+        ("D:202306", datetime(2023, 6, 1)),
+        ("D:20230615", datetime(2023, 6, 15)),
+        ("D:202306151230", datetime(2023, 6, 15, 12, 30)),
+        ("D:202306151230+10'00'", datetime(2023, 6, 15, 12, 30)),
+    ])
+    def test_partial_dates(self, date_str, expected):
+        """Test omitted fields default to the start of the period instead of failing or shifting"""
+        assert pdf_service._parse_pdf_date(date_str) == expected
+
+    @pytest.mark.parametrize("date_str", ["", "D:", "D:abcd", "D:20231302", "D:20230230", "not a date"])
+    def test_invalid_dates(self, date_str):
+        """Test unparseable dates give None"""
+        assert pdf_service._parse_pdf_date(date_str) is None
+
+
 # Pytest fixtures
 @pytest.fixture
 def sample_pdf_path():
@@ -0,0 +1,192 @@
+"""
+Tests for report generation
+"""
+
+from pathlib import Path
+
+import pytest
+
+from app.models.analysis import FamilySupportEvidenceRequest
+from app.models.pdf import PDFExtractionRequest
+from app.models.reports import (
+    ContradictionMatrixResponse,
+    ContradictionMatrixRow,
+    GuardianshipArgumentRequest,
+    QCATEvidenceSummaryRequest,
+)
+from app.services import pdf_service, report_generation_service
+from app.services._analysis_cache import cached_call
+
+
+def _write_pdf(path):
+    """A valid one-page PDF; its text is supplied by the page_texts fixture"""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] >>",
+    ]
+    body = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, obj in enumerate(objects, start=1):
+        offsets.append(len(body))
+        body += b"%d 0 obj\n%s\nendobj\n" % (number, obj)
+    xref = len(body)
+    body += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    body += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    body += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    path.write_bytes(bytes(body))
+
+
+@pytest.fixture
+def page_texts(tmp_path, monkeypatch):
+    """Write PDFs whose pages read as the given texts; returns their paths"""
+    texts = {}
+
+    async def read_page_texts(file_path, page_range):
+        pages = texts[Path(file_path).name]
+        return list(range(1, len(pages) + 1)), list(pages)
+
+    monkeypatch.setattr(pdf_service, "_read_page_texts", read_page_texts)
+
+    def write(name, *pages):
+        path = tmp_path / name
+        _write_pdf(path)
+        texts[name] = pages
+        return str(path)
+
+    return write
+
+
+class TestAnalysisCache:
+    """Test the per-document cache shared by the report generators"""
+
+    async def test_unchanged_document_is_analyzed_once(self, tmp_path):
+        """Test a repeated request reuses the first result"""
+        calls = []
+
+        async def analyze(request):
+            calls.append(request)
+            return {"pages": [1, 2]}
+
+        path = tmp_path / "report.pdf"
+        path.write_bytes(b"%PDF-1.4\n")
+        request = PDFExtractionRequest(file_path=str(path))
+
+        first = await cached_call(analyze, request)
+        second = await cached_call(analyze, request)
+
+        assert len(calls) == 1
+        assert second == first
+
+    async def test_other_request_fields_are_part_of_the_key(self, tmp_path):
+        """Test requests differing only in options are analyzed separately"""
+        calls = []
+
+        async def analyze(request):
+            calls.append(request)
+            return request.page_range
+
+        path = tmp_path / "report.pdf"
+        path.write_bytes(b"%PDF-1.4\n")
+
+        await cached_call(analyze, PDFExtractionRequest(file_path=str(path), page_range=(1, 2)))
+        await cached_call(analyze, PDFExtractionRequest(file_path=str(path), page_range=(3, 4)))
+
+        assert len(calls) == 2
+
+    async def test_cached_result_is_not_shared(self, tmp_path):
+        """Test mutating a returned result does not alter later results"""
+        async def analyze(request):
+            return {"pages": [1, 2]}
+
+        path = tmp_path / "report.pdf"
+        path.write_bytes(b"%PDF-1.4\n")
+        request = FamilySupportEvidenceRequest(file_path=str(path))
+
+        first = await cached_call(analyze, request)
+        first["pages"].append(3)
+
+        assert await cached_call(analyze, request) == {"pages": [1, 2]}
+
+    async def test_missing_document_is_not_cached(self):
+        """Test calls on documents that cannot be stat'ed always reach the analysis"""
+        calls = []
+
+        async def analyze(request):
+            calls.append(request)
+            return None
+
+        request = PDFExtractionRequest(file_path="/nonexistent/report.pdf")
+        await cached_call(analyze, request)
+        await cached_call(analyze, request)
+
+        assert len(calls) == 2
+
+
+class TestQCATContradictionSeverity:
+    """Test the contradiction severity breakdown in QCAT evidence summaries"""
+
+    async def test_breakdown_counts_row_severities(self, tmp_path, monkeypatch):
+        """Test each matrix row is counted under its own severity"""
+        severities = ["high", "medium", "medium", "low"]
+
+        async def matrix(request):
+            rows = [
+                ContradictionMatrixRow(
+                    topic=f"Topic {i}",
+                    version_1="Described as calm",
+                    version_2="Described as aggressive",
+                    conflict="Contradictory behavioral characterization",
+                    severity=severity,
+                    explanation="Documents disagree",
+                    source_1=request.documents[0],
+                    source_2=request.documents[1],
+                )
+                for i, severity in enumerate(severities)
+            ]
+            return ContradictionMatrixResponse(
+                documents=request.documents, matrix=rows, total_contradictions=len(rows), summary=""
+            )
+
+        monkeypatch.setattr(report_generation_service, "generate_contradiction_matrix", matrix)
+
+        response = await report_generation_service.generate_qcat_evidence_summary(
+            QCATEvidenceSummaryRequest(
+                case_name="Test",
+                documents=[str(tmp_path / "report_1.pdf"), str(tmp_path / "report_2.pdf")],
+                include_timeline=False,
+            )
+        )
+
+        assert response.contradiction_summary == "Total: 4 (1 high, 2 medium, 1 low severity)"
+        assert any("(1 high severity)" in point for point in response.key_evidence_points)
+
+
+class TestGuardianshipArgumentReport:
+    """Test the guardianship argument report end to end, from extracted text to report"""
+
+    async def test_every_analysis_reaches_the_report(self, page_texts):
+        """Test the bias, human rights, family evidence and goals analyses all contribute"""
+        report_path = page_texts(
+            "report.pdf",
+            "The client is always aggressive and non-compliant. "
+            "Staff shared private information without consent.",
+            "The family provides emotional support and attends appointments weekly. "
+            "Family restricted contact was imposed.",
+        )
+        plan_path = page_texts(
+            "plan.pdf",
+            "Goal 1: more choice and control over daily decisions. "
+            "Goal 2: community participation with family support.",
+        )
+
+        response = await report_generation_service.generate_guardianship_argument_report(
+            GuardianshipArgumentRequest(client_name="Test", documents=[report_path], ndis_plan_path=plan_path)
+        )
+
+        assert response.analysis_count == 4
+        summary = response.report.executive_summary
+        assert "NDIS Goals Alignment Analysis (7 goals)" in summary
+        assert "2 instances of bias, racism, or discriminatory language detected" in summary
+        assert "3 potential breaches of Human Rights Act 2019 (Qld) identified" in summary
+        assert "Document 1: 1 instances\n  - emotional: 1 instances" in response.report.evidence_summary